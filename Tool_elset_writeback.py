@@ -65,7 +65,7 @@ folder_path = str(existing_model_path.parent)
 model_name = existing_model_path.stem
 
 model_adapter = ModelAdapter(encoding='cp1252')
-model = model_adapter.from_text(folder_path, model_name)
+model = model_adapter.from_text(folder_path, model_name, lazy=True)
 
 existing_materials = MaterialsParse.from_model(model)
 existing_sections = SectionsParse.from_model(model)
@@ -0,0 +1,89 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pathlib import Path
+
+from SANSPRO.model.model import ModelAdapter
+from SANSPRO.collection.materials import MaterialsParse
+from SANSPRO.collection.sections import SectionsParse
+from SANSPRO.collection.designs import DesignsParse
+from SANSPRO.collection.elsets import ElsetsParse
+from SANSPRO.collection.slabs import SlabsParse
+
+from SANSPRO.collection.nodes import NodesParse, NodesAdapter
+from SANSPRO.collection.offsets import OffsetsParse, OffsetsAdapter
+from SANSPRO.collection.point_loads import PointLoadsParse, PointLoadsAdapter
+from SANSPRO.collection.diaphragms import DiaphragmsParse, DiaphragmsAdapter
+
+from SANSPRO.layout.beam_layout import BeamLayoutsParse, BeamLayoutsAdapter
+from SANSPRO.layout.column_layout import ColumnLayoutsParse, ColumnLayoutsAdapter
+from SANSPRO.layout.regions import RegionsParse, RegionsAdapter
+from SANSPRO.layout.renumber import NodeRenumberEngine
+
+# Renumber nodes (Reverse Cuthill-McKee) to cut solver bandwidth
+# -> Input full_path
+# -> Run python
+# -> Output:
+#    -> <model>_RCM.MDL with NODEXY, LAYBEAM, LAYCOL, REGION, OFFSET,
+#       JLOAD and MDIAPHTAB rewritten consistently
+
+# ==============================
+# Input base model path
+full_path = Path(
+    r"D:\COMPUTATIONAL\Model\SANSPRO\RUKO\TIPE 1\TIPE 1_v1_5.MDL"
+)
+# ==============================
+
+folder_path = str(full_path.parent)
+model_name = full_path.stem
+output_model_name = f"{model_name}_RCM"
+
+adapter = ModelAdapter(encoding='cp1252')
+model = adapter.from_text(folder_path, model_name, lazy=True)
+
+materials = MaterialsParse.from_model(model)
+sections = SectionsParse.from_model(model)
+designs = DesignsParse.from_model(model, sections)
+elsets = ElsetsParse.from_model(model,
+                                materials=materials,
+                                sections=sections,
+                                designs=designs,
+                                )
+
+nodes = NodesParse.from_model(model)
+slabs = SlabsParse.from_model(model, elsets)
+
+beam_layouts = BeamLayoutsParse.from_model(model, nodes, elsets)
+column_layouts = ColumnLayoutsParse.from_model(model, nodes, elsets)
+regions = RegionsParse.from_model(model, nodes, slabs)
+
+offsets = OffsetsParse.from_model(model, nodes=nodes) if "OFFSET" in model.blocks else None
+point_loads = PointLoadsParse.from_model(model) if "JLOAD" in model.blocks else None
+diaphragms = DiaphragmsParse.from_model(model) if "MDIAPHTAB" in model.blocks else None
+
+nodes, report = NodeRenumberEngine.apply(
+    nodes,
+    beam_layouts=beam_layouts,
+    column_layouts=column_layouts,
+    regions=regions,
+    offsets=offsets,
+    point_loads=point_loads,
+    diaphragms=diaphragms,
+)
+print(report)
+
+if report.applied:
+    model = NodesAdapter.to_model(nodes, model)
+    model = BeamLayoutsAdapter.to_model(beam_layouts, model)
+    model = ColumnLayoutsAdapter.to_model(column_layouts, model)
+    model = RegionsAdapter.to_model(regions, model)
+    if offsets is not None:
+        model = OffsetsAdapter.to_model(offsets, model)
+    if point_loads is not None:
+        model = PointLoadsAdapter.to_model(point_loads, model)
+    # after NodesAdapter, which re-matches MDIAPHTAB by index
+    if diaphragms is not None:
+        model = DiaphragmsAdapter.to_model(diaphragms, model)
+
+    adapter.to_text(model=model, folder_path=folder_path, model_name=output_model_name)
@@ -35,7 +35,7 @@ output_model_name = f"{model_name}_LOADCOMB"
 
 # Create Model
 model_adapter = ModelAdapter(encoding='cp1252')
-model = model_adapter.from_text(folder_path, model_name)
+model = model_adapter.from_text(folder_path, model_name, lazy=True)
 model_adapter.to_text(model= model, folder_path=folder_path, model_name=output_model_name)
 
 # Set Load Combination for load case linear equation
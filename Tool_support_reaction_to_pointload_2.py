@@ -6,8 +6,10 @@ from pathlib import Path
 
 from SANSPRO.model.model import ModelAdapter
 from SANSPRO.output.output import OutputAdapter
+from SANSPRO.output._results_cache import ResultsCache
 
 from SANSPRO.output._support_reactions import SupportReactionsEngine
+from SANSPRO.output._combination import CombinationEngine
 from SANSPRO.variable.loading import LoadingParse, LoadingEngine, LoadingAdapter
 
 from SANSPRO.collection.nodes import NodesParse, NodeQuery, NodesEngine, NodesAdapter
@@ -44,17 +46,20 @@ output_model_name = f"{model_name}_POINTLOAD"
 adapter = ModelAdapter(encoding='cp1252')
 
 # Replicate NodeXY's nodes 
-model = adapter.from_text(folder_path, model_name_loadcomb)
+model = adapter.from_text(folder_path, model_name_loadcomb, lazy=True)
 
 nodes = NodesParse.from_model(model)
 
-# Read output
+# Read output (parsed reactions are cached next to the .OUT until it changes)
 loading = LoadingParse.from_mdl(model)
-output_adapter = OutputAdapter(encoding='cp1252')
-output = output_adapter.from_text(folder_path, model_name_loadcomb)
+output_adapter = OutputAdapter(encoding='cp1252', cache=ResultsCache(encoding='cp1252'))
+# reuse the nodes parsed above instead of reading the model again
+output = output_adapter.from_text(folder_path, model_name_loadcomb, nodes=nodes)
 
 # Convert to Point Loads
-point_loads = SupportReactionsEngine.convert_to_point_loads(loading.combo_factored, output.support_reactions)
+point_loads = SupportReactionsEngine.convert_to_point_loads(
+    CombinationEngine.matrix(loading, "factored"), output.support_reactions
+)
 model = PointLoadsAdapter.to_model(point_loads, model)
 
 # Merge new Point Loads to model
@@ -45,6 +45,18 @@ class Collection(Generic[T]):
         for obj in objs:
             self.add(obj)
 
+    def rebuild(self, objects: Optional[List[T]] = None):
+        """
+        Replace the contents with `objects` (default: the current objects,
+        e.g. after their indices were edited) and rebuild the lookups.
+        """
+        objects = list(self.objects if objects is None else objects)
+        self.objects = []
+        self._index = {}
+        self._reverse_index = {}
+        if objects:
+            self._initialize(objects)
+
     def index_list(self) -> List[int]:
         return sorted(self._index.keys())
 
@@ -59,6 +71,11 @@ class Collection(Generic[T]):
 
     def __iter__(self):
         return iter(self.objects)
+
+    def __setstate__(self, state):
+        # id()-keyed index does not survive pickling
+        self.__dict__.update(state)
+        self._reverse_index = {id(obj): obj.index for obj in self.objects}
     
 
     # ==========================================================
@@ -274,7 +291,8 @@ class ObjectCollectionAdapter(ABC, Generic[M, T, C]):
         # 3) Expand dataclass normally (but only here)
         # ------------------------------------------------------------
         if is_dataclass(obj):
-            obj = obj.__dict__     # <-- NOT asdict() !!!
+            # <-- NOT asdict() !!!  (array-backed views keep fields off __dict__)
+            obj = obj.__dict__ or {f.name: getattr(obj, f.name) for f in fields(obj)}
         elif hasattr(obj, "__dict__") and not isinstance(obj, type):
             obj = obj.__dict__
         elif isinstance(obj, dict):
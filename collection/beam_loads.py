@@ -1,11 +1,14 @@
 import math
 from typing import List, Optional, Type, Set, Tuple, Literal
 
+import numpy as np
+
 from SANSPRO.model.model import Model
 from SANSPRO.object.node import Node
 from SANSPRO.object.beam import Beam
 from SANSPRO.object.beam_load import LoadDirectionType, FrameLoadTable, BeamLoad 
 from SANSPRO.collection.nodes import Nodes, NodeQuery
+from SANSPRO.collection.node_index import NodeIndex
 from SANSPRO.layout.beam_layout import BeamLayout, BeamLayouts, BeamLayoutsQuery
 
 
@@ -18,6 +21,7 @@ from SANSPRO.collection._collection_abstract import (
     )
 
 from SANSPRO.variable.building import BuildingParse, BuildingAdapter
+from SANSPRO.util.geometry import mirror_matrix, point_transformer, grid_offsets
 from variable.parameter import ParameterParse, ParameterAdapter
 
 class FrameLoadTables(Collection[FrameLoadTable]):
@@ -172,29 +176,40 @@ class BeamLoadEngine(ObjectCollectionEngine[BeamLoad, BeamLoads]):
         return tuple(sorted((p1, p2)))
 
     @staticmethod
-    def _load_overlap_key(load: BeamLoad, layouts_original: BeamLayouts, layouts_final: BeamLayouts):
+    def _key_table(layouts: BeamLayouts, floor: int):
+        """Beam index → geom key table of a floor layout (None if the layout is empty)."""
+        layout = layouts.get(floor)
+        return layout.geom_keys_by_index() if layout else None
+
+    @staticmethod
+    def _load_overlap_key(load: BeamLoad, layouts_original: BeamLayouts, layouts_final: BeamLayouts, tables=None):
+        """
+        (floor, geom key, load case) of the load's beam. `tables` memoizes
+        the per-floor key tables across calls.
+        """
+        if tables is None:
+            tables = {}
 
         # First try to resolve beam in final layout
-        layout_final = layouts_final.get(load.floor)
-        beam = None
-        if layout_final:
-            beam = layout_final.get_item(load.beam_id)
-
-        # If not found → fallback to source (mirrored/original)
-        if beam is None:
-            layout_orig = layouts_original.get(load.floor)
-            if layout_orig:
-                beam = layout_orig.get_item(load.beam_id)
-                layout = layout_orig
-            else:
-                return None
+        final = ("final", load.floor)
+        if final not in tables:
+            tables[final] = BeamLoadEngine._key_table(layouts_final, load.floor)
+        keys = tables[final]
+
+        if keys is not None and load.beam_id in keys:
+            geom = keys[load.beam_id]
         else:
-            layout = layout_final
+            # If not found → fallback to source (mirrored/original)
+            original = ("original", load.floor)
+            if original not in tables:
+                tables[original] = BeamLoadEngine._key_table(layouts_original, load.floor)
+            keys = tables[original]
+            if keys is None:
+                return None
+            geom = keys.get(load.beam_id)
 
-        if beam is None or beam.start is None or beam.end is None:
+        if geom is None:
             return None
-
-        geom = BeamLayoutsQuery.beam_geom_key(beam.start, beam.end)
         return (load.floor, geom, load.load_case)
 
     # ================================================================
@@ -222,18 +237,28 @@ class BeamLoadEngine(ObjectCollectionEngine[BeamLoad, BeamLoads]):
                 bl.index = i
             return BeamLoads(combined)
 
-        def group_by_key(loads: list[BeamLoad], layouts: BeamLayouts) -> dict[tuple, list[BeamLoad]]:
+        # "add" keeps everything: no keys needed
+        if policy == "add":
+            result = existing + new
+            for i, bl in enumerate(result, 1):
+                bl.index = i
+            return BeamLoads(result)
+
+        # per-floor (beam index → geom key) tables, shared by both sides
+        tables: dict = {}
+
+        def group_by_key(loads: list[BeamLoad]) -> dict[tuple, list[BeamLoad]]:
             result: dict[tuple, list[BeamLoad]] = {}
             for ld in loads:
-                key = BeamLoadEngine._load_overlap_key(ld, layouts_original, layouts_final)
+                key = BeamLoadEngine._load_overlap_key(ld, layouts_original, layouts_final, tables)
                 if key is None:
                     continue
                 result.setdefault(key, []).append(ld)
             return result
 
         # ✅ Both existing and new are interpreted in the FINAL geometry
-        existing_by_key = group_by_key(existing, layouts_final)
-        new_by_key      = group_by_key(new,      layouts_final)
+        existing_by_key = group_by_key(existing)
+        new_by_key      = group_by_key(new)
 
         result: list[BeamLoad] = []
 
@@ -245,7 +270,7 @@ class BeamLoadEngine(ObjectCollectionEngine[BeamLoad, BeamLoads]):
                     continue
                 result.extend(loads_new)
 
-        elif policy == "replace":
+        else:  # "replace"
             # keep only existing loads with non-overlapping key, then add all new
             for key, loads_ex in existing_by_key.items():
                 if key not in new_by_key:
@@ -253,10 +278,6 @@ class BeamLoadEngine(ObjectCollectionEngine[BeamLoad, BeamLoads]):
             for loads_new in new_by_key.values():
                 result.extend(loads_new)
 
-        else:  # "add"
-            result.extend(existing)
-            result.extend(new)
-
         # reindex
         for i, bl in enumerate(result, 1):
             bl.index = i
@@ -281,51 +302,61 @@ class BeamLoadEngine(ObjectCollectionEngine[BeamLoad, BeamLoads]):
     ) -> BeamLoads:
 
         existing = list(base_loads.objects)
-        new_loads: list[BeamLoad] = []
 
+        # source beam of every load
+        sources: list[tuple[BeamLoad, Beam]] = []
         for load in loads_to_copy.objects:
             orig_beam = layouts_original.get(load.floor).get_item(load.beam_id)
             if orig_beam is None:
                 continue
+            sources.append((load, orig_beam))
+
+        # grid offsets in loop order (ix, iy, iz), original position skipped
+        grid = grid_offsets(nx, ny, nz, dx, dy, dz)
+        K = len(grid)
 
-            n1, n2 = orig_beam.start, orig_beam.end
-
-            for ix in range(nx + 1):
-                for iy in range(ny + 1):
-                    for iz in range(nz + 1):
-
-                        if ix == iy == iz == 0:
-                            continue
-
-                        dx1, dy1, dz1 = ix * dx, iy * dy, iz * dz
-
-                        n1_r = NodeQuery.get_by_offset(nodes, dx1, dy1, dz1, origin=n1)
-                        n2_r = NodeQuery.get_by_offset(nodes, dx1, dy1, dz1, origin=n2)
-                        
-                        if not n1_r or not n2_r:
-                            continue
-
-                        # Find replicated beam geometrically
-                        new_beam, _ = BeamLayoutsQuery.find_beam_by_nodes_in_floor(
-                            layouts_final,
-                            floor=load.floor,
-                            n1=n1_r,
-                            n2=n2_r,
-                        )
-                        if not new_beam:
-                            print(
-                                f"[REPLICATE] No replicated beam found "
-                                f"for load {load.index} floor={load.floor} "
-                                f"orig=({n1.x},{n1.y})-({n2.x},{n2.y}) "
-                                f"offset=({dx1},{dy1}) → "
-                                f"({n1_r.x},{n1_r.y})-({n2_r.x},{n2_r.y})"
-                            )
-                            continue
-
-                        # Create replicated load
-                        new_loads.append(
-                            BeamLoadQuery.clone_with_beam(load, new_beam.index)
-                        )
+        # replicated end points of every load at once: (L, K, 3), load-major
+        ends = np.array(
+            [((b.start.x, b.start.y, b.start.z), (b.end.x, b.end.y, b.end.z)) for _, b in sources],
+            dtype=np.float64).reshape(-1, 2, 3)
+        starts_r = (ends[:, 0, None, :] + grid[None, :, :]).reshape(-1, 3)
+        ends_r = (ends[:, 1, None, :] + grid[None, :, :]).reshape(-1, 3)
+
+        # one node lookup for all of them
+        node_list = nodes.objects
+        node_xyz = nodes.coords()
+        hit1 = NodeIndex.match_first(starts_r, node_xyz, NodeQuery.TOL)
+        hit2 = NodeIndex.match_first(ends_r, node_xyz, NodeQuery.TOL)
+
+        new_loads: list[BeamLoad] = []
+        for r in np.flatnonzero((hit1 >= 0) & (hit2 >= 0)).tolist():
+            load, orig_beam = sources[r // K]
+            n1_r, n2_r = node_list[hit1[r]], node_list[hit2[r]]
+
+            # Find replicated beam geometrically (per-floor geometry index)
+            new_beam, _ = BeamLayoutsQuery.find_beam_by_nodes_in_floor(
+                layouts_final,
+                floor=load.floor,
+                n1=n1_r,
+                n2=n2_r,
+            )
+            if not new_beam:
+                n1, n2 = orig_beam.start, orig_beam.end
+                ix, iy, _ = np.unravel_index(r % K + 1, (nx + 1, ny + 1, nz + 1))
+                dx1, dy1 = int(ix) * dx, int(iy) * dy
+                print(
+                    f"[REPLICATE] No replicated beam found "
+                    f"for load {load.index} floor={load.floor} "
+                    f"orig=({n1.x},{n1.y})-({n2.x},{n2.y}) "
+                    f"offset=({dx1},{dy1}) → "
+                    f"({n1_r.x},{n1_r.y})-({n2_r.x},{n2_r.y})"
+                )
+                continue
+
+            # Create replicated load
+            new_loads.append(
+                BeamLoadQuery.clone_with_beam(load, new_beam.index)
+            )
 
         # Apply geometry-based conflict policy
         return BeamLoadEngine._apply_policy_geo(
@@ -356,30 +387,10 @@ class BeamLoadEngine(ObjectCollectionEngine[BeamLoad, BeamLoads]):
         existing = list(base_loads.objects)
 
         # Node lookup table
-        def nk(n: Node):
-            return (round(n.x, 6), round(n.y, 6), round(n.z, 6))
-
-        node_lookup = {nk(n): n for n in nodes.objects}
+        node_lookup = nodes.spatial_index()
 
         # mirror transform
-        dx = x2 - x1
-        dy = y2 - y1
-        L = math.hypot(dx, dy)
-        if L < 1e-12:
-            raise ValueError("Mirror line cannot be a point")
-
-        ux, uy = dx / L, dy / L
-        cos_t, sin_t = ux, uy
-
-        def mirror_point(px, py, pz):
-            px -= x1
-            py -= y1
-            rx =  cos_t * px + sin_t * py
-            ry = -sin_t * px + cos_t * py
-            ry = -ry
-            mx =  cos_t * rx - sin_t * ry + x1
-            my =  sin_t * rx + cos_t * ry + y1
-            return mx, my, pz
+        mirror_point = point_transformer(mirror_matrix(x1, y1, x2, y2))
 
         # Mirror each load
         new_loads = []
@@ -395,19 +406,11 @@ class BeamLoadEngine(ObjectCollectionEngine[BeamLoad, BeamLoads]):
             msx, msy, msz = mirror_point(s.x, s.y, s.z)
             mex, mey, mez = mirror_point(e.x, e.y, e.z)
 
-            key_s = (round(msx, 6), round(msy, 6), round(msz, 6))
-            key_e = (round(mex, 6), round(mey, 6), round(mez, 6))
-
-            ns = node_lookup.get(key_s)
-            ne = node_lookup.get(key_e)
+            ns = node_lookup.find(msx, msy, msz)
+            ne = node_lookup.find(mex, mey, mez)
 
             if not (ns and ne):
-                ns_rev = node_lookup.get(key_e)
-                ne_rev = node_lookup.get(key_s)
-                if ns_rev and ne_rev:
-                    ns, ne = ns_rev, ne_rev
-                else:
-                    continue
+                continue
 
             # lookup mirrored beam geometrically
             new_beam = BeamLayoutsQuery.find_beam_by_xyz(
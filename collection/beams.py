@@ -1,11 +1,15 @@
 import math
 from typing import Type, List, Optional
 
+import numpy as np
+
 from SANSPRO.model.model import Model
 from SANSPRO.object.node import Node
 from SANSPRO.object.beam import Beam
 from SANSPRO.collection.nodes import Nodes
+from SANSPRO.collection.node_index import NodeIndex
 from SANSPRO.collection.elsets import Elsets
+from SANSPRO.util.geometry import mirror_matrix, point_transformer, grid_offsets
 from collection._collection_abstract import (
     Collection, 
     CollectionParser, 
@@ -117,6 +121,18 @@ class BeamsQuery(ObjectCollectionQuery[Beam, Beams]):
             abs(a.z - b.z) < tol
         )
 
+    @staticmethod
+    def geom_key_xyz(s: tuple, e: tuple, ndigits: int = 6):
+        """Orientation-independent key of two end points (rounded)."""
+        p1 = (round(s[0], ndigits), round(s[1], ndigits), round(s[2], ndigits))
+        p2 = (round(e[0], ndigits), round(e[1], ndigits), round(e[2], ndigits))
+        return (p1, p2) if p1 <= p2 else (p2, p1)
+
+    @staticmethod
+    def geom_key(n1: Node, n2: Node, ndigits: int = 6):
+        """Orientation-independent key of a beam's end coordinates (rounded)."""
+        return BeamsQuery.geom_key_xyz((n1.x, n1.y, n1.z), (n2.x, n2.y, n2.z), ndigits)
+
     @classmethod
     def find_by_nodes(cls, beams: Beams, n1: Node, n2: Node) -> Optional[Beam]:
         tol = cls.TOL
@@ -166,85 +182,67 @@ class BeamsEngine(ObjectCollectionEngine[Beam, Beams]):
         tol = 1e-6
         base_beams = beams.objects
 
-        # Node lookup on coords
-        node_lookup: dict[tuple[float, float, float], Node] = {
-            (round(n.x, 6), round(n.y, 6), round(n.z, 6)): n
-            for n in nodes.objects
-        }
+        node_list = nodes.objects
+        node_xyz = nodes.coords()
 
-        # Geometry-based duplicate check list
+        # Duplicate check on canonical node identity: every end is resolved to
+        # its node in `nodes` (first within tol, as NodeIndex.find) and a beam
+        # is keyed by the unordered pair of node rows
         check_beams: list[Beam] = list(existing_beams)
         if include_original:
             check_beams.extend(base_beams)
-
-        def exists_geom(ns: Node, ne: Node) -> bool:
-            for b in check_beams:
-                s, e = b.start, b.end
-                if s is None or e is None:
-                    continue
-
-                # normal
-                if (abs(s.x - ns.x) < tol and abs(s.y - ns.y) < tol and abs(s.z - ns.z) < tol and
-                    abs(e.x - ne.x) < tol and abs(e.y - ne.y) < tol and abs(e.z - ne.z) < tol):
-                    return True
-
-                # reversed
-                if (abs(s.x - ne.x) < tol and abs(s.y - ne.y) < tol and abs(s.z - ne.z) < tol and
-                    abs(e.x - ns.x) < tol and abs(e.y - ns.y) < tol and abs(e.z - ns.z) < tol):
-                    return True
-
-            return False
-
-        new_beams: list[Beam] = []
+        check_beams = [b for b in check_beams if b.start is not None and b.end is not None]
+
+        check_ends = np.array(
+            [((b.start.x, b.start.y, b.start.z), (b.end.x, b.end.y, b.end.z)) for b in check_beams],
+            dtype=np.float64).reshape(-1, 2, 3)
+        check_s = NodeIndex.match_first(check_ends[:, 0], node_xyz, tol)
+        check_e = NodeIndex.match_first(check_ends[:, 1], node_xyz, tol)
+
+        # ends off the node grid can never equal a replicated beam
+        node_pairs = {
+            frozenset((s, e))
+            for s, e in zip(check_s.tolist(), check_e.tolist())
+            if s >= 0 and e >= 0
+        }
 
         # -----------------------------
-        # Replicate each base beam
+        # Replicated end points of every base beam at once
         # -----------------------------
-        for b in base_beams:
-            if b.start is None or b.end is None:
-                continue
-
-            sx, sy, sz = b.start.x, b.start.y, b.start.z
-            ex, ey, ez = b.end.x, b.end.y, b.end.z
-
-            for ix in range(nx + 1):
-                for iy in range(ny + 1):
-                    for iz in range(nz + 1):
-
-                        if ix == iy == iz == 0:
-                            continue
-
-                        offx = ix * dx
-                        offy = iy * dy
-                        offz = iz * dz
-
-                        nsx, nsy, nsz = sx + offx, sy + offy, sz + offz
-                        nex, ney, nez = ex + offx, ey + offy, ez + offz
+        valid = [b for b in base_beams if b.start is not None and b.end is not None]
 
-                        key_s = (round(nsx, 6), round(nsy, 6), round(nsz, 6))
-                        key_e = (round(nex, 6), round(ney, 6), round(nez, 6))
+        grid = grid_offsets(nx, ny, nz, dx, dy, dz)
+        K = len(grid)
 
-                        ns = node_lookup.get(key_s)
-                        ne = node_lookup.get(key_e)
+        ends = np.array(
+            [((b.start.x, b.start.y, b.start.z), (b.end.x, b.end.y, b.end.z)) for b in valid],
+            dtype=np.float64).reshape(-1, 2, 3)
 
-                        if not ns or not ne:
+        # Node lookup on coords (first node within tol, as NodeIndex.find)
+        hit_s = NodeIndex.match_first((ends[:, 0, None, :] + grid[None, :, :]).reshape(-1, 3), node_xyz, tol)
+        hit_e = NodeIndex.match_first((ends[:, 1, None, :] + grid[None, :, :]).reshape(-1, 3), node_xyz, tol)
 
-                            continue
+        new_beams: list[Beam] = []
 
-                        if exists_geom(ns, ne):
-                            continue
+        # beam-major, then (ix, iy, iz): same order as the nested loops
+        for r in np.flatnonzero((hit_s >= 0) & (hit_e >= 0)).tolist():
+            b = valid[r // K]
+            key = frozenset((int(hit_s[r]), int(hit_e[r])))
+            if key in node_pairs:
+                continue
+            ns, ne = node_list[hit_s[r]], node_list[hit_e[r]]
 
-                        new_beam = Beam(
-                            index=0,  # reindexed by LayoutEngine
-                            start=ns,
-                            end=ne,
-                            elset=b.elset,
-                            group=b.group,
-                            beam_type=b.beam_type,
-                            misc=b.misc,
-                        )
-                        new_beams.append(new_beam)
-                        check_beams.append(new_beam)
+            new_beam = Beam(
+                index=0,  # reindexed by LayoutEngine
+                start=ns,
+                end=ne,
+                elset=b.elset,
+                group=b.group,
+                beam_type=b.beam_type,
+                misc=b.misc,
+            )
+            new_beams.append(new_beam)
+            node_pairs.add(key)
 
         return Beams(objects=new_beams)
     
@@ -267,16 +265,6 @@ class BeamsEngine(ObjectCollectionEngine[Beam, Beams]):
         base_beams = beams.objects
         tol = 1e-6
 
-        # --------------------------------------
-        # Build node lookup table by coordinates
-        # --------------------------------------
-        node_lookup = {}
-        for n in nodes.objects:
-            key = (round(n.x, 6), round(n.y, 6), round(n.z, 6))
-            node_lookup[key] = n
-
-        
-
         # Start output list
         result_list = base_beams.copy() if include_original else []
 
@@ -287,61 +275,34 @@ class BeamsEngine(ObjectCollectionEngine[Beam, Beams]):
         # --------------------------------------
         # Prepare mirror math (same as nodes)
         # --------------------------------------
-        dx = x2 - x1
-        dy = y2 - y1
-        L = math.hypot(dx, dy)
-        if L < 1e-12:
-            raise ValueError("Mirror line cannot be a single point.")
+        mirror_point = point_transformer(mirror_matrix(x1, y1, x2, y2))
 
-        ux = dx / L
-        uy = dy / L
-        cos_t = ux
-        sin_t = uy
+        mirrored_s = [mirror_point(b.start.x, b.start.y, b.start.z) for b in base_beams]
+        mirrored_e = [mirror_point(b.end.x, b.end.y, b.end.z) for b in base_beams]
 
-        def mirror_point(px, py, pz):
-            # 1) translate to line origin
-            px -= x1
-            py -= y1
-
-            # 2) rotate so mirror line aligns with x-axis
-            rx =  cos_t * px + sin_t * py
-            ry = -sin_t * px + cos_t * py
-
-            # 3) reflect across x-axis
-            ry = -ry
-
-            # 4) rotate back
-            mx =  cos_t * rx - sin_t * ry
-            my =  sin_t * rx + cos_t * ry
-
-            # 5) translate back
-            mx += x1
-            my += y1
-
-            return mx, my, pz
+        # --------------------------------------
+        # Node lookup by coordinates, all ends at once
+        # --------------------------------------
+        node_list = nodes.objects
+        node_xyz = nodes.coords()
+        hit_s = NodeIndex.match_first(np.array(mirrored_s, dtype=np.float64), node_xyz, tol).tolist()
+        hit_e = NodeIndex.match_first(np.array(mirrored_e, dtype=np.float64), node_xyz, tol).tolist()
 
         # --------------------------------------
         # Mirror beams
         # --------------------------------------
-        for b in base_beams:
-
-            # Mirror start
-            msx, msy, msz = mirror_point(b.start.x, b.start.y, b.start.z)
-            key_s = (round(msx, 6), round(msy, 6), round(msz, 6))
-
-            # Mirror end
-            mex, mey, mez = mirror_point(b.end.x, b.end.y, b.end.z)
-            key_e = (round(mex, 6), round(mey, 6), round(mez, 6))
+        for b, i_s, i_e in zip(base_beams, hit_s, hit_e):
 
             # Node existence check
-            if key_s not in node_lookup or key_e not in node_lookup:
+            if i_s < 0 or i_e < 0:
                 # If target nodes do not exist → cannot mirror this beam
                 continue
+            ns, ne = node_list[i_s], node_list[i_e]
 
             new_beams.append(Beam(
                 index=next_index,
-                start=node_lookup[key_s],
-                end=node_lookup[key_e],
+                start=ns,
+                end=ne,
                 elset=b.elset,
                 group=b.group,
                 beam_type=b.beam_type,
@@ -1,11 +1,15 @@
 import math
 from typing import Type, List
 
+import numpy as np
+
 from SANSPRO.model.model import Model
 from SANSPRO.object.node import Node
 from SANSPRO.object.column import Column
 from SANSPRO.collection.nodes import Nodes
+from SANSPRO.collection.node_index import NodeIndex
 from SANSPRO.collection.elsets import Elsets
+from SANSPRO.util.geometry import mirror_matrix, point_transformer, grid_offsets
 from collection._collection_abstract import (
     Collection, 
     CollectionParser, 
@@ -94,7 +98,6 @@ class ColumnsEngine(ObjectCollectionEngine[Column, Columns]):
     ) -> Columns:
 
         base_cols = columns.objects
-        all_nodes = nodes.objects
 
         # Duplicate checker: existing + optionally base
         check_cols = list(existing_columns)
@@ -102,65 +105,49 @@ class ColumnsEngine(ObjectCollectionEngine[Column, Columns]):
             check_cols.extend(base_cols)
 
         next_index = max((c.index for c in check_cols), default=0) + 1
-        new_cols: list[Column] = []
-
-        # ---- node finder ----
-        def find_node(x, y, z):
-            for n in all_nodes:
-                if (
-                    abs(n.x - x) < tol and
-                    abs(n.y - y) < tol and
-                    abs(n.z - z) < tol
-                ):
-                    return n
-            return None
-
-        # ---- exists check ----
-        def col_exists(nloc):
-            for c in check_cols:
-                lc = c.location
-                if (
-                    abs(lc.x - nloc.x) < tol and
-                    abs(lc.y - nloc.y) < tol and
-                    abs(lc.z - nloc.z) < tol
-                ):
-                    return True
-            return False
 
-        # ---- replicate ----
-        for c in base_cols:
-            x, y, z = c.location.x, c.location.y, c.location.z
-
-            for ix in range(nx+1):
-                for iy in range(ny+1):
-                    for iz in range(nz+1):
-
-                        if ix == iy == iz == 0:
-                            continue
+        # grid offsets in loop order (ix, iy, iz), original position skipped
+        grid = grid_offsets(nx, ny, nz, dx, dy, dz)
 
-                        xx = x + ix*dx
-                        yy = y + iy*dy
-                        zz = z + iz*dz
+        base_xyz = np.array(
+            [(c.location.x, c.location.y, c.location.z) for c in base_cols],
+            dtype=np.float64).reshape(-1, 3)
 
-                        nloc = find_node(xx, yy, zz)
-                        if nloc is None:
-                            continue
+        # every copy at once: (C, 1, 3) + (1, K, 3), column-major
+        candidates = (base_xyz[:, None, :] + grid[None, :, :]).reshape(-1, 3)
 
-                        if col_exists(nloc):
-                            continue
+        # ---- node finder ----
+        node_list = nodes.objects
+        node_xyz = nodes.coords()
+        hit = NodeIndex.match_first(candidates, node_xyz, tol)
+        rows = np.flatnonzero(hit >= 0)
+        loc_xyz = node_xyz[hit[rows]]
 
-                        new_c = Column(
-                            index=next_index,
-                            location=nloc,
-                            elset=c.elset,
-                            group=c.group,
-                            alpha=c.alpha,
-                            misc=c.misc,
-                        )
+        # ---- exists check ----
+        # drop copies on an existing column, then keep the first of any
+        # copies that land on the same location
+        check_xyz = np.array(
+            [(c.location.x, c.location.y, c.location.z) for c in check_cols],
+            dtype=np.float64).reshape(-1, 3)
+        free = NodeIndex.match_first(loc_xyz, check_xyz, tol) < 0
+        rows, loc_xyz = rows[free], loc_xyz[free]
+        first = NodeIndex.match_first(loc_xyz, loc_xyz, tol)
+        rows = rows[first == np.arange(len(rows))]
 
-                        new_cols.append(new_c)
-                        check_cols.append(new_c)
-                        next_index += 1
+        # ---- replicate ----
+        K = max(len(grid), 1)
+        new_cols: list[Column] = []
+        for r, node_row in zip(rows.tolist(), hit[rows].tolist()):
+            c = base_cols[r // K]
+            new_cols.append(Column(
+                index=next_index,
+                location=node_list[node_row],
+                elset=c.elset,
+                group=c.group,
+                alpha=c.alpha,
+                misc=c.misc,
+            ))
+            next_index += 1
 
         return Columns(objects=new_cols)
 
@@ -174,29 +161,9 @@ class ColumnsEngine(ObjectCollectionEngine[Column, Columns]):
         tol = 1e-6
 
         # Node lookup table
-        node_lookup = {
-            (round(n.x,6), round(n.y,6), round(n.z,6)): n
-            for n in nodes.objects
-        }
-
-        def mirror_point(px, py, pz):
-            dx = x2 - x1
-            dy = y2 - y1
-            L = math.hypot(dx, dy)
-            if L < 1e-12:
-                raise ValueError("Mirror line cannot be a point.")
-            ux, uy = dx/L, dy/L
-
-            old_px, old_py = px - x1, py - y1
-
-            rx =  ux*old_px + uy*old_py
-            ry = -uy*old_px + ux*old_py
-            ry = -ry   # reflect
-
-            mx =  ux*rx - uy*ry + x1
-            my =  uy*rx + ux*ry + y1
+        node_lookup = nodes.spatial_index(tol)
 
-            return mx, my, pz
+        mirror_point = point_transformer(mirror_matrix(x1, y1, x2, y2))
 
         base = columns.objects
         out = base.copy() if include_original else []
@@ -206,13 +173,13 @@ class ColumnsEngine(ObjectCollectionEngine[Column, Columns]):
 
         for c in base:
             mx, my, mz = mirror_point(c.location.x, c.location.y, c.location.z)
-            key = (round(mx,6), round(my,6), round(mz,6))
-            if key not in node_lookup:
+            location = node_lookup.find(mx, my, mz)
+            if location is None:
                 continue
 
             new_cols.append(Column(
                 index=next_index,
-                location=node_lookup[key],
+                location=location,
                 elset=c.elset,
                 group=c.group,
                 alpha=c.alpha,
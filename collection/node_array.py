@@ -0,0 +1,152 @@
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from SANSPRO.object.node import Node
+
+class NodeView(Node):
+    """
+    Lightweight Node backed by one row of a NodeArray.
+
+    Reads and writes of index/x/y/z go straight to the arrays, so a view
+    can be handed to any code that expects a Node.
+    """
+
+    def __init__(self, store: "NodeArray", row: int):
+        self._store = store
+        self._row = row
+
+    @property
+    def index(self) -> int:
+        return int(self._store._index[self._row])
+
+    @index.setter
+    def index(self, value: int):
+        self._store._index[self._row] = value
+
+    @property
+    def x(self) -> float:
+        return float(self._store._xyz[self._row, 0])
+
+    @x.setter
+    def x(self, value: float):
+        self._store._xyz[self._row, 0] = value
+
+    @property
+    def y(self) -> float:
+        return float(self._store._xyz[self._row, 1])
+
+    @y.setter
+    def y(self, value: float):
+        self._store._xyz[self._row, 1] = value
+
+    @property
+    def z(self) -> float:
+        return float(self._store._xyz[self._row, 2])
+
+    @z.setter
+    def z(self, value: float):
+        self._store._xyz[self._row, 2] = value
+
+    def __reduce__(self):
+        return (NodeView, (self._store, self._row))
+
+class NodeArray:
+    """
+    Columnar node storage: int64 indices and float64 (N, 3) coordinates.
+
+    Rows are append-only, so views stay valid while the arrays grow.
+    Several Nodes collections may view (subsets of) the same store.
+    """
+
+    def __init__(self, capacity: int = 0):
+        capacity = max(int(capacity), 16)
+        self._index = np.zeros(capacity, dtype=np.int64)
+        self._xyz = np.zeros((capacity, 3), dtype=np.float64)
+        self._size = 0
+
+    @classmethod
+    def from_arrays(cls, indices: Sequence[int], xyz: np.ndarray) -> "NodeArray":
+        xyz = np.asarray(xyz, dtype=np.float64).reshape(-1, 3)
+        store = cls(capacity=len(xyz))
+        store.append(indices, xyz)
+        return store
+
+    @classmethod
+    def from_nodes(cls, nodes: Iterable[Node]) -> "NodeArray":
+        nodes = list(nodes)
+        return cls.from_arrays(
+            [n.index for n in nodes],
+            [(n.x, n.y, n.z) for n in nodes],
+        )
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def index(self) -> np.ndarray:
+        return self._index[:self._size]
+
+    @property
+    def xyz(self) -> np.ndarray:
+        return self._xyz[:self._size]
+
+    def _reserve(self, extra: int):
+        need = self._size + extra
+        if need <= len(self._index):
+            return
+        capacity = max(need, 2 * len(self._index))
+        index = np.zeros(capacity, dtype=np.int64)
+        xyz = np.zeros((capacity, 3), dtype=np.float64)
+        index[:self._size] = self._index[:self._size]
+        xyz[:self._size] = self._xyz[:self._size]
+        self._index, self._xyz = index, xyz
+
+    def append(self, indices: Sequence[int], xyz: np.ndarray) -> np.ndarray:
+        """Append rows and return their row numbers."""
+        indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        xyz = np.asarray(xyz, dtype=np.float64).reshape(-1, 3)
+        if len(indices) != len(xyz):
+            raise ValueError("indices and xyz must have the same length")
+
+        self._reserve(len(indices))
+        start = self._size
+        self._index[start:start + len(indices)] = indices
+        self._xyz[start:start + len(indices)] = xyz
+        self._size += len(indices)
+        return np.arange(start, self._size)
+
+    def view(self, row: int) -> NodeView:
+        return NodeView(self, int(row))
+
+    def views(self, rows: Optional[Iterable[int]] = None) -> List[NodeView]:
+        if rows is None:
+            rows = range(self._size)
+        return [NodeView(self, int(r)) for r in rows]
+
+    # --------------------------------------------------------
+    # Vectorized geometry
+    # --------------------------------------------------------
+    @staticmethod
+    def bounds_of(xyz: np.ndarray):
+        if len(xyz) == 0:
+            return (None, None, None, None)
+        lo = xyz.min(axis=0)
+        hi = xyz.max(axis=0)
+        return (float(lo[0]), float(hi[0]), float(lo[1]), float(hi[1]))
+
+    @staticmethod
+    def transform_coords(xyz: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        """Apply a 3x3 linear or 4x4 affine matrix to (N, 3) points."""
+        matrix = np.asarray(matrix, dtype=np.float64)
+        if matrix.shape == (3, 3):
+            return xyz @ matrix.T
+        if matrix.shape == (4, 4):
+            return xyz @ matrix[:3, :3].T + matrix[:3, 3]
+        raise ValueError(f"Expected a 3x3 or 4x4 matrix, got {matrix.shape}")
+
+    @staticmethod
+    def match_rows(xyz: np.ndarray, point, tol: float = 1e-6) -> np.ndarray:
+        """Rows of `xyz` within `tol` of `point` on every axis, in order."""
+        hit = np.all(np.abs(xyz - np.asarray(point, dtype=np.float64)) < tol, axis=1)
+        return np.flatnonzero(hit)
@@ -0,0 +1,145 @@
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from SANSPRO.object.node import Node
+
+Cell = Tuple[int, int, int]
+
+class NodeIndex:
+    """
+    Tolerance-aware spatial hash over node coordinates.
+
+    Coordinates are quantized to integer cells of size `tol`. Two points
+    closer than `tol` on every axis are at most one cell apart, so a lookup
+    probes the 27 cells around the query and keeps the exact
+    `abs(a - b) < tol` test. Results match a linear scan over the nodes in
+    insertion order (the first node added wins).
+
+    The index is a snapshot of coordinates: add nodes as they are created,
+    rebuild after moving existing ones.
+    """
+
+    _PROBE = [(i, j, k) for i in (-1, 0, 1) for j in (-1, 0, 1) for k in (-1, 0, 1)]
+
+    def __init__(self, nodes: Iterable[Node] = (), tol: float = 1e-6, xyz: Optional[np.ndarray] = None):
+        if tol <= 0:
+            raise ValueError("tol must be positive")
+
+        self.tol = tol
+        self._cells: Dict[Cell, List[Tuple[int, Node]]] = {}
+        self._count = 0
+        self.extend(nodes, xyz)
+
+    def _cell(self, x: float, y: float, z: float) -> Cell:
+        tol = self.tol
+        return (math.floor(x / tol), math.floor(y / tol), math.floor(z / tol))
+
+    # --------------------------------------------------------
+    # Building
+    # --------------------------------------------------------
+    def add(self, node: Node) -> None:
+        self._insert(self._cell(node.x, node.y, node.z), node)
+
+    def extend(self, nodes: Iterable[Node], xyz: Optional[np.ndarray] = None) -> None:
+        """Add nodes; `xyz` (N, 3) quantizes all coordinates in one pass."""
+        if xyz is None:
+            for n in nodes:
+                self.add(n)
+            return
+
+        cells = np.floor(np.asarray(xyz, dtype=np.float64) / self.tol).astype(np.int64)
+        for n, cell in zip(nodes, cells.tolist()):
+            self._insert(tuple(cell), n)
+
+    def _insert(self, cell: Cell, node: Node) -> None:
+        self._cells.setdefault(cell, []).append((self._count, node))
+        self._count += 1
+
+    # --------------------------------------------------------
+    # Lookup
+    # --------------------------------------------------------
+    def find(self, x: float, y: float, z: float) -> Optional[Node]:
+        tol = self.tol
+        cx, cy, cz = self._cell(x, y, z)
+
+        best = None
+        for i, j, k in self._PROBE:
+            for seq, n in self._cells.get((cx + i, cy + j, cz + k), ()):
+                if best is not None and seq > best[0]:
+                    continue
+                if abs(n.x - x) < tol and abs(n.y - y) < tol and abs(n.z - z) < tol:
+                    best = (seq, n)
+
+        return best[1] if best is not None else None
+
+    def find_node(self, node: Node) -> Optional[Node]:
+        return self.find(node.x, node.y, node.z)
+
+    def contains(self, x: float, y: float, z: float) -> bool:
+        return self.find(x, y, z) is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    # --------------------------------------------------------
+    # Bulk lookup
+    # --------------------------------------------------------
+    @staticmethod
+    def match_first(points: np.ndarray, targets: np.ndarray, tol: float = 1e-6) -> np.ndarray:
+        """
+        Vectorized `find`: for each row of `points` (N, 3), the lowest row of
+        `targets` (M, 3) within `tol` on every axis, or -1.
+
+        Cells are ranked per axis into one sortable int64 key, then the 27
+        neighbour cells of every point are resolved with searchsorted.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        targets = np.asarray(targets, dtype=np.float64).reshape(-1, 3)
+        result = np.full(len(points), -1, dtype=np.int64)
+        if len(points) == 0 or len(targets) == 0:
+            return result
+
+        qp = np.floor(points / tol).astype(np.int64)
+        qt = np.floor(targets / tol).astype(np.int64)
+
+        # dense per-axis ranks of every cell coordinate that can be probed;
+        # q and q + 1 are both present, so a neighbour cell is rank + shift
+        axes = [np.unique(np.concatenate((qt[:, a], qp[:, a] - 1, qp[:, a], qp[:, a] + 1)))
+                for a in range(3)]
+        s1, s2 = len(axes[1]), len(axes[2])
+
+        def key(q: np.ndarray) -> np.ndarray:
+            r = [np.searchsorted(axes[a], q[:, a]) for a in range(3)]
+            return (r[0] * s1 + r[1]) * s2 + r[2]
+
+        tkey = key(qt)
+        torder = np.argsort(tkey, kind="stable")
+        tkey = tkey[torder]
+
+        # probe with sorted keys: every shifted probe stays sorted
+        pkey = key(qp)
+        porder = np.argsort(pkey, kind="stable")
+        pkey = pkey[porder]
+
+        best = np.full(len(points), len(targets), dtype=np.int64)
+        for i, j, k in NodeIndex._PROBE:
+            probe = pkey + ((i * s1 + j) * s2 + k)
+            lo = np.searchsorted(tkey, probe, side="left")
+            hi = np.searchsorted(tkey, probe, side="right")
+            counts = hi - lo
+            if not counts.any():
+                continue
+
+            # expand (point, candidate target) pairs for every occupied cell
+            pi = np.repeat(porder, counts)
+            start = np.repeat(lo - np.cumsum(counts) + counts, counts)
+            ti = torder[start + np.arange(len(pi))]
+
+            close = np.all(np.abs(points[pi] - targets[ti]) < tol, axis=1)
+            np.minimum.at(best, pi[close], ti[close])
+
+        hit = best < len(targets)
+        result[hit] = best[hit]
+        return result
@@ -1,8 +1,12 @@
 import math
 from typing import List, Optional, Type, Tuple
 
+import numpy as np
+
 from SANSPRO.model.model import Model
 from SANSPRO.object.node import Node
+from SANSPRO.collection.node_array import NodeArray, NodeView
+from SANSPRO.collection.node_index import NodeIndex
 from SANSPRO.collection._collection_abstract import (
     Collection, 
     CollectionParser, 
@@ -14,11 +18,117 @@ from SANSPRO.collection._collection_abstract import (
 from SANSPRO.variable.building import BuildingParse, BuildingAdapter
 from SANSPRO.variable.parameter import ParameterParse, ParameterAdapter
 from SANSPRO.variable.screen import ScreenParse, ScreenAdapter
-from SANSPRO.collection.diaphragms import DiaphragmsParse, DiaphragmsEngine, DiaphragmsAdapter
+from SANSPRO.collection.diaphragms import Diaphragms, DiaphragmsParse, DiaphragmsEngine, DiaphragmsAdapter
+from SANSPRO.util.geometry import mirror_matrix, transform_points, grid_offsets
 
 class Nodes(Collection[Node]):
     header = 'NODEXY'
     item_type = Node
+
+    def __init__(self, objects: Optional[List[Node]] = None):
+        self._columns_key = None
+        self._columns = None
+        super().__init__(objects)
+
+    def _initialize(self, objects: List[Node]):
+        # bulk version of add(): indices come straight from the arrays when columnar
+        self.objects.extend(objects)
+        indices = self.indices().tolist()
+        self._index.update(zip(indices, self.objects))
+        self._reverse_index.update(zip(map(id, self.objects), indices))
+
+    def add(self, obj: Node):
+        self.invalidate_columns()
+        super().add(obj)
+
+    def remove(self, obj: Node):
+        self.invalidate_columns()
+        super().remove(obj)
+
+    def extend(self, objs: List[Node]):
+        self.invalidate_columns()
+        super().extend(objs)
+
+    def rebuild(self, objects: Optional[List[Node]] = None):
+        self.invalidate_columns()
+        super().rebuild(objects)
+
+    @classmethod
+    def from_array(cls, store: NodeArray, rows=None) -> "Nodes":
+        """Collection of NodeViews over `store` (all rows by default)."""
+        return cls(store.views(rows))
+
+    def to_columnar(self) -> "Nodes":
+        """
+        Copy into a fresh NodeArray-backed collection.
+        The returned nodes are new objects; existing references keep the old ones.
+        """
+        return Nodes.from_array(NodeArray.from_nodes(self.objects))
+
+    # --------------------------------------------------------
+    # Columnar access
+    # --------------------------------------------------------
+    def invalidate_columns(self) -> None:
+        """
+        Drop the cached columns() result. add/remove/extend call this; call it
+        after editing `objects` directly (e.g. `objects[i] = node`), which the
+        cache cannot detect when the list keeps its identity and length.
+        """
+        self._columns_key = None
+        self._columns = None
+
+    def columns(self) -> Optional[Tuple[NodeArray, np.ndarray]]:
+        """(store, rows) if every node is a view of one NodeArray, else None."""
+        key = (id(self.objects), len(self.objects))
+        if key != self._columns_key:
+            self._columns_key = key
+            self._columns = None
+
+            store = None
+            rows = []
+            for n in self.objects:
+                if not isinstance(n, NodeView) or (store is not None and n._store is not store):
+                    break
+                store = n._store
+                rows.append(n._row)
+            else:
+                if store is not None:
+                    self._columns = (store, np.asarray(rows, dtype=np.int64))
+
+        return self._columns
+
+    @property
+    def is_columnar(self) -> bool:
+        return self.columns() is not None
+
+    def coords(self) -> np.ndarray:
+        cols = self.columns()
+        if cols is not None:
+            store, rows = cols
+            return store.xyz[rows]
+        return np.array([(n.x, n.y, n.z) for n in self.objects], dtype=np.float64).reshape(-1, 3)
+
+    def indices(self) -> np.ndarray:
+        cols = self.columns()
+        if cols is not None:
+            store, rows = cols
+            return store.index[rows]
+        return np.array([n.index for n in self.objects], dtype=np.int64)
+
+    def spatial_index(self, tol: float = 1e-6) -> NodeIndex:
+        """Coordinate lookup over the current nodes (see NodeIndex)."""
+        return NodeIndex(self.objects, tol=tol, xyz=self.coords())
+
+    def new_nodes(self, indices, xyz) -> List[Node]:
+        """Create nodes in the same storage as this collection."""
+        cols = self.columns()
+        if cols is not None:
+            store, _ = cols
+            return store.views(store.append(indices, xyz))
+        return [
+            Node(index=int(i), x=float(x), y=float(y), z=float(z))
+            for i, (x, y, z) in zip(indices, np.asarray(xyz, dtype=np.float64).reshape(-1, 3))
+        ]
         
 class NodesParse(CollectionParser[Model, Node, Nodes]):
     LINES_PER_ITEM = 1
@@ -27,6 +137,18 @@ class NodesParse(CollectionParser[Model, Node, Nodes]):
     def get_collection(cls) -> Type[Nodes]:
         return Nodes
 
+    @classmethod
+    def from_model(cls, model: Model, columnar: bool = False) -> Nodes:
+        """columnar=True parses NODEXY straight into a NodeArray-backed collection."""
+        if not columnar:
+            return super().from_model(model)
+
+        block = model.blocks.get(Nodes.header)
+        table = [line.split()[:4] for line in block.body]
+        data = np.array(table, dtype=np.float64).reshape(-1, 4)
+        store = NodeArray.from_arrays(data[:, 0].astype(np.int64), data[:, 1:4])
+        return Nodes.from_array(store)
+
     @classmethod
     def parse_line(cls, lines: List[str]) -> Node:
         tokens = [line.strip().split() for line in lines]
@@ -86,6 +208,9 @@ class NodeQuery(ObjectCollectionQuery[Node, Nodes]):
         if not collection.objects:
             return (None, None, None, None)
 
+        if collection.is_columnar:
+            return NodeArray.bounds_of(collection.coords())
+
         xs = [n.x for n in collection.objects]
         ys = [n.y for n in collection.objects]
 
@@ -99,23 +224,23 @@ class NodeQuery(ObjectCollectionQuery[Node, Nodes]):
 
     @staticmethod
     def get_by_offset(collection: Nodes, dx: float, dy: float, dz: float, 
-                      origin: Optional[Node] = None) -> Optional[Node]:
-
+                      origin: Optional[Node] = None,
+                      index: Optional[NodeIndex] = None) -> Optional[Node]:
+        """
+        Node at `origin` + (dx, dy, dz); origin defaults to the min (x, y, z) node.
+        Pass a prebuilt `index` (collection.spatial_index()) for repeated lookups.
+        """
         if origin is None:
-            origin = min(collection.objects, key=lambda n: (n.x, n.y, n.z))
+            if collection.is_columnar:
+                xyz = collection.coords()
+                origin = collection.objects[np.lexsort((xyz[:, 2], xyz[:, 1], xyz[:, 0]))[0]]
+            else:
+                origin = min(collection.objects, key=lambda n: (n.x, n.y, n.z))
 
-        target_x = origin.x + dx
-        target_y = origin.y + dy
-        target_z = origin.z + dz
+        if index is None:
+            index = collection.spatial_index(NodeQuery.TOL)
 
-        tol = 1e-6
-        for node in collection.objects:
-            if (abs(node.x - target_x) < tol and
-                abs(node.y - target_y) < tol and
-                abs(node.z - target_z) < tol):
-                return node
-            
-        return None
+        return index.find(origin.x + dx, origin.y + dy, origin.z + dz)
     
     @staticmethod
     def _is_point_on_segment(px: float, py: float,
@@ -146,19 +271,80 @@ class NodeQuery(ObjectCollectionQuery[Node, Nodes]):
         return inside
 
     @staticmethod
-    def select_by_polygon(collection: Nodes, boundary_indices: List[int]) -> Nodes:
+    def _points_in_polygon(xy: np.ndarray, polygon: np.ndarray, tolerance: float = 1e-8) -> np.ndarray:
+        """
+        Vectorized _is_point_inside_polygon over (N, 2) points: same ray cast
+        and on-edge rule, one NumPy pass per polygon edge. Points outside the
+        polygon's bounding box are rejected up front.
+        """
+        xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        polygon = np.asarray(polygon, dtype=np.float64).reshape(-1, 2)
+        result = np.zeros(len(xy), dtype=bool)
+        if len(polygon) < 3 or len(xy) == 0:
+            return result
+
+        # bounding-box prefilter (edge points within a small margin survive)
+        lo = polygon.min(axis=0) - 1e-6
+        hi = polygon.max(axis=0) + 1e-6
+        cand = np.flatnonzero(np.all((xy >= lo) & (xy <= hi), axis=1))
+        if len(cand) == 0:
+            return result
+
+        x = xy[cand, 0]
+        y = xy[cand, 1]
+        inside = np.zeros(len(cand), dtype=bool)
+        on_edge = np.zeros(len(cand), dtype=bool)
+
+        n = len(polygon)
+        j = n - 1
+        for i in range(n):
+            xi, yi = polygon[i]
+            xj, yj = polygon[j]
+
+            cross = (y - yi) * (xj - xi) - (x - xi) * (yj - yi)
+            dot = (x - xi) * (x - xj) + (y - yi) * (y - yj)
+            on_edge |= (np.abs(cross) <= tolerance) & (dot <= 0)
+
+            crossing = ((yi > y) != (yj > y)) & (x < (xj - xi) * (y - yi) / (yj - yi + 1e-12) + xi)
+            inside ^= crossing
+            j = i
+
+        result[cand] = inside | on_edge
+        return result
+
+    @staticmethod
+    def _polygon_coords(collection: Nodes, boundary_indices: List[int]) -> np.ndarray:
         polygon_nodes = NodeQuery.get_by_indices(collection, boundary_indices)
-        polygon_coords = [(node.x, node.y) for node in polygon_nodes.objects]
+        return np.array([(node.x, node.y) for node in polygon_nodes.objects], dtype=np.float64).reshape(-1, 2)
+
+    @staticmethod
+    def select_by_polygon(collection: Nodes, boundary_indices: List[int]) -> Nodes:
+        polygon_coords = NodeQuery._polygon_coords(collection, boundary_indices)
 
         if len(polygon_coords) < 3:
             return Nodes([])
 
-        inside_nodes = [
-            node for node in collection.objects
-            if NodeQuery._is_point_inside_polygon(node.x, node.y, polygon_coords)
-        ]
+        mask = NodeQuery._points_in_polygon(collection.coords()[:, :2], polygon_coords)
+        return Nodes([collection.objects[i] for i in np.flatnonzero(mask)])
 
-        return Nodes(inside_nodes)
+    @staticmethod
+    def polygon_masks(collection: Nodes, polygons: List[List[int]]) -> np.ndarray:
+        """
+        Classify every node against many polygons (boundary node indices each)
+        in one call. Returns a (len(polygons), len(nodes)) boolean array; row p
+        is the select_by_polygon membership for polygons[p].
+        """
+        xy = collection.coords()[:, :2]
+        masks = np.zeros((len(polygons), len(xy)), dtype=bool)
+        for p, boundary_indices in enumerate(polygons):
+            masks[p] = NodeQuery._points_in_polygon(xy, NodeQuery._polygon_coords(collection, boundary_indices))
+        return masks
+
+    @staticmethod
+    def select_by_polygons(collection: Nodes, polygons: List[List[int]]) -> List[np.ndarray]:
+        """Node indices (Node.index) inside each polygon, one array per polygon."""
+        indices = collection.indices()
+        return [indices[mask] for mask in NodeQuery.polygon_masks(collection, polygons)]
 
 class NodesEngine(ObjectCollectionEngine[Node, Nodes]):
 
@@ -168,6 +354,15 @@ class NodesEngine(ObjectCollectionEngine[Node, Nodes]):
                   nx: int = 0, ny: int = 0, nz: int = 0,
                   dx: float = 0.0, dy: float = 0.0, dz: float = 0.0,
                   return_map: bool = False):
+        """
+        Copy `collection_to_copy` over the (ix*dx, iy*dy, iz*dz) grid and
+        append the copies to `base_collection`, skipping copies that land on
+        an existing node. Copies that land on each other are created once.
+
+        node_map: {source index: [source, copy at each offset not on an
+        existing node]}, in offset loop order; where copies of several
+        source nodes coincide, they all list the same node.
+        """
 
         tol = 1e-6
 
@@ -183,44 +378,37 @@ class NodesEngine(ObjectCollectionEngine[Node, Nodes]):
         }
 
         next_index = max((n.index for n in base_list), default=0) + 1
-        new_nodes: list[Node] = []
-
-        def exists(x, y, z):
-            return any(
-                abs(n.x - x) < tol and
-                abs(n.y - y) < tol and
-                abs(n.z - z) < tol
-                for n in result_list
-            )
-
-        for n in copy_list:
-
-            for ix in range(nx + 1):
-                for iy in range(ny + 1):
-                    for iz in range(nz + 1):
-
-                        # skip original position
-                        if ix == 0 and iy == 0 and iz == 0:
-                            continue
-
-                        new_x = n.x + ix * dx
-                        new_y = n.y + iy * dy
-                        new_z = n.z + iz * dz
-
-                        # avoid duplicates
-                        if exists(new_x, new_y, new_z):
-                            continue
-
-                        new_node = Node(
-                            index=next_index,
-                            x=new_x,
-                            y=new_y,
-                            z=new_z
-                        )
 
-                        new_nodes.append(new_node)
-                        node_map[n.index].append(new_node)
-                        next_index += 1
+        # grid offsets in loop order (ix, iy, iz), original position skipped
+        grid = grid_offsets(nx, ny, nz, dx, dy, dz)
+
+        # every copy at once: (N, 1, 3) + (1, K, 3), node-major
+        candidates = (collection_to_copy.coords()[:, None, :] + grid[None, :, :]).reshape(-1, 3)
+
+        # avoid duplicates: drop copies on an existing node (not mapped, as
+        # before); copies that coincide with each other become one node
+        free = np.flatnonzero(NodeIndex.match_first(candidates, base_collection.coords(), tol) < 0)
+        first = NodeIndex.match_first(candidates[free], candidates[free], tol)
+        # follow chains (a -> b -> c, each within tol of the next) to the kept node
+        while True:
+            resolved = first[first]
+            if np.array_equal(resolved, first):
+                break
+            first = resolved
+        kept = first == np.arange(len(first))
+        rows = free[kept]
+
+        # new nodes live in the same storage as the base (NodeArray or plain)
+        new_nodes = base_collection.new_nodes(
+            np.arange(next_index, next_index + len(rows)), candidates[rows])
+
+        # every source node maps each of its free offsets to the kept copy
+        # there, so lists line up with the offsets even where copies overlap;
+        # free is sorted, so each node's copies are contiguous
+        node_of = (np.cumsum(kept) - 1)[first]
+        bounds = np.searchsorted(free // max(len(grid), 1), np.arange(len(copy_list) + 1))
+        for i, n in enumerate(copy_list):
+            node_map[n.index].extend(new_nodes[j] for j in node_of[bounds[i]:bounds[i + 1]].tolist())
 
         # merge new nodes into result_list
         result_list.extend(new_nodes)
@@ -251,48 +439,23 @@ class NodesEngine(ObjectCollectionEngine[Node, Nodes]):
         # next_index does NOT matter anymore (will renumber later)
         next_index = len(result_nodes) + 1
 
-        # mirror line
-        dx = x2 - x1
-        dy = y2 - y1
-        L = math.hypot(dx, dy)
-        if L < 1e-12:
-            raise ValueError("Mirror line cannot be a single point.")
-
-        ux = dx / L
-        uy = dy / L
-        cos_t = ux
-        sin_t = uy
+        lookup = NodeIndex(result_nodes, tol=tol)
 
         def exists(x: float, y: float, z: float) -> bool:
-            return any(
-                abs(n.x - x) < tol
-                and abs(n.y - y) < tol
-                and abs(n.z - z) < tol
-                for n in result_nodes
-            )
-
-        # mirror each base node
-        for n in base_nodes:
-
-            px = n.x - x1
-            py = n.y - y1
+            return lookup.contains(x, y, z)
 
-            # rotate to axis
-            rx = cos_t * px + sin_t * py
-            ry = -sin_t * px + cos_t * py
+        # reflection across the line, as one affine map over all nodes
+        mirrored = transform_points(mirror_matrix(x1, y1, x2, y2), nodes.coords())
 
-            # reflect
-            ry = -ry
-
-            # rotate back
-            mx = cos_t * rx - sin_t * ry + x1
-            my = sin_t * rx + cos_t * ry + y1
-            mz = n.z
+        # mirror each base node
+        for mx, my, mz in mirrored.tolist():
 
             if exists(mx, my, mz):
                 continue
 
-            new_nodes.append(Node(index=next_index, x=mx, y=my, z=mz))
+            created = nodes.new_nodes([next_index], [(mx, my, mz)])
+            lookup.extend(created)
+            new_nodes.extend(created)
             next_index += 1
 
         # append new nodes
@@ -305,3 +468,118 @@ class NodesEngine(ObjectCollectionEngine[Node, Nodes]):
             node.index = i
 
         return Nodes(objects=result_nodes)
+
+    @staticmethod
+    def weld(nodes: Nodes,
+             tol: float = 1e-6,
+             *,
+             beam_layouts=None,
+             column_layouts=None,
+             regions=None,
+             offsets=None,
+             point_loads=None,
+             diaphragms: Optional[Diaphragms] = None,
+             return_map: bool = False):
+        """
+        Merge coincident nodes (closer than `tol` on every axis).
+
+        Each cluster keeps its first node in collection order; the others are
+        removed and every reference is rewired to the survivor in one pass:
+        Beam.start/end, Column.location, Region.edges and Offset.node (by
+        object, or by coordinates for nodes that are not in `nodes`),
+        PointLoad.node_id and diaphragm entries. Survivors are renumbered
+        1..N. Items are only rewired, not de-duplicated.
+
+        A point load or diaphragm entry on an index that is not in `nodes`
+        raises ValueError before anything is changed.
+
+        return_map=True also returns {old node index: survivor} for the
+        removed nodes.
+        """
+        src = nodes.objects
+
+        # first node within tol of each node; following the pointers until
+        # they settle joins chains (a~b, b~c) into one cluster
+        first = NodeIndex.match_first(nodes.coords(), nodes.coords(), tol)
+        while True:
+            nxt = first[first]
+            if np.array_equal(nxt, first):
+                break
+            first = nxt
+
+        survivors = [src[i] for i in np.flatnonzero(first == np.arange(len(src))).tolist()]
+
+        owner = [src[f] for f in first.tolist()]
+        by_id = {id(n): s for n, s in zip(src, owner)}
+        by_index = {n.index: s for n, s in zip(src, owner)}
+        merged = {n.index: s for n, s in zip(src, owner) if s is not n}
+
+        if point_loads is not None:
+            unknown = sorted({pl.node_id for pl in point_loads.objects if pl.node_id not in by_index})
+            if unknown:
+                raise ValueError(f"Point loads reference unknown node(s) {unknown}")
+        if diaphragms is not None:
+            unknown = sorted({d.index for d in diaphragms.objects if d.index not in by_index})
+            if unknown:
+                raise ValueError(f"Diaphragm entries reference unknown node(s) {unknown}")
+
+        lookup: Optional[NodeIndex] = None
+
+        def rewire(n: Optional[Node]) -> Optional[Node]:
+            nonlocal lookup
+            if n is None:
+                return None
+            s = by_id.get(id(n))
+            if s is not None:
+                return s
+            # a node that is not in `nodes` (e.g. a copy) only matches by position
+            if lookup is None:
+                lookup = NodeIndex(src, tol=tol, xyz=nodes.coords())
+            hit = lookup.find_node(n)
+            return by_id[id(hit)] if hit is not None else n
+
+        if beam_layouts is not None:
+            for beam in beam_layouts.walk_items():
+                beam.start, beam.end = rewire(beam.start), rewire(beam.end)
+            # end coordinates may have moved within tol
+            for layout in beam_layouts.layouts:
+                layout.rebuild_index()
+        if column_layouts is not None:
+            for col in column_layouts.walk_items():
+                col.location = rewire(col.location)
+        if regions is not None:
+            for r in regions.objects:
+                r.edges = tuple(rewire(n) for n in r.edges)
+        if offsets is not None:
+            for o in offsets.objects:
+                o.node = rewire(o.node)
+
+        # index-based references are resolved against the old indices first
+        load_targets = []
+        if point_loads is not None:
+            load_targets = [(pl, by_index[pl.node_id]) for pl in point_loads.objects]
+
+        diaph_targets = {}
+        if diaphragms is not None:
+            for d in diaphragms.objects:
+                s = by_index[d.index]
+                # the survivor's own entry wins over those of merged nodes
+                if id(s) not in diaph_targets or d.index == s.index:
+                    diaph_targets[id(s)] = (d, s)
+
+        for i, node in enumerate(survivors, start=1):
+            node.index = i
+
+        for pl, s in load_targets:
+            pl.node_id = s.index
+
+        if diaphragms is not None:
+            for d, s in diaph_targets.values():
+                d.index = s.index
+            diaphragms.rebuild(sorted((d for d, _ in diaph_targets.values()), key=lambda d: d.index))
+
+        result = Nodes(objects=survivors)
+
+        if return_map:
+            return result, merged
+        return result
@@ -1,11 +1,18 @@
 # _layout_abstract.py
 
+import copy
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import shared_memory
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Type, List, Optional, Dict, Callable, Tuple
+from typing import Generic, TypeVar, Type, List, Optional, Dict, Callable, Tuple, NamedTuple
+
+import numpy as np
 
 from SANSPRO.model.model import Model, BlockAdapter
+from SANSPRO.object.node import Node
 from SANSPRO.collection.nodes import Nodes
+from SANSPRO.collection.node_array import NodeArray
 from object._object_abstract import Object
 
 # ------------------------------------------------------------
@@ -27,10 +34,22 @@ class LayoutBase(Generic[I]):
     items: List[I] = field(default_factory=list)
 
     _by_index: Dict[int, I] = field(default_factory=dict, init=False, repr=False)
+    _by_geom: Optional[Dict[object, I]] = field(default=None, init=False, repr=False, compare=False)
+    _geom_by_index: Optional[Dict[int, object]] = field(default=None, init=False, repr=False, compare=False)
+
+    # lazily built lookups, dropped with the item list
+    _LAZY_INDEXES = ("_by_geom", "_geom_by_index")
 
     def __post_init__(self):
         self.rebuild_index()
 
+    def __setattr__(self, name, value):
+        # a new item list invalidates the geometry index
+        if name == "items":
+            for attr in self._LAZY_INDEXES:
+                object.__setattr__(self, attr, None)
+        object.__setattr__(self, name, value)
+
     def __len__(self):
         return len(self.items)
 
@@ -46,6 +65,8 @@ class LayoutBase(Generic[I]):
             idx = getattr(item, "index", None)
             if idx is not None:
                 self._by_index[idx] = item
+        for attr in self._LAZY_INDEXES:
+            setattr(self, attr, None)
 
     def add_item(self, item: I):
         idx = getattr(item, "index", None)
@@ -53,9 +74,44 @@ class LayoutBase(Generic[I]):
             self._by_index[idx] = item
         self.items.append(item)
 
+        if self._by_geom is not None or self._geom_by_index is not None:
+            key = self.geom_key(item)
+            if self._by_geom is not None and key is not None:
+                self._by_geom.setdefault(key, item)
+            if self._geom_by_index is not None and idx is not None:
+                self._geom_by_index[idx] = key
+
     def get_item(self, item_index: int):
         return self._by_index.get(item_index)
 
+    # --------------------------------------------------------
+    # Geometry index (lazy)
+    # --------------------------------------------------------
+    @classmethod
+    def geom_key(cls, item: I):
+        return None
+
+    def find_by_geom(self, key) -> Optional[I]:
+        """
+        First item (in item order) with geometry key `key`.
+        Built on first use; add_item keeps it current, assigning `items`
+        or rebuild_index() drops it. Rebuild after moving item nodes.
+        """
+        if self._by_geom is None:
+            by_geom: Dict[object, I] = {}
+            for item in self.items:
+                k = self.geom_key(item)
+                if k is not None:
+                    by_geom.setdefault(k, item)
+            self._by_geom = by_geom
+        return self._by_geom.get(key)
+
+    def geom_keys_by_index(self) -> Dict[int, object]:
+        """item index → geometry key (None for items without one); lazy like find_by_geom."""
+        if self._geom_by_index is None:
+            self._geom_by_index = {idx: self.geom_key(item) for idx, item in self._by_index.items()}
+        return self._geom_by_index
+
 # ------------------------------------------------------------
 # BASE LAYOUT COLLECTION
 # ------------------------------------------------------------
@@ -169,6 +225,96 @@ class LayoutParser(ABC, Generic[M, L, C, I]):
 
         return collection_cls(layouts)
   
+# ------------------------------------------------------------
+# PROCESS-POOL TRANSFORMS
+# ------------------------------------------------------------
+# Items cross the process boundary as shallow copies whose Node attributes
+# are _NodeRef (row in the node table, or -k-1 for the k-th node outside it)
+# and whose elset is an int id; the parent rebinds both to its own objects.
+# The node table (table rows, then the outside nodes) is written once per
+# apply() into shared memory; tasks carry only its name and shape.
+
+class _NodeRef(NamedTuple):
+    ref: int
+
+def _share_array(array: np.ndarray) -> Tuple[shared_memory.SharedMemory, tuple]:
+    """Copy `array` into a new shared memory block; (block, spec for _read_shared)."""
+    array = np.ascontiguousarray(array)
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, array.dtype, buffer=shm.buf)[...] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+def _read_shared(spec: tuple, read: Callable[[np.ndarray], object]):
+    """Attach to a _share_array block and return read(view); the view must not escape."""
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = np.ndarray(shape, dtype, buffer=shm.buf)
+        try:
+            return read(view)
+        finally:
+            del view
+    finally:
+        shm.close()
+
+def _is_node(value) -> bool:
+    return value is not None and all(hasattr(value, a) for a in ("index", "x", "y", "z"))
+
+def _encode_item(item, node_ref: Callable[[Node], int], elset_ref: Optional[Callable] = None):
+    stub = copy.copy(item)
+    for name, value in vars(item).items():
+        if name == "elset" and elset_ref is not None and value is not None:
+            setattr(stub, name, elset_ref(value))
+        elif _is_node(value):
+            setattr(stub, name, _NodeRef(node_ref(value)))
+    return stub
+
+def _transform_in_process(engine: Type["LayoutEngine"], task: dict):
+    """
+    Worker side of LayoutEngine.apply: rebuild the node table from the
+    shared arrays, run the engine's transform on the stub items and return
+    the result as
+    ("source", pos) / ("target", pos) references or new stub items, plus
+    the node refs of every source item after the transform (normalization
+    rebinds them in place).
+    """
+    n_table = task["n_table"]
+    indices = _read_shared(task["indices"], np.array)
+    store, foreign_xyz = _read_shared(
+        task["xyz"], lambda xyz: (NodeArray.from_arrays(indices[:n_table], xyz[:n_table]), xyz[n_table:].tolist()))
+
+    nodes = Nodes.from_array(store)
+    node_list = nodes.objects
+    foreign = [Node(index=i, x=x, y=y, z=z) for i, (x, y, z) in zip(indices[n_table:].tolist(), foreign_xyz)]
+
+    items, target_items = task["items"], task["target_items"]
+    for item in items + target_items:
+        for name, value in vars(item).items():
+            if isinstance(value, _NodeRef):
+                setattr(item, name, node_list[value.ref] if value.ref >= 0 else foreign[-value.ref - 1])
+
+    target_layout = task["layout_type"](index=task["layout_index"], items=list(target_items))
+    result = engine._dispatch_transform(
+        items=items,
+        target_layout=target_layout,
+        include_original=task["include_original"],
+        mode=task["mode"],
+        nodes=nodes,
+        op_kwargs=task["op_kwargs"],
+    )
+
+    row_of = {id(n): i for i, n in enumerate(node_list)}
+    row_of.update((id(n), -k - 1) for k, n in enumerate(foreign))
+    origin = {id(it): ("source", k) for k, it in enumerate(items)}
+    origin.update((id(it), ("target", k)) for k, it in enumerate(target_items))
+
+    encoded = [origin.get(id(it)) or _encode_item(it, lambda n: row_of[id(n)]) for it in result]
+    source_nodes = [
+        {name: row_of[id(v)] for name, v in vars(it).items() if _is_node(v)}
+        for it in items
+    ]
+    return encoded, source_nodes
+
 class LayoutEngine(ABC, Generic[I, L, C]):
     @classmethod
     def _dispatch_transform(
@@ -192,8 +338,21 @@ class LayoutEngine(ABC, Generic[I, L, C]):
         include_original: bool = True,
         mode: str,
         nodes: Nodes,
+        executor: Optional[Executor] = None,
         **op_kwargs,
     ) -> C:
+        """
+        Transform every layout of `layouts_to_modify` into the matching
+        layout of `base_layouts` and reindex items per layout.
+
+        executor: optional pool (concurrent.futures) to transform the layouts
+        concurrently. Layouts are independent and only read `nodes`; results
+        are merged in layout order, so the output is the same as the
+        sequential run. A ProcessPoolExecutor reads the node table from
+        shared memory written once per call, and gets items with node rows
+        and elset ids; the parent rebinds the results to its own Node/Elset
+        objects.
+        """
         # 1) Build initial layouts from BASE
         new_layouts: list[L] = []
         for layout in base_layouts.layouts:
@@ -203,23 +362,33 @@ class LayoutEngine(ABC, Generic[I, L, C]):
         by_index: dict[int, L] = {lay.index: lay for lay in new_layouts}
 
         # 2) For each layout we want to modify, compute transformed items
-        for src_layout in layouts_to_modify.layouts:
-            target = by_index[src_layout.index]
-
+        def transform(src_layout: L) -> list[I]:
             # For replicate/mirror: source geometry is layouts_to_modify
-            src_items = src_layout.items
-
-            transformed_items = cls._dispatch_transform(
-                items=src_items,
-                target_layout=target,
+            return cls._dispatch_transform(
+                items=src_layout.items,
+                target_layout=by_index[src_layout.index],
                 include_original=include_original,
                 mode=mode,
                 nodes=nodes,
                 op_kwargs=op_kwargs,
             )
 
-            # Replace items in the TARGET layout
-            target.items = list(transformed_items)
+        sources = layouts_to_modify.layouts
+        if executor is None or len(sources) < 2:
+            results = [transform(src_layout) for src_layout in sources]
+        elif isinstance(executor, ProcessPoolExecutor):
+            results = cls._apply_in_processes(
+                executor, sources, by_index,
+                include_original=include_original, mode=mode, nodes=nodes, op_kwargs=op_kwargs,
+            )
+        else:
+            # fill the node table caches once before the threads share it
+            nodes.coords()
+            results = list(executor.map(transform, sources))
+
+        # Replace items in the TARGET layout (layout order)
+        for src_layout, transformed_items in zip(sources, results):
+            by_index[src_layout.index].items = list(transformed_items)
 
         # 3) Re-index beams within each floor
         for layout in new_layouts:
@@ -230,6 +399,95 @@ class LayoutEngine(ABC, Generic[I, L, C]):
         # 4) Return new collection
         return type(base_layouts)(layouts=new_layouts)
 
+    @classmethod
+    def _apply_in_processes(
+        cls,
+        executor: ProcessPoolExecutor,
+        sources: List[L],
+        by_index: Dict[int, L],
+        *,
+        include_original: bool,
+        mode: str,
+        nodes: Nodes,
+        op_kwargs: dict,
+    ) -> List[List[I]]:
+        node_list = nodes.objects
+        row_of = {id(n): i for i, n in enumerate(node_list)}
+        foreign: List[Node] = []
+        elsets: list = []
+        elset_id: Dict[int, int] = {}
+
+        def node_ref(n: Node) -> int:
+            ref = row_of.get(id(n))
+            if ref is None:
+                foreign.append(n)
+                ref = row_of[id(n)] = -len(foreign)
+            return ref
+
+        def elset_ref(e) -> int:
+            if id(e) not in elset_id:
+                elset_id[id(e)] = len(elsets)
+                elsets.append(e)
+            return elset_id[id(e)]
+
+        def node_of(ref: int) -> Node:
+            return node_list[ref] if ref >= 0 else foreign[-ref - 1]
+
+        tasks = []
+        for src_layout in sources:
+            target = by_index[src_layout.index]
+            tasks.append({
+                "items": [_encode_item(it, node_ref, elset_ref) for it in src_layout.items],
+                "target_items": [_encode_item(it, node_ref, elset_ref) for it in target.items],
+                "layout_type": type(target),
+                "layout_index": target.index,
+                "include_original": include_original,
+                "mode": mode,
+                "op_kwargs": op_kwargs,
+            })
+
+        # one copy of the node table for every task: table rows, then foreign
+        indices = np.concatenate([nodes.indices(), np.array([n.index for n in foreign], dtype=np.int64)])
+        xyz = np.concatenate([nodes.coords(), np.array([(n.x, n.y, n.z) for n in foreign]).reshape(-1, 3)])
+        blocks = []
+        try:
+            for name, array in (("indices", indices), ("xyz", xyz)):
+                shm, spec = _share_array(array)
+                blocks.append(shm)
+                for task in tasks:
+                    task[name] = spec
+            for task in tasks:
+                task["n_table"] = len(node_list)
+
+            outputs = list(executor.map(_transform_in_process, [cls] * len(tasks), tasks))
+        finally:
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+
+        results = []
+        for src_layout, (encoded, source_nodes) in zip(sources, outputs):
+            target_items = by_index[src_layout.index].items
+            for item, refs in zip(src_layout.items, source_nodes):
+                for name, ref in refs.items():
+                    setattr(item, name, node_of(ref))
+
+            items = []
+            for entry in encoded:
+                if isinstance(entry, tuple):
+                    kind, pos = entry
+                    items.append(src_layout.items[pos] if kind == "source" else target_items[pos])
+                    continue
+                for name, value in vars(entry).items():
+                    if isinstance(value, _NodeRef):
+                        setattr(entry, name, node_of(value.ref))
+                    elif name == "elset" and isinstance(value, int):
+                        setattr(entry, name, elsets[value])
+                items.append(entry)
+            results.append(items)
+
+        return results
+
     
 class LayoutsQuery(Generic[I, L, C]):
     """
@@ -285,6 +543,18 @@ class LayoutsQuery(Generic[I, L, C]):
             abs(a.z - b.z) < tol
         )
 
+    @classmethod
+    def _two_node_candidates(cls, lay: L, n1) -> List[I]:
+        """
+        Items that can match a two-node search starting at n1: those with an
+        end near n1 when the layout keeps an end point index (BeamLayout
+        .beams_near) covering TOL, else every item. Keeps scan order.
+        """
+        near = getattr(lay, "beams_near", None)
+        if near is not None and cls.TOL <= lay.CELL:
+            return near(n1.x, n1.y, n1.z)
+        return lay.items
+
     @classmethod
     def _match_two_node_item(cls, item: I, n1, n2) -> bool:
         """Works for Beams (start/end)."""
@@ -335,9 +605,10 @@ class LayoutsQuery(Generic[I, L, C]):
         """
         if len(nodes) == 2:
             n1, n2 = nodes
-            for item, lay in cls.iter_items(layouts):
-                if cls._match_two_node_item(item, n1, n2):
-                    return item, lay
+            for lay in layouts.layouts:
+                for item in cls._two_node_candidates(lay, n1):
+                    if cls._match_two_node_item(item, n1, n2):
+                        return item, lay
             return None, None
 
         if len(nodes) == 4:
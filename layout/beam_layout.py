@@ -1,14 +1,17 @@
 # beam_layout.py
 
-from dataclasses import dataclass
-from typing import List, Optional, Tuple, Any
+import math
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Any
 
 from SANSPRO.model.model import Model
 from SANSPRO.variable.building import BuildingParse, BuildingAdapter
 from SANSPRO.object.beam import Beam
 from SANSPRO.object.node import Node
 from SANSPRO.collection.nodes import Nodes
-from SANSPRO.collection.beams import Beams, BeamsParse, BeamsEngine, BeamsAdapter
+from SANSPRO.collection.node_index import Cell, NodeIndex
+from SANSPRO.collection.beams import Beams, BeamsParse, BeamsQuery, BeamsEngine, BeamsAdapter
 
 from SANSPRO.layout._layout_abstract import (
     LayoutBase, 
@@ -22,7 +25,54 @@ from SANSPRO.layout._layout_abstract import (
 @dataclass
 class BeamLayout(LayoutBase[Beam]):
     """A single FLOOR BEAM LAYOUT block."""
-    pass
+
+    # end point cell → (item position, beam); lazy like the geometry index
+    _by_cell: Optional[Dict[Cell, List[Tuple[int, Beam]]]] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    _LAZY_INDEXES = LayoutBase._LAZY_INDEXES + ("_by_cell",)
+
+    CELL = 1e-6
+
+    @classmethod
+    def geom_key(cls, item: Beam):
+        if item.start is None or item.end is None:
+            return None
+        return BeamsQuery.geom_key(item.start, item.end)
+
+    @classmethod
+    def _cell(cls, x: float, y: float, z: float) -> Cell:
+        return (math.floor(x / cls.CELL), math.floor(y / cls.CELL), math.floor(z / cls.CELL))
+
+    def _index_cells(self, pos: int, item: Beam):
+        if item.start is None or item.end is None:
+            return
+        for n in (item.start, item.end):
+            self._by_cell.setdefault(self._cell(n.x, n.y, n.z), []).append((pos, item))
+
+    def add_item(self, item: Beam):
+        super().add_item(item)
+        if self._by_cell is not None:
+            self._index_cells(len(self.items) - 1, item)
+
+    def beams_near(self, x: float, y: float, z: float) -> List[Beam]:
+        """
+        Beams with an end within CELL of (x, y, z) on every axis, in item
+        order (candidates only: callers apply their own tolerance test).
+        Such an end is at most one cell away, so the 27 surrounding cells
+        are probed as in NodeIndex.
+        """
+        if self._by_cell is None:
+            self._by_cell = {}
+            for pos, item in enumerate(self.items):
+                self._index_cells(pos, item)
+
+        cx, cy, cz = self._cell(x, y, z)
+        found: Dict[int, Beam] = {}
+        for i, j, k in NodeIndex._PROBE:
+            for pos, item in self._by_cell.get((cx + i, cy + j, cz + k), ()):
+                found[pos] = item
+        return [found[pos] for pos in sorted(found)]
 
 class BeamLayouts(LayoutsBase[BeamLayout]):
     header = "LAYBEAM"
@@ -67,6 +117,7 @@ class BeamLayoutsEngine(LayoutEngine[Beam, BeamLayout, BeamLayouts]):
         nx: int = 0, ny: int = 0, nz: int = 0,
         dx: float = 0.0, dy: float = 0.0, dz: float = 0.0,
         include_original: bool = True,
+        executor: Optional[Executor] = None,
     ) -> BeamLayouts:
         return BeamLayoutsEngine.apply(
             base_layouts=base_layouts,
@@ -74,6 +125,7 @@ class BeamLayoutsEngine(LayoutEngine[Beam, BeamLayout, BeamLayouts]):
             include_original=include_original,
             mode="replicate",
             nodes=nodes,
+            executor=executor,
             nx=nx, ny=ny, nz=nz,
             dx=dx, dy=dy, dz=dz,
         )
@@ -93,6 +145,7 @@ class BeamLayoutsEngine(LayoutEngine[Beam, BeamLayout, BeamLayouts]):
         x2: float,
         y2: float,
         include_original: bool = True,
+        executor: Optional[Executor] = None,
     ) -> BeamLayouts:
         return cls.apply(
             base_layouts=base_layouts,
@@ -100,6 +153,7 @@ class BeamLayoutsEngine(LayoutEngine[Beam, BeamLayout, BeamLayouts]):
             include_original=include_original,
             mode="mirror",
             nodes=nodes,
+            executor=executor,
             x1=x1, y1=y1,
             x2=x2, y2=y2,
         )
@@ -120,10 +174,7 @@ class BeamLayoutsEngine(LayoutEngine[Beam, BeamLayout, BeamLayouts]):
         Logs warnings but keeps going if some nodes are missing.
         """
 
-        lookup: dict[tuple[float, float, float], Node] = {}
-        for n in nodes.objects:
-            key = (round(n.x, 6), round(n.y, 6), round(n.z, 6))
-            lookup[key] = n
+        lookup = nodes.spatial_index(tol)
 
         for b in beams:
             s = b.start
@@ -132,21 +183,21 @@ class BeamLayoutsEngine(LayoutEngine[Beam, BeamLayout, BeamLayouts]):
 
             # start
             if s is not None:
-                key_s = (round(s.x, 6), round(s.y, 6), round(s.z, 6))
-                ns = lookup.get(key_s)
+                ns = lookup.find_node(s)
                 if ns is not None:
                     b.start = ns
                 else:
+                    key_s = (round(s.x, 6), round(s.y, 6), round(s.z, 6))
                     print(f"[normalize][WARN] Beam#{b.index}: missing START node at {key_s}")
                     missing = True
 
             # end
             if e is not None:
-                key_e = (round(e.x, 6), round(e.y, 6), round(e.z, 6))
-                ne = lookup.get(key_e)
+                ne = lookup.find_node(e)
                 if ne is not None:
                     b.end = ne
                 else:
+                    key_e = (round(e.x, 6), round(e.y, 6), round(e.z, 6))
                     print(f"[normalize][WARN] Beam#{b.index}: missing END node at {key_e}")
                     missing = True
 
@@ -277,8 +328,9 @@ class BeamLayoutsQuery(LayoutsQuery[Beam, BeamLayout, BeamLayouts]):
 
     TOL = 1e-6
 
-    @staticmethod
+    @classmethod
     def find_beam_by_xyz(
+        cls,
         layouts: BeamLayouts,
         floor: int,
         sx: float, sy: float, sz: float,
@@ -286,10 +338,19 @@ class BeamLayoutsQuery(LayoutsQuery[Beam, BeamLayout, BeamLayouts]):
         tol: float = 1e-6,
     ) -> Beam | None:
 
+        layout = layouts.get(floor)
+
+        # default tolerance: only beams with an end near the start point can
+        # match; the exact test below keeps the result of a full scan
+        if tol == cls.TOL and tol <= layout.CELL:
+            candidates = layout.beams_near(sx, sy, sz)
+        else:
+            candidates = layout.items
+
         def close(a, b): 
             return abs(a - b) <= tol
 
-        for b in layouts.get(floor).items:
+        for b in candidates:
             s, e = b.start, b.end
 
             # direct match
@@ -317,9 +378,7 @@ class BeamLayoutsQuery(LayoutsQuery[Beam, BeamLayout, BeamLayouts]):
 
     @classmethod
     def beam_geom_key(cls, n1: Node, n2: Node):
-        p1 = (round(n1.x,6), round(n1.y,6), round(n1.z,6))
-        p2 = (round(n2.x,6), round(n2.y,6), round(n2.z,6))
-        return tuple(sorted((p1, p2)))
+        return BeamsQuery.geom_key(n1, n2)
 
     @classmethod
     def find_beam_by_nodes_in_floor(
@@ -338,18 +397,7 @@ class BeamLayoutsQuery(LayoutsQuery[Beam, BeamLayout, BeamLayouts]):
         if not layout:
             return None, None
 
-        target_key = cls.beam_geom_key(n1, n2)
-
-        for beam in layout.items:
-            if beam.start is None or beam.end is None:
-                continue
-
-            beam_key = cls.beam_geom_key(beam.start, beam.end)
-
-            if beam_key == target_key:
-                return beam, layout
-
-        return None, layout
+        return layout.find_by_geom(cls.beam_geom_key(n1, n2)), layout
 
 
     @staticmethod
@@ -407,14 +455,8 @@ class BeamLayoutsQuery(LayoutsQuery[Beam, BeamLayout, BeamLayouts]):
     @classmethod
     def find_by_nodes(cls, layouts: BeamLayouts,
                        n1: Node, n2: Node) -> Tuple[Optional[Beam], Optional[BeamLayout]]:
-        tol = cls.TOL
-
-        for b, lay in cls.iter_items(layouts):
-            if ((cls._match_nodes(b.start, n1, tol) and cls._match_nodes(b.end, n2, tol)) or
-                (cls._match_nodes(b.start, n2, tol) and cls._match_nodes(b.end, n1, tol))):
-                return b, lay
-
-        return None, None
+        # ends within TOL, either direction; candidates from the end point cells
+        return cls.find_item_by_nodes(layouts, n1, n2)
 
     # ------------------------------------------------------------
     # Filter items by floor
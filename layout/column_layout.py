@@ -1,7 +1,8 @@
 # column_layout.py
 
+from concurrent.futures import Executor
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 from SANSPRO.model.model import Model
 from SANSPRO.variable.building import BuildingParse, BuildingAdapter
@@ -65,11 +66,8 @@ class ColumnLayoutsEngine(LayoutEngine[Column, ColumnLayout, ColumnLayouts]):
         Logs warnings but never interrupts the pipeline.
         """
 
-        # Pre-index all nodes by rounded coordinates
-        lookup = {
-            (round(n.x, 6), round(n.y, 6), round(n.z, 6)): n
-            for n in nodes.objects
-        }
+        # Pre-index all nodes by coordinates
+        lookup = nodes.spatial_index(tol)
 
         for col in columns:
             loc = col.location
@@ -78,12 +76,12 @@ class ColumnLayoutsEngine(LayoutEngine[Column, ColumnLayout, ColumnLayouts]):
                 print(f"[COL NORMALIZE][WARN] #{col.index}: location=None")
                 continue
 
-            key = (round(loc.x, 6), round(loc.y, 6), round(loc.z, 6))
-            match = lookup.get(key)
+            match = lookup.find_node(loc)
 
             if match:
                 col.location = match
             else:
+                key = (round(loc.x, 6), round(loc.y, 6), round(loc.z, 6))
                 print(f"[COL NORMALIZE][WARN] #{col.index}: no node at {key}")
 
 
@@ -99,7 +97,8 @@ class ColumnLayoutsEngine(LayoutEngine[Column, ColumnLayout, ColumnLayouts]):
         nodes: Nodes,
         nx: int = 0, ny: int = 0, nz: int = 0,
         dx: float = 0.0, dy: float = 0.0, dz: float = 0.0,
-        include_original: bool = True
+        include_original: bool = True,
+        executor: Optional[Executor] = None,
     ) -> ColumnLayouts:
 
         return ColumnLayoutsEngine.apply(
@@ -108,6 +107,7 @@ class ColumnLayoutsEngine(LayoutEngine[Column, ColumnLayout, ColumnLayouts]):
             include_original=include_original,
             mode="replicate",
             nodes=nodes,
+            executor=executor,
             nx=nx, ny=ny, nz=nz,
             dx=dx, dy=dy, dz=dz,
         )
@@ -123,7 +123,8 @@ class ColumnLayoutsEngine(LayoutEngine[Column, ColumnLayout, ColumnLayouts]):
         nodes: Nodes,
         x1: float, y1: float,
         x2: float, y2: float,
-        include_original: bool = True
+        include_original: bool = True,
+        executor: Optional[Executor] = None,
     ) -> ColumnLayouts:
 
         return ColumnLayoutsEngine.apply(
@@ -132,6 +133,7 @@ class ColumnLayoutsEngine(LayoutEngine[Column, ColumnLayout, ColumnLayouts]):
             include_original=include_original,
             mode="mirror",
             nodes=nodes,
+            executor=executor,
             x1=x1, y1=y1,
             x2=x2, y2=y2,
         )
@@ -0,0 +1,377 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Literal, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from SANSPRO.object.node import Node
+from SANSPRO.object.beam import Beam
+from SANSPRO.object.beam_load import BeamLoad
+from SANSPRO.object.slab import Region
+from SANSPRO.collection.nodes import Nodes
+from SANSPRO.collection.node_index import NodeIndex
+from SANSPRO.collection.beam_loads import BeamLoads, BeamLoadQuery
+from SANSPRO.layout.beam_layout import BeamLayouts
+from SANSPRO.layout.column_layout import ColumnLayouts
+from SANSPRO.layout.regions import Regions, RegionsEngine
+from SANSPRO.layout.transform import TransformEngine
+from SANSPRO.util.geometry import (
+    compose, grid_offsets, mirror_matrix, point_transformer,
+    transform_points, translation_matrix,
+)
+
+# ------------------------------------------------------------
+# Plan operations
+# ------------------------------------------------------------
+
+@dataclass(frozen=True)
+class MirrorOp:
+    """Mirror across the line (x1, y1) → (x2, y2); the original is not kept."""
+    x1: float
+    y1: float
+    x2: float
+    y2: float
+
+    def matrices(self) -> List[np.ndarray]:
+        return [mirror_matrix(self.x1, self.y1, self.x2, self.y2)]
+
+@dataclass(frozen=True)
+class TranslateOp:
+    dx: float = 0.0
+    dy: float = 0.0
+    dz: float = 0.0
+
+    def matrices(self) -> List[np.ndarray]:
+        return [translation_matrix(self.dx, self.dy, self.dz)]
+
+@dataclass(frozen=True)
+class ReplicateOp:
+    """Grid copies; like the replicate engines, the original position is skipped."""
+    nx: int = 0
+    ny: int = 0
+    nz: int = 0
+    dx: float = 0.0
+    dy: float = 0.0
+    dz: float = 0.0
+
+    def matrices(self) -> List[np.ndarray]:
+        offsets = grid_offsets(self.nx, self.ny, self.nz, self.dx, self.dy, self.dz)
+        return [translation_matrix(*o) for o in offsets.tolist()]
+
+TransformOp = Union[MirrorOp, TranslateOp, ReplicateOp]
+
+@dataclass
+class PlanInstance:
+    template: str
+    ops: List[TransformOp] = field(default_factory=list)
+
+@dataclass
+class TransformPlan:
+    """
+    Declarative placement of template models: each instance names a
+    template and the ops (in order) that place it.
+    """
+    instances: List[PlanInstance] = field(default_factory=list)
+
+    def add(self, template: str, *ops: TransformOp) -> "TransformPlan":
+        self.instances.append(PlanInstance(template=template, ops=list(ops)))
+        return self
+
+    def compile(self) -> List[Tuple[str, np.ndarray]]:
+        """One (template, affine matrix) per placed copy, in plan order."""
+        placed: List[Tuple[str, np.ndarray]] = []
+        for inst in self.instances:
+            matrices = [np.eye(4)]
+            for op in inst.ops:
+                matrices = [compose(m, o) for m in matrices for o in op.matrices()]
+            placed.extend((inst.template, m) for m in matrices)
+        return placed
+
+@dataclass
+class AssemblyResult:
+    nodes: Nodes
+    beam_layouts: Optional[BeamLayouts] = None
+    column_layouts: Optional[ColumnLayouts] = None
+    regions: Optional[Regions] = None
+    beam_loads: Optional[BeamLoads] = None
+
+# ------------------------------------------------------------
+# Planner
+# ------------------------------------------------------------
+
+class PlanEngine:
+    """
+    Assemble a whole building from cached templates in one pass per
+    collection.
+
+    Every placed copy is reduced to a single affine matrix (TransformPlan
+    .compile). All copies of all templates are transformed in one node
+    array and welded once against the base model and each other; layouts,
+    regions and beam loads are then remapped through the per-copy node
+    maps and merged into the base with one duplicate check each.
+
+    Templates are only read, so one parsed copy per template serves every
+    placement. `templates` maps a name to its collections ("nodes",
+    "beam_layouts", "column_layouts", "regions", "beam_loads"), e.g. a
+    ModelRepository TemplateView.
+
+    Merging matches the replicate/mirror engines with include_original=True:
+    base items come first, copies are appended in plan order, coinciding
+    items are dropped and beam loads follow `policy` (applied copy by copy).
+    Columns are the one exception: ColumnLayoutsEngine.replicate also
+    re-adds the template's own columns at their untranslated position on
+    every call, the plan does not (see tests/test_plan_regression.py).
+    """
+
+    TOL = 1e-6
+
+    @classmethod
+    def assemble(
+        cls,
+        plan: TransformPlan,
+        templates: Mapping[str, Any],
+        *,
+        nodes: Nodes,
+        beam_layouts: Optional[BeamLayouts] = None,
+        column_layouts: Optional[ColumnLayouts] = None,
+        regions: Optional[Regions] = None,
+        beam_loads: Optional[BeamLoads] = None,
+        policy: Literal["skip", "add", "replace"] = "skip",
+        tol: float = TOL,
+    ) -> AssemblyResult:
+
+        policy = policy.lower()
+        if policy not in {"skip", "add", "replace"}:
+            raise ValueError(f"Invalid policy: {policy}")
+        if beam_loads is not None and beam_layouts is None:
+            raise ValueError("beam_loads can only be assembled together with beam_layouts")
+
+        placed = plan.compile()
+        names = list(dict.fromkeys(name for name, _ in placed))
+        missing = [name for name in names if name not in templates]
+        if missing:
+            raise KeyError(f"Templates not provided: {missing}")
+
+        # resolve base loads to beam objects before the merge reindexes beams
+        base_load_beams = None
+        if beam_loads is not None:
+            base_load_beams = [(load, cls._load_beam(beam_layouts, load)) for load in beam_loads.objects]
+
+        result_nodes, node_maps = cls._assemble_nodes(placed, templates, nodes, tol)
+
+        # shared lookup for items that reference nodes outside their template's node table
+        lookup = result_nodes.spatial_index(tol)
+
+        def remapper(c: int):
+            node_map = node_maps[c]
+            point = point_transformer(placed[c][1])
+
+            def remap(n: Optional[Node]) -> Optional[Node]:
+                if n is None:
+                    return None
+                mapped = node_map.get(id(n))
+                if mapped is None:
+                    mapped = lookup.find(*point(n.x, n.y, n.z))
+                return mapped
+            return remap
+
+        remaps = [remapper(c) for c in range(len(placed))]
+        result = AssemblyResult(nodes=result_nodes)
+
+        beam_map: Dict[Tuple[int, int], Beam] = {}
+        if beam_layouts is not None:
+            result.beam_layouts = cls._merge_layouts(
+                beam_layouts,
+                [(templates[name]["beam_layouts"], remaps[c]) for c, (name, _) in enumerate(placed)],
+                beam_map,
+                key=lambda b: frozenset((id(b.start), id(b.end))),
+                make=TransformEngine._transform_beam,
+            )
+
+        if column_layouts is not None:
+            result.column_layouts = cls._merge_layouts(
+                column_layouts,
+                [(templates[name]["column_layouts"], remaps[c]) for c, (name, _) in enumerate(placed)],
+                {},
+                key=lambda col: id(col.location),
+                make=TransformEngine._transform_column,
+            )
+
+        if regions is not None:
+            result.regions = cls._merge_regions(
+                regions,
+                [(templates[name]["regions"], remaps[c]) for c, (name, _) in enumerate(placed)],
+            )
+
+        if beam_loads is not None:
+            result.beam_loads = cls._merge_beam_loads(
+                base_load_beams, placed, templates, beam_map, policy)
+
+        return result
+
+    # --------------------------------------------------------
+    # Nodes (single weld)
+    # --------------------------------------------------------
+    @staticmethod
+    def _assemble_nodes(placed, templates, nodes: Nodes, tol: float):
+        """Base nodes + every unique transformed template node; one node map per copy."""
+        base_list = nodes.objects
+
+        # template coordinates are read once per template, not per copy
+        coords = {name: templates[name]["nodes"].coords() for name, _ in placed}
+        chunks = [transform_points(m, coords[name]) for name, m in placed]
+        sizes = [len(c) for c in chunks]
+        xyz = np.concatenate(chunks) if chunks else np.zeros((0, 3))
+
+        targets: List[Optional[Node]] = [None] * len(xyz)
+
+        # copies landing on a base node reuse it
+        hit = NodeIndex.match_first(xyz, nodes.coords(), tol)
+        for i in np.flatnonzero(hit >= 0).tolist():
+            targets[i] = base_list[hit[i]]
+
+        # coinciding copies (across all placements) collapse onto the first
+        rows = np.flatnonzero(hit < 0)
+        first = NodeIndex.match_first(xyz[rows], xyz[rows], tol)
+        unique = first == np.arange(len(rows))
+
+        next_index = max((n.index for n in base_list), default=0) + 1
+        created = nodes.new_nodes(
+            np.arange(next_index, next_index + int(unique.sum())), xyz[rows[unique]])
+
+        rows = rows.tolist()
+        owner = dict(zip([r for r, u in zip(rows, unique.tolist()) if u], created))
+        for r, f in zip(rows, first.tolist()):
+            targets[r] = owner[rows[f]]
+
+        node_maps: List[Dict[int, Node]] = []
+        start = 0
+        for (name, _), size in zip(placed, sizes):
+            src = templates[name]["nodes"].objects
+            node_maps.append({id(n): t for n, t in zip(src, targets[start:start + size])})
+            start += size
+
+        return Nodes(objects=base_list + created), node_maps
+
+    # --------------------------------------------------------
+    # Layouts
+    # --------------------------------------------------------
+    @staticmethod
+    def _merge_layouts(base_layouts, copies, item_map: Dict[Tuple[int, int], object], *, key, make):
+        """
+        Base layouts + every copy's items, skipping items that coincide with
+        one already there. item_map receives (copy, id(source item)) → item.
+        """
+        new_layouts = [type(lay)(index=lay.index, items=lay.items.copy()) for lay in base_layouts.layouts]
+        by_index = {lay.index: lay for lay in new_layouts}
+        existing = {lay.index: {key(it): it for it in lay.items} for lay in new_layouts}
+
+        for c, (src_layouts, remap) in enumerate(copies):
+            for src_layout in src_layouts.layouts:
+                target = by_index.get(src_layout.index)
+                if target is None:
+                    raise ValueError(f"Layout #{src_layout.index} of the template does not exist in the base model")
+                taken = existing[src_layout.index]
+
+                for src in src_layout.items:
+                    item = make(src, remap)
+                    if item is None:
+                        continue
+
+                    k = key(item)
+                    if k in taken:
+                        item_map[(c, id(src))] = taken[k]
+                        continue
+
+                    taken[k] = item
+                    target.items.append(item)
+                    item_map[(c, id(src))] = item
+
+        # Re-index items within each floor
+        for layout in new_layouts:
+            for i, item in enumerate(layout.items, start=1):
+                item.index = i
+            layout.rebuild_index()
+
+        return type(base_layouts)(layouts=new_layouts)
+
+    @staticmethod
+    def _merge_regions(base_regions: Regions, copies) -> Regions:
+        out = list(base_regions.objects)
+        existing = {(r.floor, frozenset(map(id, r.edges))) for r in out}
+        next_index = max((r.index for r in out), default=0) + 1
+
+        for src_regions, remap in copies:
+            for r in src_regions.objects:
+                edges = tuple(remap(n) for n in r.edges)
+                if any(n is None for n in edges):
+                    continue
+
+                k = (r.floor, frozenset(map(id, edges)))
+                if k in existing:
+                    continue
+                existing.add(k)
+
+                out.append(Region(
+                    index=next_index,
+                    floor=r.floor,
+                    slab=r.slab,
+                    option=r.option,
+                    qDL_add=r.qDL_add,
+                    qLL_add=r.qLL_add,
+                    edges=RegionsEngine.canonicalize_edges(edges),
+                    offset=r.offset,
+                    misc=r.misc,
+                ))
+                next_index += 1
+
+        return Regions(objects=out)
+
+    # --------------------------------------------------------
+    # Beam loads
+    # --------------------------------------------------------
+    @staticmethod
+    def _load_beam(layouts: BeamLayouts, load: BeamLoad) -> Optional[Beam]:
+        layout = layouts._by_index.get(load.floor)
+        return layout.get_item(load.beam_id) if layout is not None else None
+
+    @classmethod
+    def _merge_beam_loads(cls,
+                          base: List[Tuple[BeamLoad, Optional[Beam]]],
+                          placed,
+                          templates,
+                          beam_map: Dict[Tuple[int, int], Beam],
+                          policy: str) -> BeamLoads:
+
+        def key(pair):
+            load, beam = pair
+            return (load.floor, id(beam), load.load_case)
+
+        # template loads resolved once per template
+        sources: Dict[str, List[Tuple[BeamLoad, Beam]]] = {}
+        for name, _ in placed:
+            if name not in sources:
+                tpl = templates[name]
+                pairs = [(load, cls._load_beam(tpl["beam_layouts"], load)) for load in tpl["beam_loads"].objects]
+                sources[name] = [(load, beam) for load, beam in pairs if beam is not None]
+
+        combined = list(base)
+        taken = {key(p) for p in combined if p[1] is not None}
+
+        for c, (name, _) in enumerate(placed):
+            batch = [(load, beam_map[(c, id(beam))]) for load, beam in sources[name]
+                     if (c, id(beam)) in beam_map]
+
+            if policy == "skip":
+                batch = [p for p in batch if key(p) not in taken]
+            elif policy == "replace":
+                replaced = {key(p) for p in batch}
+                combined = [p for p in combined if p[1] is None or key(p) not in replaced]
+
+            combined.extend(batch)
+            taken.update(key(p) for p in batch)
+
+        # beams were reindexed by the layout merge: write the final ids
+        return BeamLoads([
+            BeamLoadQuery.clone_with_beam(load, beam.index if beam is not None else load.beam_id, new_index=i)
+            for i, (load, beam) in enumerate(combined, start=1)
+        ])
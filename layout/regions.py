@@ -8,6 +8,7 @@ from SANSPRO.collection.nodes import Nodes
 from SANSPRO.collection.slabs import Slabs
 
 from SANSPRO.variable.building import BuildingParse, BuildingAdapter
+from SANSPRO.util.geometry import mirror_matrix, point_transformer
 
 from collection._collection_abstract import (
     Collection, 
@@ -216,22 +217,7 @@ class RegionsEngine(ObjectCollectionEngine[Region, Regions]):
         templates = list(regions_to_copy.objects)
 
         # Prebuild node lookup
-        node_lookup = {}
-        for n in nodes.objects:
-            key = (
-                round(n.x / tolerance) * tolerance,
-                round(n.y / tolerance) * tolerance,
-                round(n.z / tolerance) * tolerance,
-            )
-            node_lookup[key] = n
-
-        def find_node(x: float, y: float, z: float):
-            key = (
-                round(x / tolerance) * tolerance,
-                round(y / tolerance) * tolerance,
-                round(z / tolerance) * tolerance,
-            )
-            return node_lookup.get(key)
+        find_node = nodes.spatial_index(tolerance).find
 
         # -----------------------------------------
         # Duplicate detection
@@ -354,11 +340,8 @@ class RegionsEngine(ObjectCollectionEngine[Region, Regions]):
         """
         base = list(regions.objects)
 
-        # Build node lookup dictionary with tolerance-based rounding
-        lookup = {
-            (round(n.x, 6), round(n.y, 6), round(n.z, 6)): n
-            for n in nodes.objects
-        }
+        # Build tolerance-aware node lookup
+        lookup = nodes.spatial_index(tolerance)
 
         # Validate mirror line
         dx = x2 - x1
@@ -367,42 +350,11 @@ class RegionsEngine(ObjectCollectionEngine[Region, Regions]):
         if L < tolerance:
             raise ValueError(f"Mirror line must not be a point (length={L:.2e})")
 
-        # Normalize mirror line direction
-        ux = dx / L
-        uy = dy / L
-
         if debug:
             print(f"[MIRROR] Line from ({x1},{y1}) to ({x2},{y2})")
-            print(f"  Length: {L:.3f}, Direction: ({ux:.3f}, {uy:.3f})")
-
-        def mirror_point(px: float, py: float, pz: float) -> tuple[float, float, float]:
-            """Mirror a point across the line and normalize to avoid floating-point errors."""
-            # Translate point so mirror line passes through origin
-            px -= x1
-            py -= y1
-
-            # Rotate to align mirror line with x-axis
-            rx = ux * px + uy * py
-            ry = -uy * px + ux * py
-
-            # Reflect across x-axis (negate y-component)
-            ry = -ry
-
-            # Rotate back
-            mx = ux * rx - uy * ry
-            my = uy * rx + ux * ry
-
-            # Translate back
-            mx += x1
-            my += y1
-
-            # Normalize to 6 decimal places to match node lookup keys
-            # This prevents floating-point errors from causing lookup failures
-            mx = round(mx, 6)
-            my = round(my, 6)
-            mz = round(pz, 6)
+            print(f"  Length: {L:.3f}, Direction: ({dx / L:.3f}, {dy / L:.3f})")
 
-            return mx, my, mz
+        mirror_point = point_transformer(mirror_matrix(x1, y1, x2, y2))
 
         out = base.copy() if include_original else []
         next_index = max((r.index for r in base), default=0) + 1
@@ -414,17 +366,16 @@ class RegionsEngine(ObjectCollectionEngine[Region, Regions]):
 
             for nd in r.edges:
                 mx, my, mz = mirror_point(nd.x, nd.y, nd.z)
-                # Key is already normalized in mirror_point
-                key = (mx, my, mz)
+                match = lookup.find(mx, my, mz)
                 
-                if key not in lookup:
+                if match is None:
                     if debug:
                         print(f"[SKIP] Region #{r.index}: Missing node at ({mx:.3f}, {my:.3f}, {mz:.3f})")
                     mirrored_nodes = []
                     skipped += 1
                     break
                     
-                mirrored_nodes.append(lookup[key])
+                mirrored_nodes.append(match)
 
             if len(mirrored_nodes) != 4:
                 continue
@@ -0,0 +1,250 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from SANSPRO.object.node import Node
+from SANSPRO.collection.nodes import Nodes
+from SANSPRO.collection.offsets import Offsets
+from SANSPRO.collection.point_loads import PointLoads
+from SANSPRO.collection.diaphragms import Diaphragms
+from SANSPRO.layout.beam_layout import BeamLayouts
+from SANSPRO.layout.column_layout import ColumnLayouts
+from SANSPRO.layout.regions import Regions
+
+@dataclass
+class RenumberReport:
+    nodes: int
+    edges: int
+    bandwidth_before: int
+    bandwidth_after: int
+    profile_before: int
+    profile_after: int
+    applied: bool
+
+    def __str__(self) -> str:
+        state = "applied" if self.applied else "kept original numbering"
+        return (
+            f"[RENUMBER] {self.nodes} nodes, {self.edges} edges ({state})\n"
+            f"  bandwidth: {self.bandwidth_before} → {self.bandwidth_after}\n"
+            f"  profile:   {self.profile_before} → {self.profile_after}"
+        )
+
+class NodeRenumberEngine:
+    """
+    Bandwidth-reducing node renumbering (Reverse Cuthill–McKee).
+
+    The graph joins the two end nodes of every beam (all floors) and the
+    corners of every slab region. Columns tie a layout node to itself
+    across floors, so they add no in-plan edges.
+
+    `apply` renumbers in place: nodes get new indices and the input Nodes
+    is reordered (NODEXY order) with its lookups rebuilt, point loads and
+    diaphragm entries are rewritten by index, and beams, columns, regions
+    and offsets follow through their node references.
+    Write NODEXY before MDIAPHTAB: NodesAdapter re-matches diaphragms by
+    index, the renumbered Diaphragms must overwrite that.
+    """
+
+    # --------------------------------------------------------
+    # Graph
+    # --------------------------------------------------------
+    @staticmethod
+    def _rebind(nodes: Nodes, node: Optional[Node], members: Set[int]) -> Optional[Node]:
+        """Canonical node for a reference (items may hold copies with the same index)."""
+        if node is None or id(node) in members:
+            return node
+        return nodes.get(node.index) or node
+
+    @classmethod
+    def connectivity(cls,
+                     nodes: Nodes,
+                     beam_layouts: Optional[BeamLayouts] = None,
+                     regions: Optional[Regions] = None) -> Tuple[List[Set[int]], np.ndarray]:
+        """Adjacency (by position in nodes.objects) and the unique (E, 2) edge array."""
+        position = {id(n): i for i, n in enumerate(nodes.objects)}
+        members = set(position)
+
+        def pos(n):
+            n = cls._rebind(nodes, n, members)
+            return position.get(id(n)) if n is not None else None
+
+        edges: Set[Tuple[int, int]] = set()
+
+        def connect(a, b):
+            if a is not None and b is not None and a != b:
+                edges.add((a, b) if a < b else (b, a))
+
+        if beam_layouts is not None:
+            for beam in beam_layouts.walk_items():
+                connect(pos(beam.start), pos(beam.end))
+
+        if regions is not None:
+            for r in regions.objects:
+                corners = [pos(n) for n in r.edges]
+                for i in range(len(corners)):
+                    for j in range(i + 1, len(corners)):
+                        connect(corners[i], corners[j])
+
+        adjacency: List[Set[int]] = [set() for _ in nodes.objects]
+        for a, b in edges:
+            adjacency[a].add(b)
+            adjacency[b].add(a)
+
+        edge_array = np.array(sorted(edges), dtype=np.int64).reshape(-1, 2)
+        return adjacency, edge_array
+
+    @staticmethod
+    def bandwidth_profile(edges: np.ndarray, rank: np.ndarray) -> Tuple[int, int]:
+        """
+        Bandwidth (max |i - j|) and profile (sum over rows of the distance to
+        the first off-diagonal entry) for node ranks `rank`.
+        """
+        if len(edges) == 0:
+            return 0, 0
+
+        a = rank[edges[:, 0]]
+        b = rank[edges[:, 1]]
+        lo = np.minimum(a, b)
+        hi = np.maximum(a, b)
+
+        first = np.arange(len(rank))
+        np.minimum.at(first, hi, lo)
+        return int((hi - lo).max()), int((np.arange(len(rank)) - first).sum())
+
+    # --------------------------------------------------------
+    # Ordering
+    # --------------------------------------------------------
+    @staticmethod
+    def _levels(adjacency: List[Set[int]], start: int) -> List[List[int]]:
+        seen = {start}
+        level = [start]
+        levels = []
+        while level:
+            levels.append(level)
+            nxt = []
+            for v in level:
+                for w in adjacency[v]:
+                    if w not in seen:
+                        seen.add(w)
+                        nxt.append(w)
+            level = nxt
+        return levels
+
+    @classmethod
+    def _pseudo_peripheral(cls, adjacency: List[Set[int]], start: int) -> int:
+        """George–Liu: walk to a min-degree node of the last BFS level until depth stops growing."""
+        levels = cls._levels(adjacency, start)
+        while True:
+            candidate = min(levels[-1], key=lambda v: (len(adjacency[v]), v))
+            candidate_levels = cls._levels(adjacency, candidate)
+            if len(candidate_levels) <= len(levels):
+                return start
+            start, levels = candidate, candidate_levels
+
+    @classmethod
+    def rcm_order(cls, adjacency: List[Set[int]]) -> List[int]:
+        """Positions in RCM order (component by component, ties by position)."""
+        n = len(adjacency)
+        degree = [len(a) for a in adjacency]
+        visited = [False] * n
+        order: List[int] = []
+
+        for seed in sorted(range(n), key=lambda v: (degree[v], v)):
+            if visited[seed]:
+                continue
+
+            start = cls._pseudo_peripheral(adjacency, seed)
+            visited[start] = True
+            queue = deque([start])
+            while queue:
+                v = queue.popleft()
+                order.append(v)
+                for w in sorted((w for w in adjacency[v] if not visited[w]), key=lambda w: (degree[w], w)):
+                    visited[w] = True
+                    queue.append(w)
+
+        order.reverse()
+        return order
+
+    # --------------------------------------------------------
+    # Apply
+    # --------------------------------------------------------
+    @classmethod
+    def apply(cls,
+              nodes: Nodes,
+              *,
+              beam_layouts: Optional[BeamLayouts] = None,
+              column_layouts: Optional[ColumnLayouts] = None,
+              regions: Optional[Regions] = None,
+              offsets: Optional[Offsets] = None,
+              point_loads: Optional[PointLoads] = None,
+              diaphragms: Optional[Diaphragms] = None,
+              force: bool = False) -> Tuple[Nodes, RenumberReport]:
+        """
+        Renumber `nodes` 1..N in RCM order and rewrite every reference.
+        The ordering is only applied when it lowers bandwidth or profile
+        (or `force=True`); "before" is the numbering by the current
+        node.index. Returns `nodes` (reordered when applied) and the report.
+        """
+        members = {id(n) for n in nodes.objects}
+
+        # every item must point at the canonical node objects before renumbering
+        def rebind(n):
+            return cls._rebind(nodes, n, members)
+
+        if beam_layouts is not None:
+            for beam in beam_layouts.walk_items():
+                beam.start, beam.end = rebind(beam.start), rebind(beam.end)
+        if column_layouts is not None:
+            for col in column_layouts.walk_items():
+                col.location = rebind(col.location)
+        if regions is not None:
+            for r in regions.objects:
+                r.edges = tuple(rebind(n) for n in r.edges)
+        if offsets is not None:
+            for o in offsets.objects:
+                o.node = rebind(o.node)
+
+        adjacency, edges = cls.connectivity(nodes, beam_layouts, regions)
+        order = cls.rcm_order(adjacency)
+
+        # equation numbers follow node.index, not the NODEXY position
+        current = np.empty(len(order), dtype=np.int64)
+        current[np.argsort(nodes.indices(), kind="stable")] = np.arange(len(order))
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+
+        bw0, pf0 = cls.bandwidth_profile(edges, current)
+        bw1, pf1 = cls.bandwidth_profile(edges, rank)
+        applied = force or bw1 < bw0 or (bw1 == bw0 and pf1 < pf0)
+
+        report = RenumberReport(
+            nodes=len(order), edges=len(edges),
+            bandwidth_before=bw0, bandwidth_after=bw1 if applied else bw0,
+            profile_before=pf0, profile_after=pf1 if applied else pf0,
+            applied=applied,
+        )
+        if not applied:
+            return nodes, report
+
+        old_objects = nodes.objects
+        old_to_new: Dict[int, int] = {}
+        reordered = [old_objects[p] for p in order]
+        for new_index, node in enumerate(reordered, start=1):
+            old_to_new[node.index] = new_index
+        for new_index, node in enumerate(reordered, start=1):
+            node.index = new_index
+
+        if point_loads is not None:
+            for pl in point_loads.objects:
+                pl.node_id = old_to_new.get(pl.node_id, pl.node_id)
+
+        if diaphragms is not None:
+            for d in diaphragms.objects:
+                d.index = old_to_new.get(d.index, d.index)
+            diaphragms.rebuild(sorted(diaphragms.objects, key=lambda d: d.index))
+
+        nodes.rebuild(reordered)
+        return nodes, report
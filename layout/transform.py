@@ -0,0 +1,315 @@
+from dataclasses import dataclass
+from typing import Dict, List, Literal, Optional, Tuple
+
+import numpy as np
+
+from SANSPRO.object.node import Node
+from SANSPRO.object.beam import Beam
+from SANSPRO.object.beam_load import BeamLoad
+from SANSPRO.object.column import Column
+from SANSPRO.object.offset import Offset
+from SANSPRO.object.slab import Region
+from SANSPRO.collection.nodes import Nodes
+from SANSPRO.collection.node_index import NodeIndex
+from SANSPRO.collection.offsets import Offsets
+from SANSPRO.collection.beam_loads import BeamLoads, BeamLoadQuery
+from SANSPRO.layout.beam_layout import BeamLayouts
+from SANSPRO.layout.column_layout import ColumnLayouts
+from SANSPRO.layout.regions import Regions, RegionsEngine
+from SANSPRO.util.geometry import as_affine, transform_points, point_transformer
+
+@dataclass
+class TransformResult:
+    nodes: Nodes
+    node_map: Dict[int, Node]                  # id(source node) → node in `nodes`
+    beam_layouts: Optional[BeamLayouts] = None
+    column_layouts: Optional[ColumnLayouts] = None
+    regions: Optional[Regions] = None
+    offsets: Optional[Offsets] = None
+    beam_loads: Optional[BeamLoads] = None
+
+class TransformEngine:
+    """
+    Apply one affine transform (util.geometry: mirror_matrix, rotation_matrix,
+    translation_matrix, scaling_matrix, compose) to a whole model at once.
+
+    The node table is transformed in a single array operation and every
+    other collection is remapped through the resulting node map, so no
+    collection re-derives geometry or rebuilds its own coordinate lookup.
+
+    include_original=False → transformed copy only
+    include_original=True  → originals + transformed items that do not
+                             coincide with an original one
+
+    The result reuses the original objects when include_original=True and
+    renumbers them in place (Node, Beam, Column, Region and Offset .index),
+    so the input collections' index lookups go stale: use the result in
+    place of the inputs. With include_original=False only new objects are
+    numbered and the inputs are left as they were.
+    """
+
+    TOL = 1e-6
+
+    @classmethod
+    def apply(
+        cls,
+        matrix,
+        *,
+        nodes: Nodes,
+        beam_layouts: Optional[BeamLayouts] = None,
+        column_layouts: Optional[ColumnLayouts] = None,
+        regions: Optional[Regions] = None,
+        offsets: Optional[Offsets] = None,
+        beam_loads: Optional[BeamLoads] = None,
+        include_original: bool = False,
+        policy: Literal["skip", "add", "replace"] = "skip",
+        tol: float = TOL,
+    ) -> TransformResult:
+
+        if beam_loads is not None and beam_layouts is None:
+            raise ValueError("beam_loads can only be transformed together with beam_layouts")
+
+        matrix = as_affine(matrix)
+
+        # resolve loads to beam objects before the layout pass reindexes beams
+        load_beams = cls._resolve_beam_loads(beam_loads, beam_layouts) if beam_loads is not None else None
+
+        result_nodes, node_map = cls._transform_nodes(matrix, nodes, include_original, tol)
+
+        # shared lookup for items that reference nodes outside `nodes`
+        lookup = result_nodes.spatial_index(tol)
+        point = point_transformer(matrix)
+
+        def remap(n: Optional[Node]) -> Optional[Node]:
+            if n is None:
+                return None
+            mapped = node_map.get(id(n))
+            if mapped is None:
+                mapped = lookup.find(*point(n.x, n.y, n.z))
+            return mapped
+
+        result = TransformResult(nodes=result_nodes, node_map=node_map)
+
+        beam_map: Dict[int, Beam] = {}
+        if beam_layouts is not None:
+            result.beam_layouts = cls._transform_layouts(
+                beam_layouts, include_original, beam_map,
+                key=lambda b: frozenset((id(b.start), id(b.end))),
+                make=lambda b: cls._transform_beam(b, remap),
+            )
+
+        if column_layouts is not None:
+            result.column_layouts = cls._transform_layouts(
+                column_layouts, include_original, {},
+                key=lambda c: id(c.location),
+                make=lambda c: cls._transform_column(c, remap),
+            )
+
+        if regions is not None:
+            result.regions = cls._transform_regions(regions, include_original, remap)
+
+        if offsets is not None:
+            result.offsets = cls._transform_offsets(offsets, include_original, matrix, remap)
+
+        if beam_loads is not None:
+            result.beam_loads = cls._transform_beam_loads(
+                load_beams, beam_map, include_original, policy)
+
+        return result
+
+    # --------------------------------------------------------
+    # Nodes
+    # --------------------------------------------------------
+    @staticmethod
+    def _transform_nodes(matrix: np.ndarray, nodes: Nodes, include_original: bool, tol: float):
+        src = nodes.objects
+        xyz = transform_points(matrix, nodes.coords())
+
+        targets: List[Optional[Node]] = [None] * len(src)
+        result: List[Node] = list(src) if include_original else []
+
+        # transformed points that land on an original node reuse it
+        rows = np.arange(len(src))
+        if include_original:
+            hit = NodeIndex.match_first(xyz, nodes.coords(), tol)
+            for i in np.flatnonzero(hit >= 0).tolist():
+                targets[i] = src[hit[i]]
+            rows = np.flatnonzero(hit < 0)
+
+        # coinciding transformed points collapse onto the first of them
+        first = NodeIndex.match_first(xyz[rows], xyz[rows], tol)
+        unique = first == np.arange(len(rows))
+
+        created = nodes.new_nodes(np.zeros(int(unique.sum()), dtype=np.int64), xyz[rows[unique]])
+        rows = rows.tolist()
+        owner = dict(zip([r for r, u in zip(rows, unique.tolist()) if u], created))
+        for r, f in zip(rows, first.tolist()):
+            targets[r] = owner[rows[f]]
+
+        result.extend(created)
+        for i, n in enumerate(result, start=1):
+            n.index = i
+
+        node_map = {id(n): t for n, t in zip(src, targets)}
+        return Nodes(objects=result), node_map
+
+    # --------------------------------------------------------
+    # Layout items
+    # --------------------------------------------------------
+    @staticmethod
+    def _transform_beam(b: Beam, remap) -> Optional[Beam]:
+        start, end = remap(b.start), remap(b.end)
+        if start is None or end is None:
+            return None
+        return Beam(index=0, start=start, end=end, elset=b.elset,
+                    group=b.group, beam_type=b.beam_type, misc=b.misc)
+
+    @staticmethod
+    def _transform_column(c: Column, remap) -> Optional[Column]:
+        location = remap(c.location)
+        if location is None:
+            return None
+        return Column(index=0, location=location, elset=c.elset,
+                      group=c.group, alpha=c.alpha, misc=c.misc)
+
+    @staticmethod
+    def _transform_layouts(layouts, include_original: bool, item_map: Dict[int, object], *, key, make):
+        """
+        Transform every item of every layout; item_map receives
+        id(source item) → item in the result (new, or the original it landed on).
+        """
+        new_layouts = []
+        for layout in layouts.layouts:
+            items = layout.items.copy() if include_original else []
+            existing = {key(it): it for it in items}
+
+            for src in layout.items:
+                item = make(src)
+                if item is None:
+                    continue
+
+                k = key(item)
+                if k in existing:
+                    item_map[id(src)] = existing[k]
+                    continue
+
+                existing[k] = item
+                items.append(item)
+                item_map[id(src)] = item
+
+            for i, item in enumerate(items, start=1):
+                item.index = i
+            new_layouts.append(type(layout)(index=layout.index, items=items))
+
+        return type(layouts)(layouts=new_layouts)
+
+    # --------------------------------------------------------
+    # Flat collections
+    # --------------------------------------------------------
+    @staticmethod
+    def _transform_regions(regions: Regions, include_original: bool, remap) -> Regions:
+        out = list(regions.objects) if include_original else []
+        existing = {(r.floor, frozenset(map(id, r.edges))) for r in out}
+
+        for r in regions.objects:
+            edges = tuple(remap(n) for n in r.edges)
+            if any(n is None for n in edges):
+                continue
+
+            k = (r.floor, frozenset(map(id, edges)))
+            if k in existing:
+                continue
+            existing.add(k)
+
+            out.append(Region(
+                index=0,
+                floor=r.floor,
+                slab=r.slab,
+                option=r.option,
+                qDL_add=r.qDL_add,
+                qLL_add=r.qLL_add,
+                edges=RegionsEngine.canonicalize_edges(edges),
+                offset=r.offset,
+                misc=r.misc,
+            ))
+
+        for i, r in enumerate(out, start=1):
+            r.index = i
+        return Regions(objects=out)
+
+    @staticmethod
+    def _transform_offsets(offsets: Offsets, include_original: bool, matrix: np.ndarray, remap) -> Offsets:
+        # offsets are vectors: only the linear part applies
+        linear = matrix[:3, :3]
+
+        out = list(offsets.objects) if include_original else []
+        existing = {(o.floor, id(o.node)) for o in out}
+
+        for o in offsets.objects:
+            node = remap(o.node)
+            if node is None or (o.floor, id(node)) in existing:
+                continue
+            existing.add((o.floor, id(node)))
+
+            x, y, z = (linear @ np.array([o.x, o.y, o.z])).tolist()
+            out.append(Offset(index=0, floor=o.floor, node=node, x=x, y=y, z=z))
+
+        for i, o in enumerate(out, start=1):
+            o.index = i
+        return Offsets(out)
+
+    @staticmethod
+    def _resolve_beam_loads(beam_loads: BeamLoads,
+                            beam_layouts: BeamLayouts) -> List[Tuple[BeamLoad, Optional[Beam]]]:
+        """
+        (load, source beam) pairs; beam_id is per floor. A load on a missing
+        beam is paired with None: it is never transformed, and is kept as it
+        is when the originals are kept.
+        """
+        loads = []
+        missing = []
+        for load in beam_loads.objects:
+            layout = beam_layouts._by_index.get(load.floor)
+            beam = layout.get_item(load.beam_id) if layout is not None else None
+            if beam is None:
+                missing.append(f"#{load.index} (floor {load.floor}, beam {load.beam_id})")
+            loads.append((load, beam))
+
+        if missing:
+            print(f"[transform][WARN] beam load(s) on missing beams are not transformed: {', '.join(missing)}")
+        return loads
+
+    @staticmethod
+    def _transform_beam_loads(loads: List[Tuple[BeamLoad, Optional[Beam]]],
+                              beam_map: Dict[int, Beam],
+                              include_original: bool,
+                              policy: str) -> BeamLoads:
+
+        policy = policy.lower()
+        if policy not in {"skip", "add", "replace"}:
+            raise ValueError(f"Invalid policy: {policy}")
+
+        existing = list(loads) if include_original else []
+
+        new = [(load, beam_map[id(beam)]) for load, beam in loads
+               if beam is not None and id(beam) in beam_map]
+
+        def key(pair):
+            load, beam = pair
+            return (load.floor, id(beam), load.load_case)
+
+        if policy == "skip":
+            taken = {key(p) for p in existing}
+            combined = existing + [p for p in new if key(p) not in taken]
+        elif policy == "replace":
+            taken = {key(p) for p in new}
+            combined = [p for p in existing if key(p) not in taken] + new
+        else:
+            combined = existing + new
+
+        # beams were reindexed by the layout pass: write the final ids
+        # (a kept load on a missing beam keeps its beam_id)
+        return BeamLoads([
+            BeamLoadQuery.clone_with_beam(load, beam.index if beam is not None else load.beam_id, new_index=i)
+            for i, (load, beam) in enumerate(combined, start=1)
+        ])
@@ -0,0 +1,226 @@
+import functools
+import hashlib
+import os
+import pickle
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from SANSPRO.model.model import Model, ModelAdapter
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+@dataclass
+class CacheStamp:
+    """Identity of a source .MDL at the time it was cached."""
+    path: str
+    size: int
+    mtime_ns: int
+    digest: str
+
+    @classmethod
+    def of(cls, path: Union[str, Path], digest: Optional[str] = None) -> "CacheStamp":
+        stat = os.stat(path)
+        return cls(
+            path=str(Path(path).resolve()),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            digest=digest if digest is not None else file_digest(path),
+        )
+
+@dataclass
+class CacheEntry:
+    format: int
+    stamp: CacheStamp
+    encoding: str
+    model: Model
+    version: str = ""
+    # key → (build fingerprint, collections)
+    collections: Dict[str, Tuple[str, Any]] = field(default_factory=dict)
+
+def file_digest(path: Union[str, Path], chunk: int = 1 << 20) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for data in iter(lambda: f.read(chunk), b""):
+            h.update(data)
+    return h.hexdigest()
+
+@functools.lru_cache(maxsize=None)
+def package_version() -> str:
+    """
+    Digest of the package's library sources (every subpackage except
+    tests). Pickled models and collections are only reused by the code
+    that produced them.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    for path in sorted(PACKAGE_ROOT.glob("*/**/*.py")):
+        relative = path.relative_to(PACKAGE_ROOT)
+        if relative.parts[0] in ("tests", "__pycache__"):
+            continue
+        h.update(relative.as_posix().encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+def build_fingerprint(build: Callable) -> str:
+    """
+    Qualified name of a build function plus a hash of its module source
+    (its bytecode when the source is not available), so editing the build
+    invalidates collections cached under a fixed key.
+    """
+    while isinstance(build, functools.partial):
+        build = build.func
+    build = getattr(build, "__func__", build)
+
+    module_name = getattr(build, "__module__", None) or type(build).__module__
+    qualname = getattr(build, "__qualname__", None) or type(build).__qualname__
+
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{module_name}.{qualname}".encode())
+
+    module_file = getattr(sys.modules.get(module_name), "__file__", None)
+    try:
+        h.update(Path(module_file).read_bytes())
+    except (TypeError, OSError):
+        code = getattr(build, "__code__", None)
+        if code is not None:
+            h.update(code.co_code)
+            h.update(repr(code.co_consts).encode())
+    return h.hexdigest()
+
+class ModelCache:
+    """
+    On-disk sidecar cache of parsed models.
+
+    The parsed Model, plus any named set of typed collections built from
+    it, is pickled next to the .MDL (or into `cache_dir`). An entry is
+    reused while the source keeps the same path and size and either the
+    same mtime or the same content hash, and the package sources are
+    unchanged (`package_version`); otherwise it is rebuilt. Collections are
+    also rebuilt when the build function or its module changes.
+
+    Every load unpickles fresh objects, so callers may mutate the result.
+    """
+
+    FORMAT = 2
+    SUFFIX = ".cache"
+
+    def __init__(self,
+                 encoding: str = "utf-8",
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 verify_hash: bool = False):
+        self.encoding = encoding
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.verify_hash = verify_hash
+
+    # --------------------------------------------------------
+    # Paths
+    # --------------------------------------------------------
+    def sidecar_path(self, mdl_path: Union[str, Path]) -> Path:
+        mdl_path = Path(mdl_path)
+        folder = self.cache_dir if self.cache_dir is not None else mdl_path.parent
+        return folder / f"{mdl_path.name}{self.SUFFIX}"
+
+    # --------------------------------------------------------
+    # Public API
+    # --------------------------------------------------------
+    def from_text(self, folder_path: Union[str, Path], model_name: str) -> Model:
+        """Drop-in for ModelAdapter.from_text that goes through the cache."""
+        model, _ = self.load(folder_path, model_name)
+        return model
+
+    def load(self,
+             folder_path: Union[str, Path],
+             model_name: str,
+             build: Optional[Callable[[Model], Any]] = None,
+             key: str = "default") -> Tuple[Model, Any]:
+        """
+        Return (model, collections).
+
+        `build(model)` parses the typed collections (nodes, elsets, layouts,
+        ...) the caller needs; its result is cached under `key`. Without
+        `build`, collections is None.
+        """
+        mdl_path = Path(folder_path) / f"{model_name}.MDL"
+        entry = self._read_entry(mdl_path)
+
+        if entry is None:
+            model = ModelAdapter(encoding=self.encoding).from_text(folder_path, model_name)
+            entry = CacheEntry(
+                format=self.FORMAT,
+                stamp=CacheStamp.of(mdl_path),
+                encoding=self.encoding,
+                model=model,
+                version=package_version(),
+            )
+            dirty = True
+        else:
+            # content matched but the file was touched: refresh the stamp
+            dirty = entry.stamp.mtime_ns != os.stat(mdl_path).st_mtime_ns
+
+        collections = None
+        if build is not None:
+            fingerprint = build_fingerprint(build)
+            cached = entry.collections.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                collections = cached[1]
+            else:
+                collections = build(entry.model)
+                entry.collections[key] = (fingerprint, collections)
+                dirty = True
+
+        if dirty:
+            self._write_entry(mdl_path, entry)
+
+        return entry.model, collections
+
+    def invalidate(self, folder_path: Union[str, Path], model_name: str) -> None:
+        sidecar = self.sidecar_path(Path(folder_path) / f"{model_name}.MDL")
+        if sidecar.exists():
+            sidecar.unlink()
+
+    # --------------------------------------------------------
+    # Internals
+    # --------------------------------------------------------
+    def _is_fresh(self, stamp: CacheStamp, mdl_path: Path) -> bool:
+        stat = os.stat(mdl_path)
+        if stamp.path != str(mdl_path.resolve()) or stamp.size != stat.st_size:
+            return False
+
+        if stamp.mtime_ns == stat.st_mtime_ns and not self.verify_hash:
+            return True
+
+        return stamp.digest == file_digest(mdl_path)
+
+    def _read_entry(self, mdl_path: Path) -> Optional[CacheEntry]:
+        sidecar = self.sidecar_path(mdl_path)
+        if not sidecar.exists():
+            return None
+
+        try:
+            with open(sidecar, "rb") as f:
+                entry = pickle.load(f)
+        except Exception as e:
+            print(f"[ModelCache][WARN] unreadable cache {sidecar} ({e}), rebuilding")
+            return None
+
+        if (not isinstance(entry, CacheEntry)
+                or entry.format != self.FORMAT
+                or entry.version != package_version()
+                or entry.encoding != self.encoding
+                or not self._is_fresh(entry.stamp, mdl_path)):
+            return None
+
+        return entry
+
+    def _write_entry(self, mdl_path: Path, entry: CacheEntry) -> None:
+        sidecar = self.sidecar_path(mdl_path)
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+
+        # the source may have been touched without changing content
+        entry.stamp = CacheStamp.of(mdl_path, digest=entry.stamp.digest)
+
+        tmp = sidecar.with_name(sidecar.name + ".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, sidecar)
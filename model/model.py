@@ -1,7 +1,10 @@
+import os
+import re
 from collections import OrderedDict
+from collections.abc import MutableMapping
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Optional, Union, Iterator
 
 @dataclass
 class Block:
@@ -20,14 +23,230 @@ def parse_block_header(line: str) -> Optional[str]:
         return stripped[1:-1]
     return None
 
+@dataclass
+class BlockSpan:
+    """Byte range of one block inside the source .MDL file."""
+    header: str
+    offset: int          # start of the *HEADER* line (or <DESCRIPTION> line)
+    body_offset: int     # first byte after the header line
+    end: int             # first byte after the block
+
+    @property
+    def length(self) -> int:
+        return self.end - self.offset
+
+class LazyBlocks(MutableMapping):
+    """
+    Ordered header → Block mapping backed by byte offsets into the source file.
+
+    A block body is read and decoded only the first time it is accessed.
+    Assigning a block marks it dirty; ModelAdapter.to_text re-serializes
+    dirty blocks and copies every clean block straight from the source.
+    Edit a block by reassigning it (or call mark_dirty), not in place.
+    `newline` is the line ending of the source, used for re-serialized blocks.
+    """
+
+    # candidate lines: block markers or anything ending with '*'
+    _CANDIDATE = re.compile(rb"^.*(?:<DESCRIPTION>.*|<END>.*|\*[ \t\r\f\v]*)$", re.M)
+
+    def __init__(self,
+                 path: Union[str, Path],
+                 encoding: str,
+                 spans: List[BlockSpan],
+                 newline: str = os.linesep):
+        self.path = str(path)
+        self.encoding = encoding
+        self.newline = newline
+        self._entries: "OrderedDict[str, Optional[Block]]" = OrderedDict()
+        self._spans: Dict[str, BlockSpan] = {}
+        self._dirty: set[str] = set()
+
+        stat = os.stat(self.path)
+        self._source_stat = (stat.st_size, stat.st_mtime_ns)
+
+        # same insertion rules as the eager parser: a repeated header keeps
+        # its first position but takes the later body
+        for span in spans:
+            self._entries[span.header] = None
+            self._spans[span.header] = span
+
+    # --------------------------------------------------------
+    # Header scan
+    # --------------------------------------------------------
+    @classmethod
+    def scan(cls, path: Union[str, Path], encoding: str) -> "LazyBlocks":
+        """
+        Index every block of an .MDL file without decoding the bodies.
+        Only ASCII-compatible encodings (cp1252, utf-8, ...) are supported.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+
+        spans: List[BlockSpan] = []
+        current: Optional[BlockSpan] = None
+        in_description = False
+
+        for m in cls._CANDIDATE.finditer(data):
+            start, stop = m.start(), m.end()
+            line = data[start:stop]
+            next_line = stop + 1 if stop < len(data) else stop
+
+            if in_description:
+                if b"<END>" in line:
+                    current.end = next_line
+                    spans.append(current)
+                    current, in_description = None, False
+                continue
+
+            if b"<DESCRIPTION>" in line:
+                if current:
+                    current.end = start
+                    spans.append(current)
+                current = BlockSpan("DESCRIPTION", start, start, start)
+                in_description = True
+                continue
+
+            header = parse_block_header(line.decode(encoding, errors="replace"))
+            if header:
+                if current:
+                    current.end = start
+                    spans.append(current)
+                current = BlockSpan(header, start, next_line, next_line)
+
+        if current:
+            current.end = len(data)
+            if all(s.header != current.header for s in spans):
+                spans.append(current)
+
+        return cls(path, encoding, spans, newline=cls._detect_newline(data))
+
+    @staticmethod
+    def _detect_newline(data: bytes) -> str:
+        """Line ending of the first line break in `data` (os.linesep if none)."""
+        lf = data.find(b"\n")
+        cr = data.find(b"\r")
+        if lf < 0 and cr < 0:
+            return os.linesep
+        if lf >= 0 and (cr < 0 or cr > lf):
+            return "\n"
+        return "\r\n" if lf == cr + 1 else "\r"
+
+    def reindex(self) -> None:
+        """
+        Re-scan the source after it was rewritten with the current blocks
+        (ModelAdapter.to_text onto the source). Loaded blocks are kept, spans
+        and the source stat are refreshed and every block becomes clean.
+        """
+        fresh = type(self).scan(self.path, self.encoding)
+        if set(fresh._spans) != set(self._entries):
+            raise RuntimeError(f"{self.path} does not hold the blocks of this model")
+
+        self._spans = fresh._spans
+        self._source_stat = fresh._source_stat
+        self.newline = fresh.newline
+        self._dirty.clear()
+
+    # --------------------------------------------------------
+    # Lazy decoding
+    # --------------------------------------------------------
+    def check_source(self) -> None:
+        stat = os.stat(self.path)
+        if (stat.st_size, stat.st_mtime_ns) != self._source_stat:
+            raise RuntimeError(f"{self.path} changed since it was indexed")
+
+    def _read_span(self, span: BlockSpan) -> bytes:
+        self.check_source()
+        with open(self.path, "rb") as f:
+            f.seek(span.body_offset)
+            return f.read(span.end - span.body_offset)
+
+    def _decode(self, span: BlockSpan) -> Block:
+        text = self._read_span(span).decode(self.encoding)
+        lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+
+        if span.header == "DESCRIPTION":
+            # DESCRIPTION keeps blank lines, up to and including <END>
+            if lines and not lines[-1]:
+                lines.pop()
+            body = [line.rstrip() for line in lines]
+        else:
+            body = [line.rstrip() for line in lines if line.strip()]
+
+        return Block(header=span.header, body=body)
+
+    def is_loaded(self, header: str) -> bool:
+        return self._entries.get(header) is not None
+
+    def load_all(self) -> None:
+        for header in self._entries:
+            self[header]
+
+    # --------------------------------------------------------
+    # Dirty tracking
+    # --------------------------------------------------------
+    def span(self, header: str) -> Optional[BlockSpan]:
+        """Source byte range of a block, or None if it did not come from the file."""
+        return self._spans.get(header)
+
+    def is_dirty(self, header: str) -> bool:
+        return header in self._dirty or header not in self._spans
+
+    def mark_dirty(self, header: str) -> None:
+        if header not in self._entries:
+            raise KeyError(header)
+        self._dirty.add(header)
+
+    # --------------------------------------------------------
+    # MutableMapping protocol
+    # --------------------------------------------------------
+    def __getitem__(self, header: str) -> Block:
+        block = self._entries[header]
+        if block is None:
+            block = self._decode(self._spans[header])
+            self._entries[header] = block
+        return block
+
+    def __setitem__(self, header: str, block: Block) -> None:
+        self._entries[header] = block
+        self._dirty.add(header)
+
+    def __delitem__(self, header: str) -> None:
+        del self._entries[header]
+        self._spans.pop(header, None)
+        self._dirty.discard(header)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, header) -> bool:
+        return header in self._entries
+
+    def __repr__(self) -> str:
+        loaded = sum(b is not None for b in self._entries.values())
+        return (f"LazyBlocks({self.path!r}, {loaded}/{len(self)} loaded, "
+                f"{len(self._dirty)} dirty)")
+
 class ModelAdapter:
     def __init__(self, encoding: str = "utf-8"):
         self.encoding = encoding
 
-    def from_text(self, folder_path: Union[str, Path], model_name: str) -> Model:
+    def from_text(self, folder_path: Union[str, Path], model_name: str, lazy: bool = False) -> Model:
+        """
+        Read <folder_path>/<model_name>.MDL.
+
+        lazy=True only scans block headers; each block body is decoded the
+        first time `model.blocks[header]` is accessed.
+        """
         folder_path = Path(folder_path)
         path = folder_path / f"{model_name}.MDL"
 
+        if lazy:
+            blocks = LazyBlocks.scan(path, self.encoding)
+            return Model(path=str(path), blocks=blocks, encoding=self.encoding)
+
         blocks = {}
         current_block = None
         current_lines = []
@@ -77,26 +296,112 @@ class ModelAdapter:
 
         return Model(path=str(path), blocks=blocks, encoding=self.encoding)
 
+    @staticmethod
+    def _block_text(block: Block) -> str:
+        if block.header == "DESCRIPTION":
+            # 5 blank lines before DESCRIPTION content
+            return ("\n" * 5) + "\n".join(block.body)
+        if block.body:
+            return f"*{block.header}*\n" + "\n".join(block.body)
+        return f"*{block.header}*"
+
     def to_text(self, model: Model, folder_path: Union[str, Path], model_name: str) -> None:
         folder_path = Path(folder_path)
         path = folder_path / f"{model_name}.MDL"
 
-        block_texts = []
+        blocks = model.blocks
+        if isinstance(blocks, LazyBlocks) and blocks.encoding == self.encoding:
+            self._write_passthrough(blocks, path)
+            return
 
-        for block in model.blocks.values():
-            if block.header == "DESCRIPTION":
-                # 5 blank lines before DESCRIPTION content
-                block_text = ("\n" * 5) + "\n".join(block.body)
-            else:
-                if block.body:
-                    block_text = f"*{block.header}*\n" + "\n".join(block.body)
-                else:
-                    block_text = f"*{block.header}*"
-            block_texts.append(block_text)
+        block_texts = [self._block_text(block) for block in blocks.values()]
 
         text = "\n".join(block_texts).strip() + "\n"
         Path(path).write_text(text, encoding=self.encoding)
 
+    # --------------------------------------------------------
+    # Passthrough writer for lazily loaded models
+    # --------------------------------------------------------
+    def _write_passthrough(self, blocks: LazyBlocks, path: Path) -> None:
+        """
+        Copy runs of clean blocks byte-for-byte from the source file and
+        re-serialize only dirty ones. Writes through a temp file so the
+        source can safely be the target.
+        """
+        blocks.check_source()
+        onto_source = os.path.exists(path) and os.path.samefile(path, blocks.path)
+        if onto_source:
+            # the source is about to be replaced; keep the model usable
+            blocks.load_all()
+
+        # chunks: [kind, first_header, payload]; "copy" payload is a byte range
+        chunks: list = []
+        for header in blocks:
+            if blocks.is_dirty(header):
+                text = self._block_text(blocks[header]).lstrip("\n")
+                chunks.append(["text", header, text])
+                continue
+
+            span = blocks.span(header)
+            last = chunks[-1] if chunks else None
+            if last and last[0] == "copy" and last[2][1] == span.offset:
+                last[2] = (last[2][0], span.end)
+            else:
+                chunks.append(["copy", header, (span.offset, span.end)])
+
+        newline = blocks.newline.encode(self.encoding)
+        tmp_path = path.with_name(path.name + ".tmp")
+
+        with open(blocks.path, "rb") as src, open(tmp_path, "wb") as dst:
+            ends_with_newline = True
+            for i, (kind, header, payload) in enumerate(chunks):
+                if not ends_with_newline:
+                    dst.write(newline)
+
+                # 5 blank lines before DESCRIPTION; copied runs carry their own
+                if header == "DESCRIPTION" and i > 0 and chunks[i - 1][0] == "text":
+                    dst.write(newline * 5)
+
+                if kind == "copy":
+                    start, end = payload
+                    self._copy_range(src, dst, start, end - start)
+                    src.seek(end - 1)
+                    ends_with_newline = src.read(1) in (b"\n", b"\r")
+                else:
+                    text = payload.replace("\n", blocks.newline) + blocks.newline
+                    dst.write(text.encode(self.encoding))
+                    ends_with_newline = True
+
+        os.replace(tmp_path, path)
+        if onto_source:
+            blocks.reindex()
+
+    @staticmethod
+    def _copy_range(src, dst, offset: int, length: int, chunk: int = 1 << 20) -> None:
+        """Copy src[offset:offset+length] to dst, using sendfile where available."""
+        dst.flush()
+        if hasattr(os, "sendfile"):
+            try:
+                while length > 0:
+                    sent = os.sendfile(dst.fileno(), src.fileno(), offset, length)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    length -= sent
+                dst.seek(0, os.SEEK_END)
+                if length == 0:
+                    return
+            except OSError:
+                dst.seek(0, os.SEEK_END)
+
+        src.seek(offset)
+        while length > 0:
+            data = src.read(min(chunk, length))
+            if not data:
+                break
+            dst.write(data)
+            length -= len(data)
+
 class BlockAdapter:
     def __init__(self, encoding: str = "utf-8"):
         self.encoding = encoding
@@ -0,0 +1,121 @@
+import os
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from SANSPRO.model.model import Model, ModelAdapter
+from SANSPRO.model.cache import ModelCache
+
+class TemplateView:
+    """
+    Private copy of a parsed template.
+
+    The copy is unpickled from the repository snapshot on first access,
+    so model and collections keep their shared object references
+    (beam.start is nodes[...]) and are free to mutate.
+    """
+
+    def __init__(self, name: str, snapshot: bytes):
+        self.name = name
+        self._snapshot = snapshot
+        self._data: Optional[Tuple[Model, Dict[str, Any]]] = None
+
+    def _materialize(self) -> Tuple[Model, Dict[str, Any]]:
+        if self._data is None:
+            self._data = pickle.loads(self._snapshot)
+        return self._data
+
+    @property
+    def model(self) -> Model:
+        return self._materialize()[0]
+
+    @property
+    def collections(self) -> Dict[str, Any]:
+        return self._materialize()[1]
+
+    def __getitem__(self, key: str) -> Any:
+        return self.collections[key]
+
+    def __repr__(self) -> str:
+        state = "materialized" if self._data is not None else "pending"
+        return f"TemplateView({self.name!r}, {state})"
+
+class ModelRepository:
+    """
+    In-process LRU of parsed template models.
+
+    Each template is read (through `disk_cache` when given) and parsed
+    with `build(model) -> {name: collection}` once, then kept as a pickled
+    snapshot (`key` names the build in the disk cache). `get` hands out a
+    TemplateView per call, so a row of 15 units built from 3 templates
+    parses each template once.
+    """
+
+    def __init__(self,
+                 build: Callable[[Model], Dict[str, Any]],
+                 encoding: str = "utf-8",
+                 maxsize: int = 8,
+                 disk_cache: Optional[ModelCache] = None,
+                 key: str = "default"):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.build = build
+        self.encoding = encoding
+        self.maxsize = maxsize
+        self.disk_cache = disk_cache
+        self.key = key
+
+        # key → (source stamp, snapshot)
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], bytes]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(mdl_path: Path) -> str:
+        return os.path.normcase(str(mdl_path.resolve()))
+
+    def get(self, folder_path: Union[str, Path], model_name: str) -> TemplateView:
+        mdl_path = Path(folder_path) / f"{model_name}.MDL"
+        key = self._key(mdl_path)
+        stat = os.stat(mdl_path)
+        stamp = (stat.st_size, stat.st_mtime_ns)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == stamp:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return TemplateView(model_name, entry[1])
+
+        self.misses += 1
+        snapshot = self._load(folder_path, model_name)
+
+        self._entries[key] = (stamp, snapshot)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+        return TemplateView(model_name, snapshot)
+
+    def _load(self, folder_path: Union[str, Path], model_name: str) -> bytes:
+        if self.disk_cache is not None:
+            model, collections = self.disk_cache.load(folder_path, model_name,
+                                                       build=self.build, key=self.key)
+        else:
+            model = ModelAdapter(encoding=self.encoding).from_text(folder_path, model_name)
+            collections = self.build(model)
+
+        return pickle.dumps((model, collections), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def invalidate(self, folder_path: Union[str, Path], model_name: str) -> None:
+        self._entries.pop(self._key(Path(folder_path) / f"{model_name}.MDL"), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, mdl_path: Union[str, Path]) -> bool:
+        return self._key(Path(mdl_path)) in self._entries
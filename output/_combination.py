@@ -0,0 +1,128 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Literal, Optional, Tuple
+
+import numpy as np
+
+from SANSPRO.variable.loading import Loading
+from output._results import ResultArray
+
+ComboKind = Literal["factored", "unfactored"]
+
+@dataclass
+class CombinationMatrix:
+    """
+    Load combinations as a (combos, cases) factor matrix.
+
+    Row i holds the case factors of combination `combos[i]`; column j is
+    load case j (0-based, as PointLoad.load_case). `combine` goes from case
+    results to combination results with one matmul, `solve` goes back with
+    the pseudo-inverse (least squares, minimum norm, same cut-off as
+    np.linalg.lstsq), computed once per matrix.
+    """
+    combos: np.ndarray                  # (C,)
+    matrix: np.ndarray                  # (C, N)
+    _inverse: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+
+    @property
+    def n_cases(self) -> int:
+        return self.matrix.shape[1]
+
+    @property
+    def inverse(self) -> np.ndarray:
+        """(N, C) pseudo-inverse of the factor matrix."""
+        if self._inverse is None:
+            A = self.matrix
+            self._inverse = np.linalg.pinv(A, rcond=np.finfo(float).eps * max(A.shape))
+        return self._inverse
+
+    @staticmethod
+    def _apply(M: np.ndarray, values: np.ndarray) -> np.ndarray:
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape[0] != M.shape[1]:
+            raise ValueError(f"Expected {M.shape[1]} rows on axis 0, got {values.shape[0]}")
+        flat = values.reshape(values.shape[0], -1)
+        return (M @ flat).reshape((M.shape[0],) + values.shape[1:])
+
+    def combine(self, cases: np.ndarray) -> np.ndarray:
+        """(N, ...) case results -> (C, ...) combination results."""
+        return self._apply(self.matrix, cases)
+
+    def solve(self, combined: np.ndarray) -> np.ndarray:
+        """(C, ...) combination results, rows in `combos` order -> (N, ...) case results."""
+        return self._apply(self.inverse, combined)
+
+    # --------------------------------------------------------
+    # ResultArray
+    # --------------------------------------------------------
+    def rows_of(self, array: ResultArray) -> np.ndarray:
+        """Positions of `combos` in `array.combos`."""
+        position = {c: i for i, c in enumerate(np.asarray(array.combos).tolist())}
+        missing = [c for c in self.combos.tolist() if c not in position]
+        if missing:
+            raise ValueError(f"Results have no loading combination(s) {missing}")
+        return np.array([position[c] for c in self.combos.tolist()], dtype=np.int64)
+
+    def combine_array(self, cases: ResultArray) -> ResultArray:
+        """
+        Combination results from per-case results. `cases` rows are taken in
+        order as cases 0..N-1 (e.g. an .OUT run with one combination per case).
+        """
+        return ResultArray(
+            table=cases.table,
+            combos=self.combos.copy(),
+            ids=np.asarray(cases.ids),
+            values=self.combine(cases.values),
+        )
+
+    def solve_array(self, combined: ResultArray) -> ResultArray:
+        """Per-case results (`combos` = case index 0..N-1) from combination results."""
+        values = np.asarray(combined.values)[self.rows_of(combined)]
+        return ResultArray(
+            table=combined.table,
+            combos=np.arange(self.n_cases, dtype=np.int64),
+            ids=np.asarray(combined.ids),
+            values=self.solve(values),
+        )
+
+class CombinationEngine:
+    """
+    Build CombinationMatrix objects from Loading combination dicts.
+
+    `matrix(loading, kind)` caches the result on the Loading instance and
+    reuses it while `combo_factored` / `combo_unfactored` keep the same
+    content, so the pseudo-inverse is computed once per set of factors.
+    """
+
+    _CACHE_ATTR = "_combination_matrices"
+
+    @staticmethod
+    def from_dict(combos: Dict[int, List[float]]) -> CombinationMatrix:
+        combo_ids = sorted(combos)
+        rows = [combos[c] for c in combo_ids]
+        if len({len(r) for r in rows}) > 1:
+            raise ValueError("Load combinations have different numbers of load case factors")
+
+        n_cases = len(rows[0]) if rows else 0
+        matrix = np.array(rows, dtype=np.float64).reshape(len(rows), n_cases)
+        return CombinationMatrix(combos=np.asarray(combo_ids, dtype=np.int64), matrix=matrix)
+
+    @staticmethod
+    def _fingerprint(combos: Dict[int, List[float]]) -> Tuple:
+        return tuple((c, tuple(combos[c])) for c in sorted(combos))
+
+    @classmethod
+    def matrix(cls, loading: Loading, kind: ComboKind = "factored") -> CombinationMatrix:
+        if kind not in ("factored", "unfactored"):
+            raise ValueError(f"Unknown combination kind '{kind}'")
+
+        combos = getattr(loading, f"combo_{kind}")
+        key = cls._fingerprint(combos)
+
+        cache = loading.__dict__.setdefault(cls._CACHE_ATTR, {})
+        cached = cache.get(kind)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        matrix = cls.from_dict(combos)
+        cache[kind] = (key, matrix)
+        return matrix
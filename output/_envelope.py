@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from output._results import ResultArray, ResultTable, Results
+
+@dataclass
+class Envelope:
+    """
+    Per-entity extremes of one result table over a set of combinations.
+
+    Every value array is (E, K) in the order of `ids` and
+    `table.components`; each `*_combo` array holds the governing combination
+    number (-1 where an entity has no result in any selected combination).
+    `abs_max` keeps the sign of the governing value.
+    """
+    table: ResultTable
+    ids: np.ndarray
+    combos: np.ndarray
+    max: np.ndarray
+    max_combo: np.ndarray
+    min: np.ndarray
+    min_combo: np.ndarray
+    abs_max: np.ndarray
+    abs_max_combo: np.ndarray
+
+    KINDS = ("max", "min", "abs_max")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def component(self, name: str, kind: str = "abs_max") -> Tuple[np.ndarray, np.ndarray]:
+        """(values, governing combos) of one component, both (E,)."""
+        k = self.table.components.index(name)
+        return getattr(self, kind)[:, k], getattr(self, f"{kind}_combo")[:, k]
+
+class EnvelopeEngine:
+
+    @staticmethod
+    def _extreme(values: np.ndarray, fill: float, pick) -> Tuple[np.ndarray, np.ndarray]:
+        """Governing row position and validity along axis 0, NaN replaced by `fill`."""
+        filled = np.where(np.isnan(values), fill, values)
+        pos = pick(filled, axis=0)
+        found = ~np.isnan(np.take_along_axis(values, pos[None], axis=0)[0])
+        return pos, found
+
+    @classmethod
+    def compute(cls, array: ResultArray, combos: Optional[Iterable[int]] = None) -> Envelope:
+        """
+        Max, min and abs-max of every entity and component over all
+        combinations of `array`, or only `combos`. NaN (entity missing from
+        a combination) never governs.
+        """
+        if combos is not None:
+            array = array.select(combos)
+
+        values = np.asarray(array.values, dtype=np.float64)     # (C, E, K)
+        combo_ids = np.asarray(array.combos, dtype=np.int64)
+        n_entities, n_comp = values.shape[1], values.shape[2]
+
+        if len(combo_ids) == 0:
+            empty = np.full((n_entities, n_comp), np.nan)
+            none = np.full((n_entities, n_comp), -1, dtype=np.int64)
+            return Envelope(array.table, np.asarray(array.ids), combo_ids,
+                            empty, none, empty.copy(), none.copy(), empty.copy(), none.copy())
+
+        def governed(pos, found):
+            value = np.take_along_axis(values, pos[None], axis=0)[0]
+            combo = np.where(found, combo_ids[pos], -1)
+            return np.where(found, value, np.nan), combo
+
+        max_value, max_combo = governed(*cls._extreme(values, -np.inf, np.argmax))
+        min_value, min_combo = governed(*cls._extreme(values, np.inf, np.argmin))
+        abs_value, abs_combo = governed(*cls._extreme(np.abs(values), -np.inf, np.argmax))
+
+        return Envelope(
+            table=array.table,
+            ids=np.asarray(array.ids),
+            combos=combo_ids,
+            max=max_value, max_combo=max_combo,
+            min=min_value, min_combo=min_combo,
+            abs_max=abs_value, abs_max_combo=abs_combo,
+        )
+
+    @classmethod
+    def compute_all(cls,
+                    results: Results,
+                    combos: Optional[Iterable[int]] = None) -> Dict[str, Envelope]:
+        combos = None if combos is None else list(combos)
+        return {name: cls.compute(array, combos) for name, array in results.tables.items()}
@@ -0,0 +1,152 @@
+import mmap
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+@dataclass
+class OutSection:
+    """Byte ranges of one `Loading Combination` section of an .OUT file."""
+    combo: int
+    offset: int          # start of the `Loading Combination` line
+    end: int             # first byte after the section
+    # table name -> (body offset, end) of every header of that table in the section
+    tables: Dict[str, List[Tuple[int, int]]] = field(default_factory=dict)
+
+class OutIndex:
+    """
+    Byte-offset index of an .OUT file: one OutSection per loading
+    combination, with the position of every known table header inside it.
+
+    `scan` runs one precompiled regex over a memory map of the file, so
+    building the index never decodes a line. `tables` then decodes only the
+    bodies of the requested table and combinations. A table body runs from
+    the line after its header to the next header or section start; the
+    caller decides where the rows stop (`SUM =`, `---`, ...).
+    Only ASCII-compatible encodings (cp1252, utf-8, ...) are supported.
+    """
+
+    # table name -> header line pattern (after leading blanks); add a table
+    # only with the header and row layout of a real .OUT file
+    TABLES: Dict[str, bytes] = {
+        "support_reactions": rb"Joint[ \t]+Force-X[ \t]+Force-Y[ \t]+Force-Z",
+    }
+
+    _COMBO = rb"Loading Combination"
+
+    def __init__(self, path: Union[str, Path], encoding: str, sections: List[OutSection]):
+        self.path = str(path)
+        self.encoding = encoding
+        self.sections = sections
+
+        stat = os.stat(self.path)
+        self._source_stat = (stat.st_size, stat.st_mtime_ns)
+
+    @classmethod
+    def _event_pattern(cls) -> "re.Pattern[bytes]":
+        names = list(cls.TABLES)
+        alternatives = [rb"(?P<combo>" + cls._COMBO + rb")"]
+        alternatives += [
+            b"(?P<t%d>" % i + cls.TABLES[name] + b")" for i, name in enumerate(names)
+        ]
+        return re.compile(rb"^[ \t]*(?:" + b"|".join(alternatives) + rb")[^\r\n]*", re.M)
+
+    # --------------------------------------------------------
+    # Scan
+    # --------------------------------------------------------
+    @classmethod
+    def scan(cls, path: Union[str, Path], encoding: str = "utf-8") -> "OutIndex":
+        """Index every combination section and table header of an .OUT file."""
+        names = list(cls.TABLES)
+        pattern = cls._event_pattern()
+        sections: List[OutSection] = []
+
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return cls(path, encoding, sections)
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                current: Optional[OutSection] = None
+                open_table: Optional[Tuple[str, int]] = None
+
+                def close_table(end: int) -> None:
+                    if current is not None and open_table is not None:
+                        name, body = open_table
+                        current.tables.setdefault(name, []).append((body, end))
+
+                for m in pattern.finditer(data):
+                    start, stop = m.start(), m.end()
+                    next_line = data.find(b"\n", stop)
+                    next_line = size if next_line < 0 else next_line + 1
+
+                    close_table(start)
+                    open_table = None
+
+                    if m.group("combo") is not None:
+                        if current is not None:
+                            current.end = start
+                            sections.append(current)
+                        line = data[start:stop].decode(encoding, errors="replace")
+                        current = OutSection(int(line.split(":")[1].strip()), start, size)
+                        continue
+
+                    # headers before the first combination are not part of any section
+                    name = names[int(m.lastgroup[1:])]
+                    open_table = (name, next_line)
+
+                close_table(size)
+                if current is not None:
+                    current.end = size
+                    sections.append(current)
+
+        return cls(path, encoding, sections)
+
+    # --------------------------------------------------------
+    # Reading
+    # --------------------------------------------------------
+    def check_source(self) -> None:
+        stat = os.stat(self.path)
+        if (stat.st_size, stat.st_mtime_ns) != self._source_stat:
+            raise RuntimeError(f"{self.path} changed since it was indexed")
+
+    def combos(self) -> List[int]:
+        return [s.combo for s in self.sections]
+
+    def select(self, combos: Optional[Iterable[int]] = None) -> List[OutSection]:
+        """Sections in file order, restricted to `combos` when given."""
+        if combos is None:
+            return list(self.sections)
+        wanted = set(combos)
+        return [s for s in self.sections if s.combo in wanted]
+
+    def tables(self,
+               name: str,
+               combos: Optional[Iterable[int]] = None) -> Iterator[Tuple[OutSection, List[str]]]:
+        """
+        Yield (section, body texts) for every selected section, in file order.
+        Sections without the table yield an empty list.
+        """
+        if name not in self.TABLES:
+            raise KeyError(f"Unknown .OUT table '{name}'")
+
+        sections = self.select(combos)
+        if not sections:
+            return
+
+        self.check_source()
+        with open(self.path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for section in sections:
+                    bodies = [
+                        data[body:end].decode(self.encoding)
+                        for body, end in section.tables.get(name, ())
+                    ]
+                    yield section, bodies
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+    def __repr__(self) -> str:
+        return f"OutIndex({self.path!r}, {len(self.sections)} combinations)"
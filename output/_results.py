@@ -0,0 +1,195 @@
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from output._out_index import OutIndex
+
+@dataclass(frozen=True)
+class ResultTable:
+    """Row layout of one .OUT table: leading integer keys, then float components."""
+    name: str
+    keys: Tuple[str, ...]
+    components: Tuple[str, ...]
+
+    @property
+    def width(self) -> int:
+        return len(self.keys) + len(self.components)
+
+# header patterns live in OutIndex.TABLES under the same names; only the
+# support reaction layout is known from a real .OUT so far
+RESULT_TABLES: Dict[str, ResultTable] = {
+    t.name: t for t in (
+        ResultTable("support_reactions", ("node",), ("fx", "fy", "fz", "mx", "my", "mz")),
+    )
+}
+
+@dataclass
+class ResultArray:
+    """
+    One result table as a dense (combination, entity, component) array.
+
+    `combos` and `ids` map array positions back to combination numbers and
+    entity keys, one column per `table.keys` (the node id for support
+    reactions). Entities absent from a combination are NaN.
+    """
+    table: ResultTable
+    combos: np.ndarray               # (C,)
+    ids: np.ndarray                  # (E, len(table.keys))
+    values: np.ndarray               # (C, E, len(table.components))
+    _combo_pos: Dict[int, int] = field(init=False, repr=False, default_factory=dict)
+    _id_pos: Dict[Tuple[int, ...], int] = field(init=False, repr=False, default_factory=dict)
+
+    def __post_init__(self):
+        self._combo_pos = {c: i for i, c in enumerate(self.combos.tolist())}
+        self._id_pos = {tuple(k): i for i, k in enumerate(self.ids.tolist())}
+
+    @property
+    def components(self) -> Tuple[str, ...]:
+        return self.table.components
+
+    def combo_position(self, combo: int) -> int:
+        return self._combo_pos[combo]
+
+    def position(self, *key: int) -> int:
+        """Entity position for a key, given as the values of `table.keys`."""
+        return self._id_pos[tuple(key)]
+
+    def component(self, name: str) -> np.ndarray:
+        """(C, E) slice of one component."""
+        return self.values[:, :, self.table.components.index(name)]
+
+    def combo(self, combo: int) -> np.ndarray:
+        """(E, K) slice of one combination."""
+        return self.values[self._combo_pos[combo]]
+
+    def get(self, combo: int, *key: int) -> np.ndarray:
+        """(K,) components of one entity in one combination."""
+        return self.values[self._combo_pos[combo], self._id_pos[tuple(key)]]
+
+    def select(self, combos: Iterable[int]) -> "ResultArray":
+        """Copy restricted to `combos` (unknown ones are ignored), in array order."""
+        wanted = set(combos)
+        rows = [i for i, c in enumerate(self.combos.tolist()) if c in wanted]
+        return ResultArray(
+            table=self.table,
+            combos=self.combos[rows],
+            ids=np.asarray(self.ids),
+            values=self.values[rows],
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+@dataclass
+class Results:
+    path: str
+    tables: Dict[str, ResultArray] = field(default_factory=dict)
+
+    def get(self, name: str) -> Optional[ResultArray]:
+        return self.tables.get(name)
+
+    @property
+    def support_reactions(self) -> Optional[ResultArray]:
+        return self.tables.get("support_reactions")
+
+class ResultsParser:
+    """
+    Extract result tables of an .OUT file into ResultArrays.
+
+    Table bodies come from OutIndex, so only the requested tables and
+    combinations are decoded. Rows are the lines with exactly
+    `keys + components` fields, up to the first `SUM =` or `---` line,
+    the same rule SupportReactionsParser uses.
+    """
+
+    _STOP = re.compile(r"SUM =|---")
+
+    def __init__(self, encoding: str = "utf-8"):
+        self.encoding = encoding
+
+    def index(self, source: Union[str, Path, OutIndex]) -> OutIndex:
+        if isinstance(source, OutIndex):
+            return source
+        return OutIndex.scan(source, self.encoding)
+
+    @classmethod
+    def _rows(cls, body: str, width: int, out: List[List[str]]) -> None:
+        stop = cls._STOP.search(body)
+        if stop is not None:
+            body = body[:body.rfind("\n", 0, stop.start()) + 1]
+        out.extend(parts for parts in map(str.split, body.splitlines()) if len(parts) == width)
+
+    @staticmethod
+    def _numeric(parts: List[str]) -> bool:
+        try:
+            for p in parts:
+                float(p)
+        except ValueError:
+            return False
+        return True
+
+    def parse_table(self,
+                    index: OutIndex,
+                    table: Union[str, ResultTable],
+                    combos: Optional[Iterable[int]] = None) -> ResultArray:
+        table = RESULT_TABLES[table] if isinstance(table, str) else table
+        n_keys, n_comp = len(table.keys), len(table.components)
+
+        combo_ids: List[int] = []
+        combo_pos: Dict[int, int] = {}
+        rows: List[List[str]] = []
+        row_combo: List[int] = []
+
+        for section, bodies in index.tables(table.name, combos):
+            pos = combo_pos.setdefault(section.combo, len(combo_ids))
+            if pos == len(combo_ids):
+                combo_ids.append(section.combo)
+
+            start = len(rows)
+            for body in bodies:
+                self._rows(body, table.width, rows)
+            row_combo.extend([pos] * (len(rows) - start))
+
+        try:
+            raw = np.array(rows, dtype=np.float64)
+        except ValueError:
+            # a text line with the right field count: keep numeric rows only
+            keep = [i for i, r in enumerate(rows) if self._numeric(r)]
+            raw = np.array([rows[i] for i in keep], dtype=np.float64)
+            row_combo = [row_combo[i] for i in keep]
+        raw = raw.reshape(len(raw), table.width)
+        keys = raw[:, :n_keys].astype(np.int64)
+
+        # entities in order of first appearance
+        ids, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+        order = np.argsort(first, kind="stable")
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+
+        values = np.full((len(combo_ids), len(ids), n_comp), np.nan)
+        # later rows of the same (combination, entity) win, as in a dict
+        values[np.asarray(row_combo, dtype=np.int64), rank[inverse.reshape(-1)]] = raw[:, n_keys:]
+
+        return ResultArray(
+            table=table,
+            combos=np.asarray(combo_ids, dtype=np.int64),
+            ids=ids[order].reshape(len(ids), n_keys),
+            values=values,
+        )
+
+    def parse(self,
+              source: Union[str, Path, OutIndex],
+              tables: Optional[Sequence[str]] = None,
+              combos: Optional[Iterable[int]] = None) -> Results:
+        """Parse `tables` (default: every table in RESULT_TABLES)."""
+        index = self.index(source)
+        combos = None if combos is None else list(combos)
+        names = list(RESULT_TABLES) if tables is None else list(tables)
+
+        return Results(
+            path=index.path,
+            tables={name: self.parse_table(index, name, combos) for name in names},
+        )
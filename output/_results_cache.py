@@ -0,0 +1,214 @@
+import json
+import os
+import secrets
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence, Union
+
+import numpy as np
+
+from SANSPRO.model.cache import CacheStamp, file_digest
+from output._results import RESULT_TABLES, ResultArray, Results, ResultsParser
+
+class ResultsCache:
+    """
+    On-disk sidecar cache of parsed .OUT result arrays.
+
+    Every table parsed by ResultsParser is saved as plain .npy files in a
+    `<name>.OUT.results` folder next to the .OUT (or under `cache_dir`),
+    with a meta.json stamp of the source. While the .OUT keeps the same
+    path and size and either the same mtime or the same content hash, the
+    arrays are memory-mapped instead of parsed; otherwise they are rebuilt.
+
+    Tables are always cached for every combination; a `combos` filter is
+    applied to the loaded arrays. Memory-mapped values are read-only, copy
+    before editing in place.
+
+    Array files are never overwritten: every write goes to new versioned
+    names (`<table>.<version>.<part>.npy`) that meta.json then points to,
+    so arrays mapped from an earlier version stay valid. Files no longer
+    referenced are deleted afterwards where the OS allows it (an open
+    mapping blocks this on Windows) and retried on the next write.
+    """
+
+    FORMAT = 2
+    SUFFIX = ".results"
+    META = "meta.json"
+
+    def __init__(self,
+                 encoding: str = "utf-8",
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 verify_hash: bool = False,
+                 mmap: bool = True):
+        self.encoding = encoding
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.verify_hash = verify_hash
+        self.mmap_mode = "r" if mmap else None
+        self.parser = ResultsParser(encoding)
+
+    # --------------------------------------------------------
+    # Paths
+    # --------------------------------------------------------
+    def sidecar_path(self, out_path: Union[str, Path]) -> Path:
+        out_path = Path(out_path)
+        folder = self.cache_dir if self.cache_dir is not None else out_path.parent
+        return folder / f"{out_path.name}{self.SUFFIX}"
+
+    # --------------------------------------------------------
+    # Public API
+    # --------------------------------------------------------
+    def load(self,
+             out_path: Union[str, Path],
+             tables: Optional[Sequence[str]] = None,
+             combos: Optional[Iterable[int]] = None) -> Results:
+        """Drop-in for ResultsParser.parse(out_path, tables, combos) through the cache."""
+        out_path = Path(out_path)
+        names = list(RESULT_TABLES) if tables is None else list(tables)
+        sidecar = self.sidecar_path(out_path)
+
+        meta = self._read_meta(out_path)
+        if meta is None:
+            meta = {
+                "format": self.FORMAT,
+                "encoding": self.encoding,
+                "stamp": asdict(CacheStamp.of(out_path)),
+                "tables": {},
+            }
+            dirty = True
+        else:
+            # content matched but the file was touched: refresh the stamp
+            dirty = meta["stamp"]["mtime_ns"] != os.stat(out_path).st_mtime_ns
+
+        arrays: Dict[str, ResultArray] = {}
+        missing = []
+        for name in names:
+            array = self._read_table(sidecar, name, meta["tables"].get(name))
+            if array is None:
+                missing.append(name)
+            else:
+                arrays[name] = array
+
+        if missing:
+            # one index scan serves every table still to parse
+            index = self.parser.index(out_path)
+            sidecar.mkdir(parents=True, exist_ok=True)
+            version = secrets.token_hex(6)
+            for name in missing:
+                array = self.parser.parse_table(index, name)
+                meta["tables"][name] = self._write_table(sidecar, array, version)
+                arrays[name] = array
+            dirty = True
+
+        if dirty:
+            stamp = CacheStamp.of(out_path, digest=meta["stamp"]["digest"])
+            meta["stamp"] = asdict(stamp)
+            self._write_meta(sidecar, meta)
+            self._prune(sidecar, meta)
+
+        if combos is not None:
+            combos = list(combos)
+            arrays = {name: a.select(combos) for name, a in arrays.items()}
+
+        return Results(path=str(out_path), tables={name: arrays[name] for name in names})
+
+    def invalidate(self, out_path: Union[str, Path]) -> None:
+        sidecar = self.sidecar_path(out_path)
+        try:
+            os.remove(sidecar / self.META)
+        except FileNotFoundError:
+            return
+        self._prune(sidecar, None)
+
+    # --------------------------------------------------------
+    # Internals
+    # --------------------------------------------------------
+    def _is_fresh(self, stamp: CacheStamp, out_path: Path) -> bool:
+        stat = os.stat(out_path)
+        if stamp.path != str(out_path.resolve()) or stamp.size != stat.st_size:
+            return False
+
+        if stamp.mtime_ns == stat.st_mtime_ns and not self.verify_hash:
+            return True
+
+        return stamp.digest == file_digest(out_path)
+
+    def _read_meta(self, out_path: Path) -> Optional[dict]:
+        meta_path = self.sidecar_path(out_path) / self.META
+        if not meta_path.exists():
+            return None
+
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            stamp = CacheStamp(**meta["stamp"])
+        except Exception as e:
+            print(f"[ResultsCache][WARN] unreadable cache {meta_path} ({e}), rebuilding")
+            return None
+
+        if (meta.get("format") != self.FORMAT
+                or meta.get("encoding") != self.encoding
+                or not self._is_fresh(stamp, out_path)):
+            return None
+
+        return meta
+
+    def _write_meta(self, sidecar: Path, meta: dict) -> None:
+        sidecar.mkdir(parents=True, exist_ok=True)
+        tmp = sidecar / (self.META + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=1)
+        os.replace(tmp, sidecar / self.META)
+
+    @staticmethod
+    def _files(name: str, version: str) -> Dict[str, str]:
+        return {part: f"{name}.{version}.{part}.npy" for part in ("combos", "ids", "values")}
+
+    def _prune(self, sidecar: Path, meta: Optional[dict]) -> None:
+        """Delete array files `meta` does not reference (all of them for None)."""
+        live = set()
+        for name, info in (meta or {}).get("tables", {}).items():
+            live.update(self._files(name, info["version"]).values())
+
+        for path in sidecar.glob("*.npy"):
+            if path.name in live:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                # still mapped somewhere; the next write tries again
+                pass
+
+    def _read_table(self, sidecar: Path, name: str, info: Optional[dict]) -> Optional[ResultArray]:
+        table = RESULT_TABLES[name]
+        if (info is None
+                or "version" not in info
+                or info.get("keys") != list(table.keys)
+                or info.get("components") != list(table.components)):
+            return None
+
+        try:
+            arrays = {
+                part: np.load(sidecar / file, mmap_mode=self.mmap_mode)
+                for part, file in self._files(name, info["version"]).items()
+            }
+        except (OSError, ValueError) as e:
+            print(f"[ResultsCache][WARN] unreadable table '{name}' in {sidecar} ({e}), rebuilding")
+            return None
+
+        if list(arrays["values"].shape) != info.get("shape"):
+            return None
+
+        return ResultArray(table=table, **arrays)
+
+    def _write_table(self, sidecar: Path, array: ResultArray, version: str) -> dict:
+        # fresh names, so no file another mapping may hold is touched;
+        # nothing refers to them until meta.json is replaced
+        for part, file in self._files(array.table.name, version).items():
+            np.save(sidecar / file, np.ascontiguousarray(getattr(array, part)))
+
+        return {
+            "version": version,
+            "keys": list(array.table.keys),
+            "components": list(array.table.components),
+            "shape": list(array.values.shape),
+        }
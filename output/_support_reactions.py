@@ -2,12 +2,15 @@ import numpy as np
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from SANSPRO.object.node import Node
 from object.point_load import PointLoad
 from collection.point_loads import PointLoads
 from SANSPRO.collection.nodes import Nodes
+from output._out_index import OutIndex
+from output._results import ResultArray
+from output._combination import CombinationEngine, CombinationMatrix
 
 @dataclass
 class SupportReaction:
@@ -24,61 +27,119 @@ class SupportReactions:
     reactions: List[SupportReaction]
 
 class SupportReactionsParser:
+    """
+    Support reaction tables of an .OUT file, per loading combination.
+
+    Only the `Joint Force-X Force-Y Force-Z` tables located by OutIndex are
+    decoded. Pass an OutIndex as `source` to reuse one scan across queries,
+    and `combos` to read only some combinations. With `nodes=None` the
+    node ids are taken from the .OUT without checking them.
+    """
+
+    TABLE = "support_reactions"
+    _STOP = re.compile(r"SUM =|---")
+
     def __init__(self, encoding: str = "utf-8"):
         self.encoding = encoding
 
-    def parse(self, nodes: Nodes, source: Union[str, Path]) -> Dict[int, SupportReactions]:
-        path = Path(source)
+    def index(self, source: Union[str, Path, OutIndex]) -> OutIndex:
+        if isinstance(source, OutIndex):
+            return source
+        return OutIndex.scan(source, self.encoding)
+
+    def _rows(self, nodes: Optional[Nodes], body: str) -> Iterator[SupportReaction]:
+        for line in body.splitlines():
+            stripped = line.strip()
+            if not stripped:
+                continue
+            if self._STOP.search(stripped):
+                return
+
+            parts = stripped.split()
+            if len(parts) == 7:
+                node_id = int(parts[0])
+                if nodes is not None:
+                    node_id = nodes.get(node_id).index
+                fx, fy, fz, mx, my, mz = map(float, parts[1:])
+                yield SupportReaction(
+                    node_id=node_id,
+                    fx=fx, fy=fy, fz=fz,
+                    mx=mx, my=my, mz=mz,
+                )
+
+    def parse(self,
+              nodes: Optional[Nodes],
+              source: Union[str, Path, OutIndex],
+              combos: Optional[Iterable[int]] = None) -> Dict[int, SupportReactions]:
+        index = self.index(source)
         combo_outputs: Dict[int, SupportReactions] = {}
+        last = index.sections[-1] if index.sections else None
 
-        combo_index = None
-        reading = False
-        data: List[SupportReaction] = []
-
-        with open(path, 'r', encoding=self.encoding) as f:
-            for line in f:
-                stripped = line.strip()
-
-                if stripped.startswith("Loading Combination"):
-                    if combo_index is not None:
-                        combo_outputs[combo_index] = SupportReactions(reactions=data)
-                    combo_index = int(stripped.split(":")[1].strip())
-                    data = []
-                    reading = False
-
-                elif re.match(r"^Joint\s+Force-X\s+Force-Y\s+Force-Z", stripped):
-                    reading = True
-
-                elif "SUM =" in stripped or "---" in stripped:
-                    reading = False
-
-                elif reading and stripped:
-                    parts = re.split(r"\s+", stripped)
-                    if len(parts) == 7:
-                        node_idx = int(parts[0])
-                        node = nodes.get(node_idx)
-                        values = list(map(float, parts[1:]))
-                        reaction = SupportReaction(
-                            node_id=node.index,
-                            fx=values[0],
-                            fy=values[1],
-                            fz=values[2],
-                            mx=values[3],
-                            my=values[4],
-                            mz=values[5],
-                        )
-                        data.append(reaction)
-
-        if combo_index is not None and data:
-            combo_outputs[combo_index] = SupportReactions(reactions=data)
+        for section, bodies in index.tables(self.TABLE, combos):
+            data = [r for body in bodies for r in self._rows(nodes, body)]
+            # as before, a trailing combination without reactions is dropped
+            if data or section is not last:
+                combo_outputs[section.combo] = SupportReactions(reactions=data)
+
+        return combo_outputs
+
+    def from_array(self, nodes: Optional[Nodes], array: ResultArray) -> Dict[int, SupportReactions]:
+        """
+        Same mapping as `parse`, from a cached `support_reactions` ResultArray.
+        Reactions follow the array's node order.
+        """
+        combo_outputs: Dict[int, SupportReactions] = {}
+        node_ids = [node_id for (node_id,) in array.ids.tolist()]
+        if nodes is not None:
+            node_ids = [nodes.get(node_id).index for node_id in node_ids]
+        present = ~np.isnan(array.values).all(axis=2)
+        last = len(array.combos) - 1
+
+        for row, combo in enumerate(array.combos.tolist()):
+            data = [
+                SupportReaction(node_ids[e], *array.values[row, e].tolist())
+                for e in np.flatnonzero(present[row]).tolist()
+            ]
+            if data or row != last:
+                combo_outputs[combo] = SupportReactions(reactions=data)
 
         return combo_outputs
 
 class SupportReactionsEngine:
 
-    @staticmethod
+    COMPONENTS = ("fx", "fy", "fz", "mx", "my", "mz")
+
+    @classmethod
+    def reaction_array(cls,
+                       support_reactions_dict: Dict[int, SupportReactions],
+                       combo_ids: List[int]) -> Tuple[List[int], np.ndarray]:
+        """
+        Node ids (in the order of the first combination) and the
+        (combos, nodes, 6) array of their reactions.
+        """
+        node_ids = [r.node_id for r in support_reactions_dict[combo_ids[0]].reactions]
+        column = {node_id: i for i, node_id in enumerate(node_ids)}
+
+        values = np.empty((len(combo_ids), len(node_ids), len(cls.COMPONENTS)))
+        for row, combo_id in enumerate(combo_ids):
+            reactions = support_reactions_dict[combo_id].reactions
+            by_node = {r.node_id: r for r in reactions}
+            missing = set(column) - set(by_node)
+            if missing:
+                raise ValueError(
+                    f"Loading combination {combo_id} has no reaction for node(s) {sorted(missing)}"
+                )
+            values[row] = [
+                (r.fx, r.fy, r.fz, r.mx, r.my, r.mz)
+                for r in (by_node[node_id] for node_id in node_ids)
+            ]
+
+        return node_ids, values
+
+    @classmethod
     def convert_to_point_loads(
-        combo_factored: Dict[int, List[float]],
+        cls,
+        combo_factored: Union[Dict[int, List[float]], CombinationMatrix],
         support_reactions_dict: Dict[int, SupportReactions],
         floor: int = 0,
         misc: int = 1,
@@ -86,67 +147,37 @@ class SupportReactionsEngine:
     ) -> PointLoads:
         """
         Convert support reactions to point loads by solving for individual case reactions.
-        """
-        components = ["fx", "fy", "fz", "mx", "my", "mz"]
-        case_ids = list(range(len(next(iter(combo_factored.values())))))
-        combo_ids = sorted(combo_factored.keys())
-        
-        # Get node mapping once
-        node_map = {}
-        for reaction in support_reactions_dict[combo_ids[0]].reactions:
-            node_map[reaction.node_id] = reaction.node_id
-        
-        point_loads = []
-        index_counter = 1
-
-        # Process each node
-        for node_id, node_obj in node_map.items():
-            # Solve for all components of this node across all cases
-            node_case_data = {}  # case_id -> {component: value}
-            
-            for comp in components:
-                # Build matrix for this component
-                A = []
-                b = []
-                
-                for combo_id in combo_ids:
-                    A.append(combo_factored[combo_id])
-                    reaction = next(r for r in support_reactions_dict[combo_id].reactions 
-                                  if r.node_id == node_id)
-                    b.append(getattr(reaction, comp))
-                
-                # Solve for individual case values
-                A = np.array(A)
-                b = np.array(b)
-                x = np.linalg.lstsq(A, b, rcond=None)[0]
-                
-                # Store results for each case
-                for case_index, value in zip(case_ids, x):
-                    if case_index not in node_case_data:
-                        node_case_data[case_index] = {}
-                    node_case_data[case_index][comp] = value
-            
-            # Create PointLoad objects directly
-            for case_id, components_data in node_case_data.items():
-                if all(abs(components_data[comp]) < 1e-8 for comp in components):
-                    continue  # skip if all components are zero or near-zero
-
-                pl = PointLoad(
-                    index=index_counter,
-                    load_case=case_id,
-                    floor=floor,
-                    node_id=node_id,
-                    fx=-components_data["fx"],
-                    fy=-components_data["fy"],
-                    fz=-components_data["fz"],
-                    mx=-components_data["mx"],
-                    my=-components_data["my"],
-                    mz=-components_data["mz"],
-                    misc=misc,
-                    blast=blast
-                )
-                point_loads.append(pl)
-                index_counter += 1
 
-
-        return PointLoads(point_loads)
\ No newline at end of file
+        All nodes and components are solved at once: CombinationMatrix.solve
+        applies the pseudo-inverse of the (combos, cases) factor matrix to
+        the (combos, nodes, 6) reaction array. Pass
+        CombinationEngine.matrix(loading) to reuse the inverse cached on
+        the Loading.
+        """
+        if isinstance(combo_factored, dict):
+            combo_factored = CombinationEngine.from_dict(combo_factored)
+
+        node_ids, reactions = cls.reaction_array(support_reactions_dict, combo_factored.combos.tolist())
+
+        # (nodes, cases, 6): same node-major, case-minor order as before
+        cases = combo_factored.solve(reactions).transpose(1, 0, 2)
+        keep = (np.abs(cases) >= 1e-8).any(axis=2)  # skip all-zero loads
+        node_pos, case_pos = np.nonzero(keep)
+        values = (-cases[node_pos, case_pos]).tolist()
+
+        point_loads = [
+            PointLoad(
+                index=index,
+                load_case=case_id,
+                floor=floor,
+                node_id=node_ids[node],
+                fx=fx, fy=fy, fz=fz,
+                mx=mx, my=my, mz=mz,
+                misc=misc,
+                blast=blast
+            )
+            for index, (node, case_id, (fx, fy, fz, mx, my, mz))
+            in enumerate(zip(node_pos.tolist(), case_pos.tolist(), values), start=1)
+        ]
+
+        return PointLoads(point_loads)
@@ -1,20 +1,33 @@
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Union
+from typing import Dict, Iterable, Optional, Sequence, Union
 
-from SANSPRO.model.model import ModelAdapter
+from SANSPRO.model.model import Model, ModelAdapter
 from SANSPRO.collection.nodes import Nodes
 from SANSPRO.collection.nodes import NodesParse
 
 from output._support_reactions import SupportReactions, SupportReactionsParser
+from output._out_index import OutIndex
+from output._results import Results, ResultsParser
+from output._results_cache import ResultsCache
 
 
 
 @dataclass
 class Output:
+    """
+    Parsed results of one .OUT file.
+
+    `index` is the OutIndex scan the results were parsed from. It is None
+    when they came from a ResultsCache, which maps stored arrays and never
+    reads the .OUT; use OutIndex.scan(path, encoding) if the raw sections
+    are needed.
+    """
     path: str
     support_reactions: Dict[int, SupportReactions]
+    index: Optional[OutIndex] = None
+    results: Optional[Results] = None
 
     def get(self, combo_index: int) -> SupportReactions:
         return self.support_reactions.get(combo_index)
@@ -23,19 +36,62 @@ class Output:
         self.support_reactions[combo_index] = output
 
 class OutputAdapter:
-    def __init__(self, encoding: str = "utf-8"):
+    def __init__(self, encoding: str = "utf-8", cache: Optional[ResultsCache] = None):
         self.reaction_parser = SupportReactionsParser(encoding)
+        self.results_parser = ResultsParser(encoding)
+        self.cache = cache
+
+    def from_text(self,
+                  folder_path: Union[str, Path],
+                  model_name: str,
+                  combos: Optional[Iterable[int]] = None,
+                  tables: Optional[Sequence[str]] = None,
+                  *,
+                  nodes: Optional[Nodes] = None,
+                  model: Optional[Model] = None,
+                  resolve_nodes: bool = True) -> Output:
+        """
+        Support reactions per combination, plus the result arrays of
+        `tables` (names from RESULT_TABLES) when given.
 
-    def from_text(self, folder_path: Union[str, Path], model_name: str) -> Output:
+        With a ResultsCache, reactions and tables come from the cached
+        arrays (parsed once per .OUT version) and Output.index is None:
+        the .OUT is not scanned at all on a cache hit.
+
+        Reaction node ids are checked against `nodes`, else against the
+        nodes of `model`, else against NODEXY of <model_name>.MDL read
+        lazily (no other block is decoded). resolve_nodes=False skips the
+        check and keeps the raw integer ids from the .OUT.
+        """
 
         folder_path = Path(folder_path)
         output_path = folder_path / f"{model_name}.OUT"
 
-        model_adapter = ModelAdapter(encoding='cp1252')
-        model = model_adapter.from_text(folder_path, model_name)
+        if not resolve_nodes:
+            nodes = None
+        elif nodes is None:
+            if model is None:
+                model = ModelAdapter(encoding='cp1252').from_text(folder_path, model_name, lazy=True)
+            nodes = NodesParse.from_model(model)
+
+        combos = None if combos is None else list(combos)
 
-        nodes = NodesParse.from_model(model)
+        if self.cache is not None:
+            names = list(dict.fromkeys(["support_reactions", *(tables or [])]))
+            cached = self.cache.load(output_path, names)
+            parsed = self.reaction_parser.from_array(nodes, cached.support_reactions)
+            results = None
+            if combos is not None:
+                parsed = {c: parsed[c] for c in parsed if c in set(combos)}
+            if tables is not None:
+                results = Results(path=cached.path, tables={
+                    n: cached.tables[n] if combos is None else cached.tables[n].select(combos)
+                    for n in tables
+                })
+            return Output(path=output_path, support_reactions=parsed, results=results)
 
-        parsed = self.reaction_parser.parse(nodes, output_path)
+        index = self.reaction_parser.index(output_path)
+        parsed = self.reaction_parser.parse(nodes, index, combos=combos)
+        results = None if tables is None else self.results_parser.parse(index, tables, combos)
 
-        return Output(path=output_path, support_reactions=parsed)
+        return Output(path=output_path, support_reactions=parsed, index=index, results=results)
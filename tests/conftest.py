@@ -0,0 +1,16 @@
+import sys
+import types
+from pathlib import Path
+
+# The tools import the package as `SANSPRO.*` (with its parent folder on
+# sys.path) and some modules import siblings top-level (`object.*`,
+# `collection.*`). Make both work whatever the checkout folder is called.
+ROOT = Path(__file__).resolve().parent.parent
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+if "SANSPRO" not in sys.modules:
+    package = types.ModuleType("SANSPRO")
+    package.__path__ = [str(ROOT)]
+    sys.modules["SANSPRO"] = package
@@ -0,0 +1,79 @@
+from SANSPRO.object.node import Node
+from SANSPRO.object.beam import Beam
+from SANSPRO.collection.nodes import Nodes
+from SANSPRO.collection.beams import Beams, BeamsEngine
+
+def beam(n1, n2):
+    return Beam(index=0, start=n1, end=n2, elset=None, group=1, beam_type=0, misc="")
+
+def line_nodes(xs):
+    return Nodes([Node(index=i + 1, x=x, y=0.0, z=0.0) for i, x in enumerate(xs)])
+
+def test_replicate_adds_each_missing_beam_once():
+    nodes = line_nodes([0.0, 1.0, 2.0, 3.0])
+    n = nodes.get
+    base = Beams([beam(n(1), n(2))])
+
+    new = BeamsEngine.replicate(base, nodes, [beam(n(3), n(2))], nx=3, dx=1.0)
+
+    # 2-3 exists (reversed), 3-4 is new, the copy past node 4 has no nodes
+    assert [(b.start.index, b.end.index) for b in new.objects] == [(3, 4)]
+    assert all(b.start is n(b.start.index) and b.end is n(b.end.index) for b in new.objects)
+
+def test_replicate_duplicates_across_rounding_boundaries():
+    # 1.0000004 and 1.0000006 are the same node within tol but round apart
+    nodes = line_nodes([0.0000006, 1.0000004, 2.0000004])
+    n = nodes.get
+    base = Beams([beam(n(1), n(2))])
+    existing = [beam(Node(index=0, x=1.0000006, y=0.0, z=0.0), Node(index=0, x=2.0, y=0.0, z=0.0))]
+
+    assert BeamsEngine.replicate(base, nodes, existing, nx=1, dx=1.0).objects == []
+
+def scan_find(layout, s, e, tol, strict=False):
+    close = (lambda a, b: abs(a - b) < tol) if strict else (lambda a, b: abs(a - b) <= tol)
+    for b in layout.items:
+        p, q = (b.start.x, b.start.y, b.start.z), (b.end.x, b.end.y, b.end.z)
+        if all(map(close, p, s)) and all(map(close, q, e)) or all(map(close, p, e)) and all(map(close, q, s)):
+            return b
+    return None
+
+def test_find_beam_by_xyz_matches_scan():
+    import numpy as np
+    from SANSPRO.layout.beam_layout import BeamLayout, BeamLayouts, BeamLayoutsQuery
+    from SANSPRO.layout._layout_abstract import LayoutsQuery
+
+    rng = np.random.default_rng(5)
+    tol = BeamLayoutsQuery.TOL
+    # ends on a coarse grid, shifted by up to ~tol so keys straddle rounding boundaries
+    pts = rng.integers(0, 4, size=(120, 2, 3)) + rng.uniform(-1.5e-6, 1.5e-6, size=(120, 2, 3))
+    items = [beam(Node(index=0, x=s[0], y=s[1], z=s[2]), Node(index=0, x=e[0], y=e[1], z=e[2]))
+             for s, e in pts]
+    layouts = BeamLayouts([BeamLayout(index=1, items=items)])
+    layout = layouts.get(1)
+
+    near = pts[rng.integers(0, 120, 300)] + rng.uniform(-1.2e-6, 1.2e-6, size=(300, 2, 3))
+    near[::2] = near[::2, ::-1]
+    queries = np.concatenate([near, rng.integers(0, 4, size=(100, 2, 3)).astype(float)])
+
+    hits = 0
+    for s, e in queries:
+        found = BeamLayoutsQuery.find_beam_by_xyz(layouts, 1, *s, *e)
+        assert found is scan_find(layout, s, e, tol)
+        hits += found is not None
+
+        # node searches: ends strictly within tol, as the original scan
+        n1, n2 = Node(index=0, x=s[0], y=s[1], z=s[2]), Node(index=0, x=e[0], y=e[1], z=e[2])
+        expected = scan_find(layout, s, e, tol, strict=True)
+        for item, lay in (BeamLayoutsQuery.find_by_nodes(layouts, n1, n2),
+                          LayoutsQuery.find_item_by_nodes(layouts, n1, n2)):
+            assert item is expected and lay is (layout if expected is not None else None)
+    assert 50 < hits < 300
+
+    # 1.0000004 vs 1.0000006: within tol, different 6-digit keys
+    target = beam(Node(index=0, x=1.0000004, y=0, z=0), Node(index=0, x=2.0, y=0, z=0))
+    layout.add_item(target)
+    assert BeamLayoutsQuery.find_beam_by_xyz(layouts, 1, 1.9999996, 0, 0, 1.0000006, 5e-7, 0) is target
+
+    start, end = Node(index=0, x=1.0000006, y=5e-7, z=0), Node(index=0, x=1.9999996, y=0, z=0)
+    assert BeamLayoutsQuery.find_by_nodes(layouts, start, end)[0] is target
+    assert LayoutsQuery.find_item_by_nodes(layouts, end, start)[0] is target
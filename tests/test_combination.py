@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from SANSPRO.variable.loading import Loading
+from SANSPRO.output._results import RESULT_TABLES, ResultArray
+from SANSPRO.output._combination import CombinationEngine
+
+def loading(rng, n_combos=12, n_cases=4):
+    factors = rng.uniform(0, 1.6, size=(n_combos, n_cases)).round(2)
+    return Loading(combo_factored={c + 1: factors[c].tolist() for c in range(n_combos)})
+
+def test_combine_solve_round_trip():
+    rng = np.random.default_rng(1)
+    matrix = CombinationEngine.matrix(loading(rng))
+    cases = rng.uniform(-50, 50, size=(matrix.n_cases, 7, 6))
+
+    combined = matrix.combine(cases)
+    assert combined.shape == (12, 7, 6)
+    assert np.allclose(combined[0], np.tensordot(matrix.matrix[0], cases, axes=1))
+    assert np.allclose(matrix.solve(combined), cases, atol=1e-10)
+
+def test_solve_matches_lstsq_on_rank_deficient_matrix():
+    rng = np.random.default_rng(2)
+    load = loading(rng)
+    for row in load.combo_factored.values():
+        row[2] = 0.0                      # case 2 never appears
+    matrix = CombinationEngine.matrix(load)
+    combined = rng.uniform(-5, 5, size=(12, 6))
+
+    expected = np.linalg.lstsq(matrix.matrix, combined, rcond=None)[0]
+    assert np.allclose(matrix.solve(combined), expected, atol=1e-10)
+
+def test_result_array_round_trip_and_alignment():
+    rng = np.random.default_rng(3)
+    matrix = CombinationEngine.matrix(loading(rng))
+    ids = np.arange(1, 6).reshape(-1, 1)
+    cases = ResultArray(RESULT_TABLES["support_reactions"], np.arange(matrix.n_cases), ids,
+                        rng.uniform(-1, 1, size=(matrix.n_cases, 5, 6)))
+
+    combined = matrix.combine_array(cases)
+    # rows out of order in the results: solve aligns them by combination number
+    shuffled = ResultArray(combined.table, combined.combos[::-1], ids, combined.values[::-1])
+    back = matrix.solve_array(shuffled)
+
+    assert back.combos.tolist() == list(range(matrix.n_cases))
+    assert np.allclose(back.values, cases.values, atol=1e-10)
+
+    with pytest.raises(ValueError):
+        matrix.solve_array(combined.select([1, 2]))
+
+def test_matrix_cached_on_loading():
+    rng = np.random.default_rng(4)
+    load = loading(rng)
+    matrix = CombinationEngine.matrix(load)
+
+    assert CombinationEngine.matrix(load) is matrix
+    load.combo_factored[1][0] += 1.0      # edited in place
+    assert CombinationEngine.matrix(load) is not matrix
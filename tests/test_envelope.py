@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from openpyxl import load_workbook
+
+from SANSPRO.output._results import RESULT_TABLES, ResultArray
+from SANSPRO.output._envelope import EnvelopeEngine
+from SANSPRO.util.excel_export import export_envelopes_to_excel
+
+def reactions(values, combos):
+    values = np.asarray(values, dtype=float)
+    ids = np.arange(1, values.shape[1] + 1).reshape(-1, 1)
+    return ResultArray(RESULT_TABLES["support_reactions"], np.asarray(combos), ids, values)
+
+def test_envelope_governing_combos():
+    rng = np.random.default_rng(0)
+    values = rng.uniform(-10, 10, size=(5, 4, 6))
+    array = reactions(values, [11, 12, 13, 14, 15])
+
+    env = EnvelopeEngine.compute(array)
+
+    assert np.array_equal(env.max, values.max(axis=0))
+    assert np.array_equal(env.min, values.min(axis=0))
+    assert np.array_equal(env.max_combo, array.combos[values.argmax(axis=0)])
+    assert np.array_equal(env.min_combo, array.combos[values.argmin(axis=0)])
+    governing = np.abs(values).argmax(axis=0)
+    assert np.array_equal(env.abs_max, np.take_along_axis(values, governing[None], 0)[0])
+    assert np.array_equal(env.abs_max_combo, array.combos[governing])
+
+def test_envelope_ignores_nan():
+    values = np.zeros((3, 3, 6))
+    values[:, 0, 0] = [np.nan, -4.0, 2.0]     # NaN never governs
+    values[:, 1, 0] = [1.0, np.nan, -3.0]
+    values[:, 2, :] = np.nan                  # no result in any combination
+    env = EnvelopeEngine.compute(reactions(values, [1, 2, 3]))
+
+    assert env.max[0, 0] == 2.0 and env.max_combo[0, 0] == 3
+    assert env.min[0, 0] == -4.0 and env.min_combo[0, 0] == 2
+    assert env.abs_max[0, 0] == -4.0 and env.abs_max_combo[0, 0] == 2
+    assert env.abs_max[1, 0] == -3.0 and env.abs_max_combo[1, 0] == 3
+
+    for kind in ("max", "min", "abs_max"):
+        assert np.isnan(getattr(env, kind)[2]).all()
+        assert (getattr(env, f"{kind}_combo")[2] == -1).all()
+
+def test_envelope_combo_subset():
+    values = np.arange(3 * 2 * 6, dtype=float).reshape(3, 2, 6)
+    env = EnvelopeEngine.compute(reactions(values, [1, 2, 3]), combos=[1, 2])
+
+    assert env.combos.tolist() == [1, 2]
+    assert np.array_equal(env.max, values[1])
+    assert (env.max_combo == 2).all()
+
+def test_envelope_empty_selection():
+    env = EnvelopeEngine.compute(reactions(np.ones((2, 3, 6)), [1, 2]), combos=[9])
+    assert np.isnan(env.max).all() and (env.max_combo == -1).all()
+
+def test_envelope_excel_round_trip(tmp_path):
+    rng = np.random.default_rng(1)
+    values = rng.uniform(-10, 10, size=(4, 5, 6))
+    values[:, 3] = np.nan                     # node 4: no result anywhere
+    env = EnvelopeEngine.compute(reactions(values, [1, 2, 3, 4]))
+
+    # chunk=2 splits the 5 nodes over three blocks
+    export_envelopes_to_excel([("reactions", env), ("again", env)], tmp_path, "env", chunk=2)
+    wb = load_workbook(tmp_path / "env.xlsx", read_only=True)
+    assert wb.sheetnames == ["reactions", "again"]
+    rows = list(wb["reactions"].iter_rows(values_only=True))
+
+    headers = rows[0]
+    assert headers[:3] == ("node", "fx.max", "fx.max_combo")
+    assert len(headers) == 1 + 6 * 3 * 2
+    assert [row[0] for row in rows[1:]] == [1, 2, 3, 4, 5]
+
+    for e, row in enumerate(rows[1:]):
+        cell = dict(zip(headers, row))
+        for k, comp in enumerate(env.table.components):
+            for kind in env.KINDS:
+                value = getattr(env, kind)[e, k]
+                combo = getattr(env, f"{kind}_combo")[e, k]
+                assert cell[f"{comp}.{kind}_combo"] == combo
+                if np.isnan(value):
+                    assert cell[f"{comp}.{kind}"] is None
+                else:   # the xlsx keeps 15-16 significant digits
+                    assert cell[f"{comp}.{kind}"] == pytest.approx(value, rel=1e-14)
+    wb.close()
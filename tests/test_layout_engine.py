@@ -0,0 +1,97 @@
+import copy
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from SANSPRO.object.node import Node
+from SANSPRO.object.beam import Beam
+from SANSPRO.object.column import Column
+from SANSPRO.object.elset import Elset
+from SANSPRO.collection.nodes import Nodes
+from SANSPRO.layout.beam_layout import BeamLayout, BeamLayouts, BeamLayoutsEngine
+from SANSPRO.layout.column_layout import ColumnLayout, ColumnLayouts, ColumnLayoutsEngine
+
+ELSETS = [Elset(index=i, material=None, section=None, design=None, texture=None) for i in (1, 2)]
+
+def frame(floors=3):
+    """Two-bay frame on a 4 x 2 node grid, plus template layouts on copies of two nodes."""
+    nodes = Nodes([Node(index=i + 1, x=450.0 * (i % 4), y=600.0 * (i // 4), z=0.0) for i in range(8)])
+    n = nodes.get
+    beams, columns = [], []
+    for f in range(1, floors + 1):
+        beams.append(BeamLayout(index=f, items=[
+            Beam(index=1, start=n(1), end=n(2), elset=ELSETS[0], group=f, beam_type=0, misc="a"),
+            # template beam on node copies: normalization rebinds it
+            Beam(index=2, start=copy.copy(n(5)), end=copy.copy(n(6)), elset=ELSETS[1], group=f, beam_type=1, misc="b"),
+        ]))
+        columns.append(ColumnLayout(index=f, items=[
+            Column(index=1, location=n(1), elset=ELSETS[0], group=f, alpha=0, misc="c"),
+            Column(index=2, location=copy.copy(n(6)), elset=ELSETS[1], group=f, alpha=90, misc="d"),
+        ]))
+    return nodes, BeamLayouts(beams), ColumnLayouts(columns)
+
+def dump(layouts, attrs):
+    return [[tuple(getattr(it, a) for a in attrs) for it in lay.items] for lay in layouts.layouts]
+
+BEAM = ("index", "start", "end", "elset", "group", "beam_type", "misc")
+COLUMN = ("index", "location", "elset", "group", "alpha", "misc")
+
+def run(executor):
+    nodes, beams, columns = frame()
+    out = {
+        "beams_replicate": dump(BeamLayoutsEngine.replicate(
+            beams, beams, nodes=nodes, nx=2, dx=450.0, executor=executor), BEAM),
+        "beams_mirror": dump(BeamLayoutsEngine.mirror(
+            beams, beams, nodes=nodes, x1=675.0, y1=0.0, x2=675.0, y2=1.0, executor=executor), BEAM),
+        "columns_replicate": dump(ColumnLayoutsEngine.replicate(
+            columns, columns, nodes=nodes, nx=2, dx=450.0, executor=executor), COLUMN),
+        "columns_mirror": dump(ColumnLayoutsEngine.mirror(
+            columns, columns, nodes=nodes, x1=675.0, y1=0.0, x2=675.0, y2=1.0, executor=executor), COLUMN),
+        "sources": dump(beams, BEAM) + dump(columns, COLUMN),
+    }
+    # Node/Elset references are compared by identity within the run
+    ids = {id(o): ("node", o.index) for o in nodes.objects}
+    ids.update((id(e), ("elset", e.index)) for e in ELSETS)
+
+    def norm(v):
+        return ids.get(id(v), ("other", type(v).__name__)) if hasattr(v, "__dict__") else v
+
+    return {k: [[tuple(map(norm, it)) for it in lay] for lay in v] for k, v in out.items()}
+
+@pytest.mark.parametrize("make_executor", [
+    lambda: ThreadPoolExecutor(max_workers=2),
+    lambda: ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("fork")),
+], ids=["threads", "processes"])
+def test_executor_matches_sequential(make_executor):
+    expected = run(None)
+    assert all(expected[k] for k in expected)
+    assert ("other", "Node") not in {v for k in expected for lay in expected[k] for it in lay for v in it}
+
+    with make_executor() as executor:
+        assert run(executor) == expected
+
+class RecordingPool(ProcessPoolExecutor):
+    def map(self, fn, *iterables, **kwargs):
+        iterables = [list(it) for it in iterables]
+        self.tasks = iterables[-1]
+        return super().map(fn, *iterables, **kwargs)
+
+def test_process_tasks_share_one_node_table():
+    nodes, beams, _ = frame()
+    # a large table, none of it referenced by the layouts
+    nodes.extend([Node(index=100 + i, x=float(i), y=-50.0, z=0.0) for i in range(5000)])
+
+    with RecordingPool(max_workers=2, mp_context=multiprocessing.get_context("fork")) as executor:
+        BeamLayoutsEngine.replicate(beams, beams, nodes=nodes, nx=2, dx=450.0, executor=executor)
+
+    assert len(executor.tasks) == 3
+    for task in executor.tasks:
+        assert not any(isinstance(v, np.ndarray) for v in task.values())
+        assert len(pickle.dumps(task)) < 20000
+    # the shared blocks are gone once apply returns
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=executor.tasks[0]["xyz"][0])
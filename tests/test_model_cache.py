@@ -0,0 +1,57 @@
+import pickle
+
+from SANSPRO.model import cache as model_cache
+from SANSPRO.model.cache import ModelCache, build_fingerprint
+from tests.test_model_io import SAMPLE, write
+
+def node_count(model):
+    return len(model.blocks["NODEXY"].body)
+
+def header_count(model):
+    return len(model.blocks)
+
+def test_collections_reused_for_same_build(tmp_path):
+    write(tmp_path, "sample", SAMPLE)
+    calls = []
+
+    def build(model):
+        calls.append(1)
+        return node_count(model)
+
+    cache = ModelCache("cp1252")
+    assert cache.load(tmp_path, "sample", build=build, key="fixed")[1] == 4
+    assert cache.load(tmp_path, "sample", build=build, key="fixed")[1] == 4
+    assert len(calls) == 1
+
+def test_changed_build_invalidates_fixed_key(tmp_path):
+    write(tmp_path, "sample", SAMPLE)
+    cache = ModelCache("cp1252")
+
+    assert build_fingerprint(node_count) != build_fingerprint(header_count)
+    assert cache.load(tmp_path, "sample", build=node_count, key="fixed")[1] == 4
+    assert cache.load(tmp_path, "sample", build=header_count, key="fixed")[1] == 8
+
+def test_package_change_invalidates_entry(tmp_path, monkeypatch):
+    write(tmp_path, "sample", SAMPLE)
+    cache = ModelCache("cp1252")
+    cache.load(tmp_path, "sample")
+
+    sidecar = cache.sidecar_path(tmp_path / "sample.MDL")
+    assert cache._read_entry(tmp_path / "sample.MDL") is not None
+
+    monkeypatch.setattr(model_cache, "package_version", lambda: "other")
+    assert cache._read_entry(tmp_path / "sample.MDL") is None
+
+    cache.load(tmp_path, "sample")
+    with open(sidecar, "rb") as f:
+        assert pickle.load(f).version == "other"
+
+def test_unreadable_cache_is_reported(tmp_path, capsys):
+    write(tmp_path, "sample", SAMPLE)
+    cache = ModelCache("cp1252")
+    cache.sidecar_path(tmp_path / "sample.MDL").write_bytes(b"not a pickle")
+
+    model, _ = cache.load(tmp_path, "sample")
+
+    assert node_count(model) == 4
+    assert "[ModelCache][WARN] unreadable cache" in capsys.readouterr().out
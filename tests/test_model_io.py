@@ -0,0 +1,129 @@
+from SANSPRO.model.model import Block, LazyBlocks, ModelAdapter
+
+SAMPLE = """\
+*BUILDING*
+  Number of Layout Node   = 4
+
+  Number of Beam   Layout  = 1
+*PARAMETER*
+  Number of 2D Node             = 4
+*NODEXY*
+   1  0 0  0
+
+   2  450 0  0
+   3  450 600  0
+   4  0 600  0
+*EMPTY*
+
+
+
+
+<DESCRIPTION>
+sample model
+
+*NOT A HEADER*
+<END>
+*LAYBEAM*
+  FLOOR BEAM LAYOUT #1, Total Beam = 2
+    1   2  1  1 0 x y z
+    2   3  1  1 0 x y z
+*MDIAPHTAB*
+1 TOWER 0 0 0
+1 DIAPH 0 0 0
+*LAST*
+a
+"""
+
+# junk before the first header and a repeated header: the repeat keeps the
+# first position and takes the later body
+IRREGULAR = "junk before\n" + SAMPLE + "*NODEXY*\n   1  0 0  0\n*LAST*\nb\n"
+
+def write(tmp_path, name, text, newline="\r\n"):
+    path = tmp_path / f"{name}.MDL"
+    path.write_bytes(text.replace("\n", newline).encode("cp1252"))
+    return path
+
+def blocks_of(model):
+    return [(h, model.blocks[h].header, list(model.blocks[h].body)) for h in model.blocks]
+
+def test_lazy_parse_matches_eager(tmp_path):
+    adapter = ModelAdapter("cp1252")
+    for name, text in (("sample", SAMPLE), ("irregular", IRREGULAR)):
+        for newline in ("\r\n", "\n"):
+            write(tmp_path, name, text, newline)
+            eager = adapter.from_text(tmp_path, name)
+            lazy = adapter.from_text(tmp_path, name, lazy=True)
+
+            assert isinstance(lazy.blocks, LazyBlocks)
+            assert blocks_of(lazy) == blocks_of(eager)
+
+def test_lazy_blocks_decode_on_access(tmp_path):
+    write(tmp_path, "sample", SAMPLE)
+    model = ModelAdapter("cp1252").from_text(tmp_path, "sample", lazy=True)
+
+    assert not model.blocks.is_loaded("NODEXY")
+    assert model.blocks["NODEXY"].body[1].split() == ["2", "450", "0", "0"]
+    assert model.blocks.is_loaded("NODEXY")
+    assert not model.blocks.is_loaded("LAYBEAM")
+
+def test_passthrough_is_byte_identical(tmp_path):
+    source = write(tmp_path, "sample", SAMPLE)
+    adapter = ModelAdapter("cp1252")
+
+    model = adapter.from_text(tmp_path, "sample", lazy=True)
+    model.blocks["LAYBEAM"]  # decoded but clean
+    adapter.to_text(model, tmp_path, "copy")
+
+    assert (tmp_path / "copy.MDL").read_bytes() == source.read_bytes()
+
+def test_passthrough_rewrites_only_dirty_blocks(tmp_path):
+    write(tmp_path, "sample", SAMPLE)
+    adapter = ModelAdapter("cp1252")
+
+    lazy = adapter.from_text(tmp_path, "sample", lazy=True)
+    lazy.blocks["NODEXY"] = Block("NODEXY", ["   1  0 0  0", "   2  900 0  0"])
+    adapter.to_text(lazy, tmp_path, "edited")
+
+    eager = adapter.from_text(tmp_path, "sample")
+    eager.blocks["NODEXY"] = Block("NODEXY", ["   1  0 0  0", "   2  900 0  0"])
+    expected = blocks_of(eager)
+
+    assert blocks_of(adapter.from_text(tmp_path, "edited")) == expected
+
+    # every clean block is still the exact source text
+    written = (tmp_path / "edited.MDL").read_bytes()
+    for header in ("LAYBEAM", "MDIAPHTAB", "DESCRIPTION"):
+        span = lazy.blocks.span(header)
+        with open(lazy.blocks.path, "rb") as f:
+            f.seek(span.offset)
+            assert f.read(span.length) in written
+
+def test_passthrough_keeps_source_line_endings(tmp_path):
+    adapter = ModelAdapter("cp1252")
+    for newline in ("\r\n", "\n"):
+        write(tmp_path, "sample", SAMPLE, newline)
+        model = adapter.from_text(tmp_path, "sample", lazy=True)
+        model.blocks["NODEXY"] = Block("NODEXY", ["   1  0 0  0", "   2  900 0  0"])
+        adapter.to_text(model, tmp_path, "edited")
+
+        written = (tmp_path / "edited.MDL").read_bytes()
+        assert written.count(b"\n") == written.count(newline.encode())
+
+def test_passthrough_onto_source_stays_usable(tmp_path):
+    source = write(tmp_path, "sample", SAMPLE)
+    adapter = ModelAdapter("cp1252")
+
+    model = adapter.from_text(tmp_path, "sample", lazy=True)
+    model.blocks["NODEXY"] = Block("NODEXY", ["   1  0 0  0", "   2  900 0  0"])
+    adapter.to_text(model, tmp_path, "sample")
+
+    blocks = model.blocks
+    assert not any(blocks.is_dirty(h) for h in blocks)
+    blocks.check_source()
+    assert blocks_of(model) == blocks_of(adapter.from_text(tmp_path, "sample"))
+
+    # a second save (and any later copy) runs against the rewritten source
+    first = source.read_bytes()
+    adapter.to_text(model, tmp_path, "sample")
+    adapter.to_text(model, tmp_path, "copy")
+    assert source.read_bytes() == first == (tmp_path / "copy.MDL").read_bytes()
@@ -0,0 +1,60 @@
+from SANSPRO.object.node import Node
+from SANSPRO.model.model import Block
+from SANSPRO.model.repository import ModelRepository
+from SANSPRO.collection.nodes import NodesParse
+from tests.test_model_io import SAMPLE, write
+
+def build(model):
+    return {"nodes": NodesParse.from_model(model)}
+
+def test_views_are_isolated(tmp_path):
+    write(tmp_path, "sample", SAMPLE)
+    repo = ModelRepository(build, encoding="cp1252")
+
+    first = repo.get(tmp_path, "sample")
+    first["nodes"].get(2).x = 999.0
+    first["nodes"].add(Node(index=5, x=1.0, y=1.0, z=0.0))
+    first.model.blocks["NODEXY"] = Block("NODEXY", ["   1  0 0  0"])
+
+    second = repo.get(tmp_path, "sample")
+    assert (repo.hits, repo.misses) == (1, 1)
+    assert [(n.index, n.x) for n in second["nodes"]] == [(1, 0.0), (2, 450.0), (3, 450.0), (4, 0.0)]
+    assert [line.split()[0] for line in second.model.blocks["NODEXY"].body] == ["1", "2", "3", "4"]
+
+    # the snapshot itself is untouched: a third view still sees the source
+    third = repo.get(tmp_path, "sample")
+    assert third["nodes"].get(2).x == 450.0 and len(third["nodes"].objects) == 4
+
+def test_views_keep_shared_references(tmp_path):
+    write(tmp_path, "sample", SAMPLE)
+    repo = ModelRepository(build, encoding="cp1252")
+    view = repo.get(tmp_path, "sample")
+    assert view.collections is view.collections
+    assert view["nodes"].get(1) is view["nodes"].objects[0]
+
+def test_lru_evicts_least_recently_used(tmp_path):
+    for name in ("a", "b", "c"):
+        write(tmp_path, name, SAMPLE)
+    repo = ModelRepository(build, encoding="cp1252", maxsize=2)
+
+    repo.get(tmp_path, "a")
+    repo.get(tmp_path, "b")
+    repo.get(tmp_path, "a")          # a is now the most recent
+    repo.get(tmp_path, "c")          # evicts b
+
+    assert len(repo) == 2
+    assert tmp_path / "a.MDL" in repo and tmp_path / "c.MDL" in repo
+    assert tmp_path / "b.MDL" not in repo
+
+    repo.get(tmp_path, "b")
+    assert (repo.hits, repo.misses) == (1, 4)
+    assert tmp_path / "a.MDL" not in repo
+
+def test_changed_source_is_reloaded(tmp_path):
+    write(tmp_path, "sample", SAMPLE)
+    repo = ModelRepository(build, encoding="cp1252")
+    repo.get(tmp_path, "sample")
+
+    write(tmp_path, "sample", SAMPLE.replace("2  450 0  0", "2  460 0  0"))
+    assert repo.get(tmp_path, "sample")["nodes"].get(2).x == 460.0
+    assert (repo.hits, repo.misses) == (0, 2)
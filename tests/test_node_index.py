@@ -0,0 +1,175 @@
+import numpy as np
+import pytest
+
+from SANSPRO.object.node import Node
+from SANSPRO.object.beam import Beam
+from SANSPRO.object.column import Column
+from SANSPRO.object.point_load import PointLoad
+from SANSPRO.object.diaphargm import Diaphragm
+from SANSPRO.collection.nodes import Nodes, NodesEngine
+from SANSPRO.collection.node_index import NodeIndex
+from SANSPRO.collection.point_loads import PointLoads
+from SANSPRO.collection.diaphragms import Diaphragms
+from SANSPRO.layout.beam_layout import BeamLayout, BeamLayouts
+from SANSPRO.layout.column_layout import ColumnLayout, ColumnLayouts
+
+def brute_find(nodes, x, y, z, tol):
+    for n in nodes:
+        if abs(n.x - x) < tol and abs(n.y - y) < tol and abs(n.z - z) < tol:
+            return n
+    return None
+
+def test_find_matches_linear_scan():
+    rng = np.random.default_rng(3)
+    tol = 0.5
+    xyz = rng.integers(0, 5, size=(200, 3)) + rng.uniform(-0.3, 0.3, size=(200, 3))
+    nodes = [Node(index=i + 1, x=x, y=y, z=z) for i, (x, y, z) in enumerate(xyz.tolist())]
+    index = NodeIndex(nodes, tol=tol)
+    queries = np.vstack([xyz + rng.uniform(-0.45, 0.45, size=xyz.shape), rng.uniform(-2, 7, size=(200, 3))])
+
+    for x, y, z in queries.tolist():
+        assert index.find(x, y, z) is brute_find(nodes, x, y, z, tol)
+
+def test_find_across_cell_boundaries_keeps_first_added():
+    nodes = [Node(index=1, x=1.0000004, y=0.0, z=0.0),
+             Node(index=2, x=5.0, y=5.0, z=5.0),
+             Node(index=3, x=5.0, y=5.0, z=5.0)]
+    index = NodeIndex(nodes[:1])
+    index.extend(nodes[1:], np.array([(n.x, n.y, n.z) for n in nodes[1:]]))
+
+    assert index.find(1.0000006, 0.0, 0.0) is nodes[0]
+    assert index.find(5.0, 5.0, 5.0 - 5e-7) is nodes[1]
+    assert index.find(5.0, 5.0, 5.0 + 2e-6) is None
+    assert len(index) == 3
+
+def brute_first(points, targets, tol):
+    out = []
+    for p in points:
+        hits = np.flatnonzero(np.all(np.abs(targets - p) < tol, axis=1))
+        out.append(hits[0] if len(hits) else -1)
+    return np.array(out, dtype=np.int64)
+
+def test_match_first_matches_linear_scan():
+    rng = np.random.default_rng(7)
+    tol = 0.5
+    targets = rng.integers(0, 6, size=(300, 3)).astype(float) + rng.uniform(-0.3, 0.3, size=(300, 3))
+    points = np.vstack([
+        targets[rng.integers(0, 300, 200)] + rng.uniform(-0.45, 0.45, size=(200, 3)),
+        rng.uniform(-2, 8, size=(200, 3)),
+    ])
+
+    assert np.array_equal(NodeIndex.match_first(points, targets, tol), brute_first(points, targets, tol))
+
+def test_match_first_across_cell_boundaries():
+    tol = 1e-6
+    targets = np.array([[1.0000004, 0.0, 0.0], [5.0, 5.0, 5.0], [5.0, 5.0, 5.0]])
+    points = np.array([[1.0000006, 0.0, 0.0], [5.0, 5.0, 5.0 + 2e-6], [5.0, 5.0, 5.0 - 5e-7]])
+
+    assert NodeIndex.match_first(points, targets, tol).tolist() == [0, -1, 1]
+
+def test_match_first_agrees_with_find():
+    nodes = [Node(index=i + 1, x=float(i % 5), y=float(i // 5), z=0.0) for i in range(25)]
+    nodes.append(Node(index=26, x=2.0, y=2.0, z=0.0))  # duplicate of #13, added later
+    index = NodeIndex(nodes)
+    xyz = np.array([(n.x, n.y, n.z) for n in nodes])
+
+    first = NodeIndex.match_first(xyz, xyz)
+    assert [nodes[i] for i in first] == [index.find_node(n) for n in nodes]
+    assert first[25] == 12
+
+def make_frame():
+    """Two bays; nodes 5 and 6 duplicate 2 and 3 within tol."""
+    coords = [(0, 0), (450, 0), (900, 0), (0, 600), (450 + 4e-7, 0), (900, -3e-7)]
+    nodes = Nodes([Node(index=i + 1, x=float(x), y=float(y), z=0.0) for i, (x, y) in enumerate(coords)])
+    n = nodes.get
+    beams = BeamLayouts([BeamLayout(index=1, items=[
+        Beam(index=1, start=n(1), end=n(2), elset=None, group=1, beam_type=0, misc=""),
+        Beam(index=2, start=n(5), end=n(6), elset=None, group=1, beam_type=0, misc=""),
+        Beam(index=3, start=n(1), end=n(4), elset=None, group=1, beam_type=0, misc=""),
+    ])])
+    columns = ColumnLayouts([ColumnLayout(index=1, items=[
+        Column(index=1, location=n(6), elset=None, group=1, alpha=0, misc=""),
+    ])])
+    loads = PointLoads([
+        PointLoad(index=1, load_case=0, floor=0, node_id=6, fx=0, fy=0, fz=-1, mx=0, my=0, mz=0),
+        PointLoad(index=2, load_case=0, floor=0, node_id=4, fx=0, fy=0, fz=-2, mx=0, my=0, mz=0),
+    ])
+    return nodes, beams, columns, loads
+
+def test_weld_merges_and_rewires():
+    nodes, beams, columns, loads = make_frame()
+    welded, merged = NodesEngine.weld(
+        nodes, beam_layouts=beams, column_layouts=columns, point_loads=loads, return_map=True,
+    )
+
+    assert [(n.index, n.x, n.y) for n in welded] == [(1, 0, 0), (2, 450, 0), (3, 900, 0), (4, 0, 600)]
+    assert {k: v.index for k, v in merged.items()} == {5: 2, 6: 3}
+
+    members = {id(n) for n in welded}
+    beam_ends = [(b.start.index, b.end.index) for b in beams.walk_items()]
+    assert beam_ends == [(1, 2), (2, 3), (1, 4)]
+    assert all(id(b.start) in members and id(b.end) in members for b in beams.walk_items())
+
+    assert [c.location.index for c in columns.walk_items()] == [3]
+    assert [pl.node_id for pl in loads.objects] == [3, 4]
+
+def test_weld_keeps_distinct_nodes():
+    nodes = Nodes([Node(index=i + 1, x=float(i), y=0.0, z=0.0) for i in range(4)])
+    welded = NodesEngine.weld(nodes)
+    assert [n.index for n in welded] == [1, 2, 3, 4]
+
+def test_weld_rejects_unknown_point_load_node():
+    nodes, beams, columns, loads = make_frame()
+    loads.objects[1].node_id = 99
+
+    with pytest.raises(ValueError, match="99"):
+        NodesEngine.weld(nodes, beam_layouts=beams, point_loads=loads)
+
+    # nothing was touched
+    assert [n.index for n in nodes] == [1, 2, 3, 4, 5, 6]
+    assert [(b.start.index, b.end.index) for b in beams.walk_items()] == [(1, 2), (5, 6), (1, 4)]
+    assert [pl.node_id for pl in loads.objects] == [6, 99]
+
+def test_weld_remaps_diaphragms():
+    nodes, *_ = make_frame()
+    diaphragms = Diaphragms([
+        Diaphragm(index=i, tower_data=[f"t{i}"], diaph_data=[f"d{i}"]) for i in (4, 6, 3, 5)
+    ])
+
+    NodesEngine.weld(nodes, diaphragms=diaphragms)
+
+    # 6 merges into 3 and 5 into 2: a survivor's own entry wins
+    assert [(d.index, d.tower_data[0]) for d in diaphragms.objects] == [(2, "t5"), (3, "t3"), (4, "t4")]
+    assert diaphragms.get(3).tower_data == ["t3"]
+
+def test_weld_rejects_unknown_diaphragm_node():
+    # node 4 is numbered 10, so entry 4 has no node but falls inside the
+    # 1..4 numbering of the welded nodes
+    nodes, beams, *_ = make_frame()
+    nodes.objects[3].index = 10
+    nodes.rebuild()
+    diaphragms = Diaphragms([Diaphragm(index=i, tower_data=[], diaph_data=[]) for i in (2, 4)])
+
+    with pytest.raises(ValueError, match=r"\[4\]"):
+        NodesEngine.weld(nodes, beam_layouts=beams, diaphragms=diaphragms)
+
+    assert [n.index for n in nodes] == [1, 2, 3, 10, 5, 6]
+    assert [d.index for d in diaphragms.objects] == [2, 4]
+
+def test_weld_rewires_foreign_nodes_by_position():
+    nodes, beams, columns, _ = make_frame()
+    stray = Node(index=2, x=0.0, y=600.0, z=0.0)       # index of node 2, position of node 4
+    lone = Node(index=1, x=77.0, y=77.0, z=0.0)        # index of node 1, no node there
+    copy = Node(index=99, x=900.0, y=0.0, z=0.0)       # copy of node 3
+    columns.layouts[0].items += [
+        Column(index=2, location=stray, elset=None, group=1, alpha=0, misc=""),
+        Column(index=3, location=lone, elset=None, group=1, alpha=0, misc=""),
+        Column(index=4, location=copy, elset=None, group=1, alpha=0, misc=""),
+    ]
+
+    welded = NodesEngine.weld(nodes, beam_layouts=beams, column_layouts=columns)
+
+    locations = [c.location for c in columns.walk_items()]
+    assert locations[1] is welded.get(4)
+    assert locations[2] is lone and lone.index == 1
+    assert locations[3] is welded.get(3)
@@ -0,0 +1,147 @@
+import pickle
+
+import numpy as np
+
+from SANSPRO.object.node import Node
+from SANSPRO.collection.node_array import NodeArray
+from SANSPRO.collection.nodes import Nodes, NodeQuery, NodesEngine
+
+def columnar(n=4):
+    return Nodes.from_array(NodeArray.from_arrays(range(1, n + 1), np.arange(3 * n).reshape(n, 3)))
+
+def test_columns_follow_mutators():
+    nodes = columnar()
+    assert nodes.is_columnar
+
+    # same list, same length: only the mutators can tell the cache
+    nodes.remove(nodes.objects[-1])
+    nodes.add(Node(index=9, x=1.0, y=2.0, z=3.0))
+    assert not nodes.is_columnar
+    assert nodes.indices().tolist() == [1, 2, 3, 9]
+
+    nodes.remove(nodes.get(9))
+    assert nodes.is_columnar
+    assert nodes.coords().tolist() == [[0, 1, 2], [3, 4, 5], [6, 7, 8]]
+
+def test_columns_after_direct_edit():
+    nodes = columnar()
+    nodes.objects[0] = Node(index=7, x=0.0, y=0.0, z=0.0)
+    nodes.invalidate_columns()
+    assert not nodes.is_columnar
+    assert nodes.indices().tolist() == [7, 2, 3, 4]
+
+def test_node_view_behaves_like_node():
+    nodes = columnar(2)
+    view = nodes.objects[1]
+    view.x = 10.0
+    assert nodes.coords()[1].tolist() == [10.0, 4.0, 5.0]
+    assert (view.index, view.x, view.y, view.z) == (2, 10.0, 4.0, 5.0)
+    assert isinstance(view, Node)
+
+    copy = pickle.loads(pickle.dumps(nodes))
+    assert [(n.index, n.x, n.y, n.z) for n in copy] == [(n.index, n.x, n.y, n.z) for n in nodes]
+    assert copy.is_columnar
+
+def replicate_reference(base, copy, nx, ny, dx, dy, tol=1e-6):
+    """The original loop: copies are checked against the base nodes only."""
+    result = list(base)
+    node_map = {n.index: [n] for n in copy}
+    next_index = max(n.index for n in base) + 1
+    for n in copy:
+        for ix in range(nx + 1):
+            for iy in range(ny + 1):
+                if ix == 0 and iy == 0:
+                    continue
+                x, y = n.x + ix * dx, n.y + iy * dy
+                if any(abs(b.x - x) < tol and abs(b.y - y) < tol and abs(b.z - n.z) < tol for b in base):
+                    continue
+                created = Node(index=next_index, x=x, y=y, z=n.z)
+                result.append(created)
+                node_map[n.index].append(created)
+                next_index += 1
+    return result, node_map
+
+def grid_nodes(cols, rows, start=1):
+    return [Node(index=start + j * cols + i, x=float(i), y=float(j), z=0.0)
+            for j in range(rows) for i in range(cols)]
+
+def xyz(n):
+    return (n.x, n.y, n.z)
+
+def test_replicate_distinct_copies_match_reference():
+    base = grid_nodes(3, 2)
+    ref_nodes, ref_map = replicate_reference(base, base, 2, 1, 10.0, 20.0)
+
+    for make in (lambda: Nodes(list(base)), lambda: Nodes(list(base)).to_columnar()):
+        nodes = make()
+        result, node_map = NodesEngine.replicate(nodes, nodes, nx=2, ny=1, dx=10.0, dy=20.0, return_map=True)
+
+        assert [(n.index, *xyz(n)) for n in result] == [(n.index, *xyz(n)) for n in ref_nodes]
+        assert {k: [(n.index, *xyz(n)) for n in v] for k, v in node_map.items()} == \
+               {k: [(n.index, *xyz(n)) for n in v] for k, v in ref_map.items()}
+
+def test_replicate_overlapping_copies_keep_every_offset_in_map():
+    # the two bottom rows of a 6 x 4 grid, copied one step at a time along x
+    # and once up by 4: copies of neighbouring nodes land on each other
+    base = grid_nodes(6, 4)
+    source = base[:12]
+    ref_nodes, ref_map = replicate_reference(base, source, 3, 1, 1.0, 4.0)
+    positions = list(dict.fromkeys(xyz(n) for n in ref_nodes[24:]))
+    assert len(ref_nodes) - 24 > len(positions)
+
+    nodes = Nodes(list(base))
+    result, node_map = NodesEngine.replicate(nodes, Nodes(source), nx=3, ny=1, dx=1.0, dy=4.0, return_map=True)
+    new = result.objects[24:]
+
+    # one node per distinct position, numbered in first-appearance order
+    assert [(n.index, *xyz(n)) for n in new] == [(25 + i, *p) for i, p in enumerate(positions)]
+
+    # same map shape as before; each entry is the node now at that place
+    at = {xyz(n): n for n in result}
+    for k, ref in ref_map.items():
+        assert node_map[k][0] is nodes.get(k)
+        assert len(node_map[k]) == len(ref)
+        assert all(n is at[xyz(r)] for n, r in zip(node_map[k], ref))
+
+    # (0, 0) + (1, 4) and (1, 0) + (0, 4) are one node in both maps
+    assert node_map[1][2] is node_map[2][1] is at[(1.0, 4.0, 0.0)]
+
+def scalar_inside(x, y, polygon):
+    """The original per-node test, boundary included."""
+    inside = False
+    j = len(polygon) - 1
+    for i in range(len(polygon)):
+        (xi, yi), (xj, yj) = polygon[i], polygon[j]
+        cross = (y - yi) * (xj - xi) - (x - xi) * (yj - yi)
+        if abs(cross) <= 1e-8 and (x - xi) * (x - xj) + (y - yi) * (y - yj) <= 0:
+            return True
+        if ((yi > y) != (yj > y)) and (x < (xj - xi) * (y - yi) / (yj - yi + 1e-12) + xi):
+            inside = not inside
+        j = i
+    return inside
+
+def test_polygon_masks_match_scalar_test():
+    rng = np.random.default_rng(11)
+    corners = [(0, 0), (6, 0), (6, 2), (2, 2), (2, 5), (0, 5),     # L shape, 1..6
+               (3, 3), (7, 4), (4.5, 6.5)]                           # triangle, 7..9
+    nodes = [Node(index=i + 1, x=float(x), y=float(y), z=0.0) for i, (x, y) in enumerate(corners)]
+
+    # random points, points on every edge and on the corners again
+    polygons = [[1, 2, 3, 4, 5, 6], [7, 8, 9], [9, 8, 7, 3], [1, 2], [1, 2, 99]]
+    pts = [tuple(p) for p in rng.uniform(-1, 8, size=(400, 2)).tolist()]
+    for ring in polygons[:2]:
+        for a, b in zip(ring, ring[1:] + ring[:1]):
+            (x1, y1), (x2, y2) = corners[a - 1], corners[b - 1]
+            pts += [(x1 + t * (x2 - x1), y1 + t * (y2 - y1)) for t in (0.0, 0.25, 0.5, 1.0)]
+    nodes += [Node(index=100 + i, x=x, y=y, z=0.0) for i, (x, y) in enumerate(pts)]
+
+    for collection in (Nodes(nodes), Nodes(nodes).to_columnar()):
+        selected = NodeQuery.select_by_polygons(collection, polygons)
+        for ring, got in zip(polygons, selected):
+            coords = [corners[i - 1] for i in ring if i <= len(corners)]
+            expected = [n.index for n in nodes if len(coords) >= 3 and scalar_inside(n.x, n.y, coords)]
+            assert got.tolist() == expected
+            assert [n.index for n in NodeQuery.select_by_polygon(collection, ring).objects] == expected
+
+    on_edges = NodeQuery.polygon_masks(Nodes(nodes), polygons[:1])[0][len(corners) + 400:]
+    assert on_edges[:24].all()
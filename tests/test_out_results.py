@@ -0,0 +1,167 @@
+import re
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from SANSPRO.output._out_index import OutIndex
+from SANSPRO.output._results import RESULT_TABLES, ResultsParser
+from SANSPRO.output._results_cache import ResultsCache
+from SANSPRO.model.model import ModelAdapter
+from SANSPRO.collection.nodes import NodesParse
+from SANSPRO.output._support_reactions import SupportReactionsParser
+from SANSPRO.output.output import OutputAdapter
+from tests.test_model_io import write
+
+FIXTURE = Path(__file__).parent / "fixtures" / "support_reactions.OUT"
+
+def reference(path):
+    """The original line-by-line reader of support reaction tables."""
+    out, combo, reading, data = {}, None, False, []
+    with open(path, "r", encoding="cp1252") as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped.startswith("Loading Combination"):
+                if combo is not None:
+                    out[combo] = data
+                combo, data, reading = int(stripped.split(":")[1].strip()), [], False
+            elif re.match(r"^Joint\s+Force-X\s+Force-Y\s+Force-Z", stripped):
+                reading = True
+            elif "SUM =" in stripped or "---" in stripped:
+                reading = False
+            elif reading and stripped:
+                parts = re.split(r"\s+", stripped)
+                if len(parts) == 7:
+                    data.append((int(parts[0]), *map(float, parts[1:])))
+    if combo is not None and data:
+        out[combo] = data
+    return out
+
+def test_only_verified_tables_are_indexed():
+    assert list(RESULT_TABLES) == ["support_reactions"] == list(OutIndex.TABLES)
+
+def test_support_reactions_parser_matches_reference():
+    expected = reference(FIXTURE)
+    assert sorted(expected) == [1, 2, 3, 4] and expected[3] == []
+    assert expected[2][2] == (7, 0.0, -5.0, 410.25, 0.0, 0.0, 0.04)
+
+    parsed = SupportReactionsParser("cp1252").parse(None, FIXTURE)
+    assert {c: [(r.node_id, r.fx, r.fy, r.fz, r.mx, r.my, r.mz) for r in s.reactions]
+            for c, s in parsed.items()} == expected
+
+def test_result_array_matches_reference():
+    expected = reference(FIXTURE)
+    array = ResultsParser("cp1252").parse(FIXTURE).support_reactions
+
+    assert array.combos.tolist() == sorted(expected)
+    assert array.ids.ravel().tolist() == [1, 2, 7]
+    for combo in array.combos.tolist():
+        for node, *values in expected[combo]:
+            assert array.get(combo, node).tolist() == values
+    # a combination without a table is kept, with no result for any node
+    assert np.isnan(array.values[array.combo_position(3)]).all()
+    assert array.component("fz")[array.combo_position(4)].tolist() == [150.0, 150.0, 300.0]
+
+def test_cached_arrays_match_parse(tmp_path):
+    out = tmp_path / FIXTURE.name
+    out.write_bytes(FIXTURE.read_bytes())
+    parsed = ResultsParser("cp1252").parse(out).support_reactions
+
+    cache = ResultsCache("cp1252")
+    for _ in range(2):   # build, then memory-map
+        cached = cache.load(out).support_reactions
+        assert np.array_equal(cached.values, parsed.values, equal_nan=True)
+        assert np.array_equal(cached.ids, parsed.ids)
+        assert np.array_equal(cached.combos, parsed.combos)
+
+def test_cache_rewrite_keeps_mapped_arrays(tmp_path):
+    out = tmp_path / FIXTURE.name
+    out.write_bytes(FIXTURE.read_bytes())
+    cache = ResultsCache("cp1252")
+
+    first = cache.load(out).support_reactions
+    before = np.array(first.values)
+
+    # an edited .OUT is parsed again into new files; the old mapping still reads
+    out.write_bytes(FIXTURE.read_bytes().replace(b"152.375", b"999.000"))
+    second = cache.load(out).support_reactions
+
+    assert second.get(1, 1)[2] == 999.0
+    assert np.array_equal(first.values, before, equal_nan=True)
+    assert len(list(cache.sidecar_path(out).glob("*.npy"))) == 3
+
+    cache.invalidate(out)
+    assert not list(cache.sidecar_path(out).iterdir())
+    assert cache.load(out).support_reactions.get(1, 1)[2] == 999.0
+
+def test_unreadable_cache_is_reported(tmp_path, capsys):
+    out = tmp_path / FIXTURE.name
+    out.write_bytes(FIXTURE.read_bytes())
+    cache = ResultsCache("cp1252")
+    cache.load(out)
+    (cache.sidecar_path(out) / ResultsCache.META).write_text("{not json", encoding="utf-8")
+
+    array = cache.load(out).support_reactions
+
+    assert "[ResultsCache][WARN] unreadable cache" in capsys.readouterr().out
+    assert array.get(1, 1)[2] == 152.375
+
+MDL = """\
+*PARAMETER*
+  Number of 2D Node             = 3
+*NODEXY*
+   1  0 0  0
+   2  450 0  0
+   7  450 600  0
+*LAST*
+a
+"""
+
+def copy_fixture(folder, name="frame"):
+    folder.mkdir(exist_ok=True)
+    (folder / f"{name}.OUT").write_bytes(FIXTURE.read_bytes())
+
+def rows(output):
+    return {c: [(r.node_id, r.fx, r.fy, r.fz, r.mx, r.my, r.mz) for r in s.reactions]
+            for c, s in output.support_reactions.items()}
+
+def test_output_adapter_resolves_nodes_from_the_model_file(tmp_path):
+    copy_fixture(tmp_path)
+    write(tmp_path, "frame", MDL)
+
+    output = OutputAdapter("cp1252").from_text(tmp_path, "frame", combos=[1, 2])
+
+    assert rows(output) == {c: v for c, v in reference(FIXTURE).items() if c in (1, 2)}
+    assert output.index is not None and output.results is None
+
+def test_output_adapter_takes_nodes_or_model_without_reading_the_mdl(tmp_path):
+    copy_fixture(tmp_path / "out")
+    model = ModelAdapter("cp1252").from_text(write(tmp_path, "frame", MDL).parent, "frame", lazy=True)
+    expected = reference(FIXTURE)
+
+    adapter = OutputAdapter("cp1252")
+    # no frame.MDL next to the .OUT: reading it would fail
+    assert rows(adapter.from_text(tmp_path / "out", "frame", nodes=NodesParse.from_model(model))) == expected
+    assert rows(adapter.from_text(tmp_path / "out", "frame", model=model)) == expected
+    assert rows(adapter.from_text(tmp_path / "out", "frame", resolve_nodes=False)) == expected
+
+    with pytest.raises(FileNotFoundError):
+        adapter.from_text(tmp_path / "out", "frame")
+
+def test_output_adapter_cache_matches_uncached(tmp_path):
+    copy_fixture(tmp_path)
+    write(tmp_path, "frame", MDL)
+    plain = OutputAdapter("cp1252")
+    cached = OutputAdapter("cp1252", cache=ResultsCache("cp1252"))
+
+    for combos in (None, [2, 4]):
+        expected = plain.from_text(tmp_path, "frame", combos, tables=["support_reactions"])
+        for _ in range(2):   # build, then memory-map
+            output = cached.from_text(tmp_path, "frame", combos, tables=["support_reactions"])
+            assert output.index is None
+            assert rows(output) == rows(expected)
+            got = output.results.support_reactions
+            want = expected.results.support_reactions
+            assert np.array_equal(got.combos, want.combos)
+            assert np.array_equal(got.ids, want.ids)
+            assert np.array_equal(got.values, want.values, equal_nan=True)
@@ -0,0 +1,180 @@
+import copy
+from collections import OrderedDict
+
+import pytest
+
+from SANSPRO.model.model import Model, ModelAdapter
+from SANSPRO.object.node import Node
+from SANSPRO.object.beam import Beam
+from SANSPRO.object.column import Column
+from SANSPRO.object.elset import Elset
+from SANSPRO.object.beam_load import BeamLoad, FrameLoadTable
+from SANSPRO.collection.elsets import Elsets
+from SANSPRO.collection.nodes import Nodes, NodesEngine, NodesParse, NodesAdapter
+from SANSPRO.collection.beam_loads import (
+    BeamLoads, BeamLoadEngine, BeamLoadsParse, BeamLoadsAdapter,
+    FrameLoadTables, FrameLoadTablesAdapter,
+)
+from SANSPRO.layout.beam_layout import (
+    BeamLayout, BeamLayouts, BeamLayoutsEngine, BeamLayoutsParse, BeamLayoutsAdapter,
+)
+from SANSPRO.layout.column_layout import (
+    ColumnLayout, ColumnLayouts, ColumnLayoutsEngine, ColumnLayoutsParse, ColumnLayoutsAdapter,
+)
+from SANSPRO.layout.transform import TransformEngine
+from SANSPRO.layout.plan import TransformPlan, PlanEngine, MirrorOp, ReplicateOp
+from SANSPRO.util.geometry import mirror_matrix
+
+ELSETS = Elsets([Elset(index=1, material=None, section=None, design=None, texture=None)])
+LOAD_TABLE = FrameLoadTable(index=1, load_type=4, q=1.0, s1=0.0, s2=0.0, misc=(0, 0), note="DL")
+
+# a row of five shop units: (template, mirrored about its own axis)
+UNITS = [("T1", True), ("T1", False), ("T2", True), ("T2", False), ("T1", True)]
+AXIS = (225.0, 0.0, 225.0, 1.0)
+STEP = 450.0
+
+def write_unit(folder, name, xs, ys, floors=2):
+    """Grid of nodes with beams along both axes, a column on every node and loads on every other beam."""
+    nodes = Nodes([Node(index=i + 1, x=float(x), y=float(y), z=0.0)
+                   for i, (x, y) in enumerate((x, y) for x in xs for y in ys)])
+    at = {(n.x, n.y): n for n in nodes}
+    elset = ELSETS.get(1)
+
+    beam_layouts, column_layouts = [], []
+    for f in range(1, floors + 1):
+        beams = []
+        for (x, y), n in at.items():
+            for other in (at.get((next((v for v in xs if v > x), None), y)),
+                          at.get((x, next((v for v in ys if v > y), None)))):
+                if other is not None:
+                    beams.append(Beam(index=len(beams) + 1, start=n, end=other, elset=elset,
+                                      group=f, beam_type=0, misc=""))
+        beam_layouts.append(BeamLayout(index=f, items=beams))
+        column_layouts.append(ColumnLayout(index=f, items=[
+            Column(index=i + 1, location=n, elset=elset, group=1, alpha=0, misc="")
+            for i, n in enumerate(nodes)
+        ]))
+
+    loads = BeamLoads([
+        BeamLoad(index=k + 1, load_case=1 + k % 2, floor=lay.index, beam_id=b.index, load=LOAD_TABLE)
+        for k, (lay, b) in enumerate((lay, b) for lay in beam_layouts for b in lay.items[::2])
+    ])
+
+    blocks = OrderedDict()
+    for adapter, collection in (
+        (NodesAdapter, nodes),
+        (BeamLayoutsAdapter, BeamLayouts(beam_layouts)),
+        (ColumnLayoutsAdapter, ColumnLayouts(column_layouts)),
+        (FrameLoadTablesAdapter, FrameLoadTables([LOAD_TABLE])),
+        (BeamLoadsAdapter, loads),
+    ):
+        block = adapter.to_block(collection)
+        blocks[block.header] = block
+    ModelAdapter("cp1252").to_text(Model(path="", blocks=blocks, encoding="cp1252"), folder, name)
+
+def read_unit(folder, name):
+    model = ModelAdapter("cp1252").from_text(folder, name)
+    nodes = NodesParse.from_model(model)
+    return {
+        "nodes": nodes,
+        "beam_layouts": BeamLayoutsParse.from_model(model, nodes, ELSETS),
+        "column_layouts": ColumnLayoutsParse.from_model(model, nodes, ELSETS),
+        "beam_loads": BeamLoadsParse.from_model(model),
+    }
+
+@pytest.fixture(scope="module")
+def models(tmp_path_factory):
+    folder = tmp_path_factory.mktemp("mdl")
+    write_unit(folder, "BASE", [0, 150, 450], [0, 300, 600])
+    write_unit(folder, "T1", [0, 150, 450], [0, 300, 600])
+    write_unit(folder, "T2", [0, 200, 450], [0, 300, 600, 900])
+    return lambda name: read_unit(folder, name)
+
+def legacy(models):
+    """Unit by unit through the replicate/mirror engines, as the tools did before PlanEngine."""
+    base = models("BASE")
+    nodes, beams, columns, loads = base["nodes"], base["beam_layouts"], base["column_layouts"], base["beam_loads"]
+    templates = {name: models(name) for name in ("T1", "T2")}
+
+    for i, (name, mirrored) in enumerate(UNITS):
+        t = copy.deepcopy(templates[name])
+        t_nodes, t_beams, t_columns, t_loads = t["nodes"], t["beam_layouts"], t["column_layouts"], t["beam_loads"]
+        if mirrored:
+            m = TransformEngine.apply(mirror_matrix(*AXIS), nodes=t_nodes, beam_layouts=t_beams,
+                                      column_layouts=t_columns, beam_loads=t_loads,
+                                      include_original=False, policy="skip")
+            t_nodes, t_beams, t_columns, t_loads = m.nodes, m.beam_layouts, m.column_layouts, m.beam_loads
+
+        dx = STEP * (i + 1)
+        new_nodes = NodesEngine.replicate(base_collection=nodes, collection_to_copy=t_nodes, nx=1, dx=dx)
+        new_beams = BeamLayoutsEngine.replicate(base_layouts=beams, layouts_to_copy=t_beams,
+                                                nodes=new_nodes, nx=1, dx=dx, include_original=True)
+        columns = ColumnLayoutsEngine.replicate(base_layouts=columns, layouts_to_copy=t_columns,
+                                                nodes=new_nodes, nx=1, dx=dx, include_original=True)
+        loads = BeamLoadEngine.replicate(base_loads=loads, loads_to_copy=t_loads, layouts_original=t_beams,
+                                         layouts_final=new_beams, nodes=new_nodes, nx=1, dx=dx,
+                                         include_original=True, policy="skip")
+        nodes, beams = new_nodes, new_beams
+
+    return nodes, beams, columns, loads
+
+def planned(models):
+    base = models("BASE")
+    plan = TransformPlan()
+    for i, (name, mirrored) in enumerate(UNITS):
+        ops = [MirrorOp(*AXIS)] if mirrored else []
+        plan.add(name, *ops, ReplicateOp(nx=1, dx=STEP * (i + 1)))
+    templates = {name: models(name) for name in ("T1", "T2")}
+    r = PlanEngine.assemble(plan, templates, nodes=base["nodes"], beam_layouts=base["beam_layouts"],
+                            column_layouts=base["column_layouts"], beam_loads=base["beam_loads"], policy="skip")
+    return r.nodes, r.beam_layouts, r.column_layouts, r.beam_loads
+
+def xyz(n):
+    return (round(n.x, 6), round(n.y, 6), round(n.z, 6))
+
+def beam_rows(layouts):
+    return [[(b.index, b.start.index, b.end.index, b.elset.index, b.group) for b in lay.items]
+            for lay in layouts.layouts]
+
+def load_rows(loads):
+    return [(l.index, l.load_case, l.floor, l.beam_id, l.load.index) for l in loads.objects]
+
+def test_plan_matches_legacy_nodes_beams_and_loads(models):
+    l_nodes, l_beams, _, l_loads = legacy(models)
+    p_nodes, p_beams, _, p_loads = planned(models)
+
+    assert [(n.index, xyz(n)) for n in p_nodes] == [(n.index, xyz(n)) for n in l_nodes]
+    assert beam_rows(p_beams) == beam_rows(l_beams)
+    assert load_rows(p_loads) == load_rows(l_loads)
+    assert len(p_nodes.objects) == 44 and len(p_loads.objects) == 80
+
+def test_plan_columns_differ_from_legacy_only_by_readded_template_columns(models):
+    """
+    The one known difference. With include_original=True the legacy
+    ColumnLayoutsEngine.replicate returns target + template + copies: every
+    unit re-adds the template's own columns at their untranslated position
+    (on an existing node when one is there, otherwise on a template node
+    that is not part of the model). PlanEngine appends only the translated
+    copies and drops coinciding ones, so its columns are the legacy columns
+    that sit on model nodes, first occurrence of each node kept.
+    """
+    l_nodes, _, l_columns, _ = legacy(models)
+    p_nodes, _, p_columns, _ = planned(models)
+    template_columns = {name: len(models(name)["column_layouts"].layouts[0].items) for name in ("T1", "T2")}
+    on_model = {id(n) for n in l_nodes}
+
+    for l_lay, p_lay in zip(l_columns.layouts, p_columns.layouts):
+        p_locations = [xyz(c.location) for c in p_lay.items]
+        assert [c.index for c in p_lay.items] == list(range(1, len(p_lay.items) + 1))
+        assert all(c.location is p_nodes.get(c.location.index) for c in p_lay.items)
+        assert len(set(p_locations)) == len(p_locations)
+
+        # legacy = plan + one extra copy of the template columns per unit
+        assert len(l_lay.items) == len(p_lay.items) + sum(template_columns[name] for name, _ in UNITS)
+
+        seen, kept = set(), []
+        for c in l_lay.items:
+            if id(c.location) in on_model and xyz(c.location) not in seen:
+                seen.add(xyz(c.location))
+                kept.append(xyz(c.location))
+        assert kept == p_locations
@@ -0,0 +1,103 @@
+import numpy as np
+
+from SANSPRO.object.node import Node
+from SANSPRO.object.beam import Beam
+from SANSPRO.object.point_load import PointLoad
+from SANSPRO.collection.nodes import Nodes
+from SANSPRO.collection.point_loads import PointLoads
+from SANSPRO.layout.beam_layout import BeamLayout, BeamLayouts
+from SANSPRO.layout.renumber import NodeRenumberEngine
+
+def grid(nx=8, ny=6, seed=3):
+    """nx x ny beam grid listed in a random order (large bandwidth)."""
+    order = np.random.default_rng(seed).permutation(nx * ny)
+    nodes = Nodes([Node(index=i + 1, x=float(k % nx), y=float(k // nx), z=0.0)
+                   for i, k in enumerate(order.tolist())])
+    at = {(n.x, n.y): n for n in nodes}
+
+    beams = []
+    for (x, y), n in at.items():
+        for other in (at.get((x + 1, y)), at.get((x, y + 1))):
+            if other is not None:
+                beams.append(Beam(index=len(beams) + 1, start=n, end=other,
+                                  elset=None, group=1, beam_type=0, misc=""))
+    return nodes, BeamLayouts([BeamLayout(index=1, items=beams)])
+
+def bandwidth(beams):
+    return max(abs(b.start.index - b.end.index) for b in beams.walk_items())
+
+def test_rcm_reduces_bandwidth():
+    nodes, beams = grid()
+    before = bandwidth(beams)
+
+    renumbered, report = NodeRenumberEngine.apply(nodes, beam_layouts=beams)
+
+    assert report.applied
+    assert report.bandwidth_before == before
+    assert report.bandwidth_after == bandwidth(beams)
+    # a banded 8 x 6 grid has bandwidth min(nx, ny) = 6
+    assert bandwidth(beams) <= 7 < before
+    assert report.profile_after < report.profile_before
+    assert [n.index for n in renumbered] == list(range(1, len(renumbered.objects) + 1))
+
+def test_rcm_keeps_geometry_and_loads():
+    nodes, beams = grid()
+    ends = sorted(((b.start.x, b.start.y), (b.end.x, b.end.y)) for b in beams.walk_items())
+    target = nodes.objects[5]
+    loads = PointLoads([PointLoad(index=1, load_case=0, floor=0, node_id=target.index,
+                                  fx=0, fy=0, fz=-1, mx=0, my=0, mz=0)])
+
+    renumbered, _ = NodeRenumberEngine.apply(nodes, beam_layouts=beams, point_loads=loads)
+
+    assert sorted(((b.start.x, b.start.y), (b.end.x, b.end.y)) for b in beams.walk_items()) == ends
+    assert renumbered.get(loads.objects[0].node_id) is target
+
+def test_rcm_not_applied_when_no_gain():
+    nodes = Nodes([Node(index=i + 1, x=float(i), y=0.0, z=0.0) for i in range(5)])
+    beams = BeamLayouts([BeamLayout(index=1, items=[
+        Beam(index=i + 1, start=nodes.objects[i], end=nodes.objects[i + 1],
+             elset=None, group=1, beam_type=0, misc="")
+        for i in range(4)
+    ])])
+
+    result, report = NodeRenumberEngine.apply(nodes, beam_layouts=beams)
+
+    assert not report.applied
+    assert result is nodes
+    assert report.bandwidth_before == report.bandwidth_after == 1
+
+def line(order):
+    """Five nodes on a line joined in sequence, listed in `order`."""
+    nodes = Nodes([Node(index=i + 1, x=float(i), y=0.0, z=0.0) for i in range(5)])
+    beams = BeamLayouts([BeamLayout(index=1, items=[
+        Beam(index=i + 1, start=nodes.objects[i], end=nodes.objects[i + 1],
+             elset=None, group=1, beam_type=0, misc="")
+        for i in range(4)
+    ])])
+    return Nodes([nodes.objects[i] for i in order]), beams
+
+def test_before_uses_node_index_not_position():
+    # numbered along the line but listed out of order: already optimal
+    nodes, beams = line([3, 0, 4, 1, 2])
+    result, report = NodeRenumberEngine.apply(nodes, beam_layouts=beams)
+    assert not report.applied
+    assert report.bandwidth_before == report.bandwidth_after == 1
+    assert [n.index for n in result] == [4, 1, 5, 2, 3]
+
+    # listed along the line but numbered out of order
+    nodes, beams = line(range(5))
+    for n, k in zip(nodes.objects, [4, 1, 5, 2, 3]):
+        n.index = k
+    nodes.rebuild()
+    result, report = NodeRenumberEngine.apply(nodes, beam_layouts=beams)
+    assert report.applied
+    assert report.bandwidth_before == 4 and report.bandwidth_after == bandwidth(beams) == 1
+
+def test_input_nodes_are_reindexed():
+    nodes, beams = grid()
+    result, report = NodeRenumberEngine.apply(nodes, beam_layouts=beams)
+
+    assert report.applied and result is nodes
+    assert [n.index for n in nodes] == list(range(1, len(nodes.objects) + 1))
+    assert all(nodes.get(n.index) is n for n in nodes)
+    assert nodes.indices().tolist() == [n.index for n in nodes]
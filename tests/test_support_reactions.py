@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from SANSPRO.output._combination import CombinationEngine
+from SANSPRO.output._support_reactions import SupportReaction, SupportReactions, SupportReactionsEngine
+
+COMPONENTS = ("fx", "fy", "fz", "mx", "my", "mz")
+
+def per_combination_reference(combo_factored, support_reactions_dict):
+    """The original loop: one lstsq per node and component."""
+    case_ids = list(range(len(next(iter(combo_factored.values())))))
+    combo_ids = sorted(combo_factored)
+    out = []
+    for reaction in support_reactions_dict[combo_ids[0]].reactions:
+        node_id = reaction.node_id
+        data = {}
+        for comp in COMPONENTS:
+            A = np.array([combo_factored[c] for c in combo_ids])
+            b = np.array([getattr(next(r for r in support_reactions_dict[c].reactions if r.node_id == node_id), comp)
+                          for c in combo_ids])
+            for case, value in zip(case_ids, np.linalg.lstsq(A, b, rcond=None)[0]):
+                data.setdefault(case, {})[comp] = value
+        for case, values in data.items():
+            if all(abs(values[c]) < 1e-8 for c in COMPONENTS):
+                continue
+            out.append((node_id, case, *(-values[c] for c in COMPONENTS)))
+    return out
+
+def sample(n_combos=7, n_cases=4, n_nodes=12, seed=2):
+    rng = np.random.default_rng(seed)
+    factors = np.round(rng.uniform(0, 1.6, size=(n_combos, n_cases)), 1)
+    factors[:, 3] = factors[:, 2]                      # cases 2 and 3 always together: rank deficient
+    cases = rng.normal(0, 50, size=(n_cases, n_nodes, 6))
+    cases[:, 4] = 0.0                                  # a node without reactions
+    cases[1, 7] = 0.0                                  # one case with no load on node 8
+    combined = np.einsum("cn,nje->cje", factors, cases)
+
+    combo_ids = [10 * (c + 1) for c in range(n_combos)]
+    node_ids = [100 + 3 * j for j in range(n_nodes)]
+    combo_factored = {c: factors[i].tolist() for i, c in enumerate(combo_ids)}
+    reactions = {
+        c: SupportReactions([SupportReaction(node_ids[j], *combined[i, j].tolist())
+                             for j in rng.permutation(n_nodes).tolist()])
+        for i, c in enumerate(combo_ids)
+    }
+    # the first combination fixes the node order
+    reactions[combo_ids[0]].reactions.sort(key=lambda r: r.node_id)
+    return combo_factored, reactions
+
+def rows(point_loads):
+    return [(pl.node_id, pl.load_case, pl.fx, pl.fy, pl.fz, pl.mx, pl.my, pl.mz) for pl in point_loads.objects]
+
+def test_point_loads_match_per_combination_loop():
+    combo_factored, reactions = sample()
+    expected = per_combination_reference(combo_factored, reactions)
+    # node 112 has no reactions at all, node 121 none for case 1
+    assert all(r[0] != 112 for r in expected)
+    assert (121, 1) not in [r[:2] for r in expected]
+
+    for source in (combo_factored, CombinationEngine.from_dict(combo_factored)):
+        point_loads = SupportReactionsEngine.convert_to_point_loads(source, reactions, floor=2)
+        got = rows(point_loads)
+
+        assert [r[:2] for r in got] == [r[:2] for r in expected]
+        np.testing.assert_allclose([r[2:] for r in got], [r[2:] for r in expected], rtol=1e-9, atol=1e-9)
+        assert [pl.index for pl in point_loads.objects] == list(range(1, len(got) + 1))
+        assert {(pl.floor, pl.misc, pl.blast) for pl in point_loads.objects} == {(2, 1, 0)}
+
+def test_missing_reaction_names_the_node():
+    combo_factored, reactions = sample()
+    reactions[30].reactions = [r for r in reactions[30].reactions if r.node_id != 109]
+
+    with pytest.raises(ValueError, match="109"):
+        SupportReactionsEngine.convert_to_point_loads(combo_factored, reactions)
@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+
+from SANSPRO.object.node import Node
+from SANSPRO.object.beam import Beam
+from SANSPRO.object.column import Column
+from SANSPRO.object.offset import Offset
+from SANSPRO.object.slab import Region
+from SANSPRO.object.beam_load import BeamLoad, FrameLoadTable
+from SANSPRO.collection.nodes import Nodes
+from SANSPRO.collection.offsets import Offsets
+from SANSPRO.collection.beam_loads import BeamLoads
+from SANSPRO.layout.beam_layout import BeamLayout, BeamLayouts
+from SANSPRO.layout.column_layout import ColumnLayout, ColumnLayouts
+from SANSPRO.layout.regions import Regions
+from SANSPRO.layout.transform import TransformEngine
+from SANSPRO.util.geometry import compose, mirror_matrix, rotation_matrix, translation_matrix
+
+LOAD = FrameLoadTable(index=1, load_type=4, q=1.0, s1=0.0, s2=0.0, misc=(0, 0), note="DL")
+
+def square():
+    """Unit square on floor 1: beams 1-2, 2-3, 3-4, 4-1, columns at 1 and 3."""
+    nodes = Nodes([Node(index=i + 1, x=x, y=y, z=0.0) for i, (x, y) in enumerate([(0, 0), (1, 0), (1, 1), (0, 1)])])
+    n = nodes.get
+    beams = BeamLayouts([BeamLayout(index=1, items=[
+        Beam(index=i + 1, start=n(a), end=n(b), elset=None, group=1, beam_type=0, misc="")
+        for i, (a, b) in enumerate([(1, 2), (2, 3), (3, 4), (4, 1)])
+    ])])
+    columns = ColumnLayouts([ColumnLayout(index=1, items=[
+        Column(index=i + 1, location=n(k), elset=None, group=1, alpha=0, misc="") for i, k in enumerate((1, 3))
+    ])])
+    regions = Regions([Region(index=1, floor=1, slab=None, option=None, qDL_add=0.0, qLL_add=0.0,
+                              edges=(n(1), n(2), n(3), n(4)), offset=0, misc="")])
+    offsets = Offsets([Offset(index=1, floor=1, node=n(2), x=0.1, y=0.0, z=0.0)])
+    return nodes, beams, columns, regions, offsets
+
+def loads(*pairs):
+    return BeamLoads([BeamLoad(index=i + 1, load_case=case, floor=1, beam_id=beam, load=LOAD)
+                      for i, (beam, case) in enumerate(pairs)])
+
+def xyz(n):
+    return (round(n.x, 9), round(n.y, 9), round(n.z, 9))
+
+def ends(layouts):
+    return [(xyz(b.start), xyz(b.end)) for b in layouts.walk_items()]
+
+def test_rotation_and_translation_copy():
+    nodes, beams, columns, regions, offsets = square()
+    matrix = compose(rotation_matrix(90), translation_matrix(10.0, 0.0))
+
+    r = TransformEngine.apply(matrix, nodes=nodes, beam_layouts=beams, column_layouts=columns,
+                              regions=regions, offsets=offsets)
+
+    assert [(n.index, *xyz(n)) for n in r.nodes] == [
+        (1, 10.0, 0.0, 0.0), (2, 10.0, 1.0, 0.0), (3, 9.0, 1.0, 0.0), (4, 9.0, 0.0, 0.0)]
+    assert all(r.node_map[id(s)] is t for s, t in zip(nodes.objects, r.nodes.objects))
+
+    members = {id(n) for n in r.nodes}
+    assert ends(r.beam_layouts) == [((10, 0, 0), (10, 1, 0)), ((10, 1, 0), (9, 1, 0)),
+                                    ((9, 1, 0), (9, 0, 0)), ((9, 0, 0), (10, 0, 0))]
+    assert all(id(b.start) in members and id(b.end) in members for b in r.beam_layouts.walk_items())
+    assert [xyz(c.location) for c in r.column_layouts.walk_items()] == [(10, 0, 0), (9, 1, 0)]
+
+    # canonical corners: bottom-left, bottom-right, top-right, top-left
+    assert [xyz(e) for e in r.regions.objects[0].edges] == [(9, 0, 0), (10, 0, 0), (10, 1, 0), (9, 1, 0)]
+
+    # offsets are vectors: rotated, not translated
+    o = r.offsets.objects[0]
+    assert o.node is r.node_map[id(nodes.get(2))]
+    assert (round(o.x, 12), round(o.y, 12), o.z) == (0.0, 0.1, 0.0)
+
+    # nothing of the input was renumbered
+    assert [n.index for n in nodes] == [1, 2, 3, 4]
+    assert [b.index for b in beams.walk_items()] == [1, 2, 3, 4]
+
+def test_translation_with_originals_reuses_coinciding_items():
+    nodes, beams, columns, regions, offsets = square()
+    r = TransformEngine.apply(translation_matrix(1.0), nodes=nodes, beam_layouts=beams, column_layouts=columns,
+                              regions=regions, offsets=offsets, include_original=True)
+
+    # copies of 1 and 4 land on 2 and 3
+    assert [(n.index, *xyz(n)) for n in r.nodes] == [
+        (1, 0, 0, 0), (2, 1, 0, 0), (3, 1, 1, 0), (4, 0, 1, 0), (5, 2, 0, 0), (6, 2, 1, 0)]
+    assert r.nodes.objects[:4] == nodes.objects
+    assert r.node_map[id(nodes.get(1))] is nodes.get(2)
+
+    # the copy of 4-1 is 3-2, the original 2-3
+    assert [b.index for b in r.beam_layouts.walk_items()] == list(range(1, 8))
+    assert ends(r.beam_layouts)[4:] == [((1, 0, 0), (2, 0, 0)), ((2, 0, 0), (2, 1, 0)), ((2, 1, 0), (1, 1, 0))]
+    assert [xyz(c.location) for c in r.column_layouts.walk_items()] == [(0, 0, 0), (1, 1, 0), (1, 0, 0), (2, 1, 0)]
+    assert [[xyz(e) for e in reg.edges] for reg in r.regions.objects][1] == [(1, 0, 0), (2, 0, 0), (2, 1, 0), (1, 1, 0)]
+    assert [(xyz(o.node), o.x) for o in r.offsets.objects] == [((1, 0, 0), 0.1), ((2, 0, 0), 0.1)]
+
+def test_symmetric_mirror_adds_nothing():
+    nodes, beams, columns, regions, offsets = square()
+    r = TransformEngine.apply(mirror_matrix(0.5, 0.0, 0.5, 1.0), nodes=nodes, beam_layouts=beams,
+                              column_layouts=columns, regions=regions, offsets=offsets, include_original=True)
+
+    assert r.nodes.objects == nodes.objects
+    assert len(list(r.beam_layouts.walk_items())) == 4
+    assert len(r.regions.objects) == 1
+    # the column at 1 lands on 2, the one at 3 on 4: both new
+    assert [c.location.index for c in r.column_layouts.walk_items()] == [1, 3, 2, 4]
+    assert [(o.node.index, o.x) for o in r.offsets.objects] == [(2, 0.1), (1, -0.1)]
+
+@pytest.mark.parametrize("policy, expected", [
+    ("skip", [(1, 1), (2, 1), (9, 1), (4, 1)]),
+    ("add", [(1, 1), (2, 1), (9, 1), (1, 1), (4, 1)]),
+    ("replace", [(2, 1), (9, 1), (1, 1), (4, 1)]),
+])
+def test_beam_load_policies(policy, expected, capsys):
+    # the mirror maps beam 1 onto itself and beam 2 onto beam 4;
+    # the load on beam 9 has no beam
+    nodes, beams, *_ = square()
+    r = TransformEngine.apply(mirror_matrix(0.5, 0.0, 0.5, 1.0), nodes=nodes, beam_layouts=beams,
+                              beam_loads=loads((1, 1), (2, 1), (9, 1)), include_original=True, policy=policy)
+
+    assert [(l.beam_id, l.load_case) for l in r.beam_loads.objects] == expected
+    assert [l.index for l in r.beam_loads.objects] == list(range(1, len(expected) + 1))
+    assert "[transform][WARN]" in capsys.readouterr().out
+
+def test_beam_loads_follow_new_beams():
+    nodes, beams, *_ = square()
+    r = TransformEngine.apply(translation_matrix(1.0), nodes=nodes, beam_layouts=beams,
+                              beam_loads=loads((1, 1), (4, 2)))
+    assert [(l.beam_id, l.load_case) for l in r.beam_loads.objects] == [(1, 1), (4, 2)]
+
+    r = TransformEngine.apply(translation_matrix(1.0), nodes=nodes, beam_layouts=beams,
+                              beam_loads=loads((1, 1), (4, 2)), include_original=True)
+    # the copy of beam 4 is beam 2
+    assert [(l.beam_id, l.load_case) for l in r.beam_loads.objects] == [(1, 1), (4, 2), (5, 1), (2, 2)]
+
+def test_beam_loads_need_beam_layouts():
+    nodes, *_ = square()
+    with pytest.raises(ValueError):
+        TransformEngine.apply(np.eye(4), nodes=nodes, beam_loads=loads((1, 1)))
@@ -2,6 +2,7 @@ import os
 from dataclasses import is_dataclass, asdict
 from enum import Enum
 from typing import List, Tuple
+import numpy as np
 from openpyxl import Workbook
 
 
@@ -93,6 +94,52 @@ def export_multiple_collections_to_excel(
     wb.save(filepath)
     print(f"✅ Exported {len(collections)} collections → {filepath}")
 
+def export_envelopes_to_excel(
+    envelopes: List[Tuple[str, object]],
+    folder_path: str,
+    excel_name: str,
+    chunk: int = 10000,
+):
+    """
+    One sheet per (sheet_name, Envelope): entity keys, then max / min /
+    abs_max with the governing combination for every component.
+    Rows are streamed through a write-only workbook, so memory stays flat
+    for large envelopes.
+    """
+    if not envelopes:
+        raise ValueError("No envelopes provided")
+
+    os.makedirs(folder_path, exist_ok=True)
+    filepath = os.path.join(folder_path, f"{excel_name}.xlsx")
+
+    wb = Workbook(write_only=True)
+
+    for sheet_name, env in envelopes:
+        ws = wb.create_sheet(title=sheet_name)
+
+        headers = list(env.table.keys)
+        for comp in env.table.components:
+            for kind in env.KINDS:
+                headers += [f"{comp}.{kind}", f"{comp}.{kind}_combo"]
+        ws.append(headers)
+
+        # (E, K, kinds, 2) -> one flat row per entity, in header order
+        for start in range(0, len(env), chunk):
+            stop = start + chunk
+            parts = []
+            for kind in env.KINDS:
+                value = getattr(env, kind)[start:stop].astype(object)
+                combo = getattr(env, f"{kind}_combo")[start:stop].astype(object)
+                value[value != value] = ""  # NaN: no result in any combination
+                parts.append(np.stack([value, combo], axis=-1))
+            block = np.stack(parts, axis=2).reshape(len(parts[0]), -1)
+            keys = env.ids[start:stop].reshape(len(block), -1).tolist()
+            for key, row in zip(keys, block.tolist()):
+                ws.append(key + row)
+
+    wb.save(filepath)
+    print(f"✅ Exported {len(envelopes)} envelopes → {filepath}")
+
 def strip_prefix_dict_keys(data: dict, prefix: str) -> dict:
     """Return a new dict with prefix removed from keys (if present)."""
     plen = len(prefix)
@@ -1,5 +1,9 @@
 
-from typing import Tuple
+import math
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
 from SANSPRO.object.node import Node
 
 
@@ -33,3 +37,102 @@ def canonicalize_edges(nodes: Tuple[Node, Node, Node, Node]):
     keys = [node_key(n) for n in nodes]
     start = min(range(4), key=lambda i: keys[i])
     return tuple(nodes[(start + k) % 4] for k in range(4))
+
+
+# ------------------------------------------------------------
+# Affine transforms (4x4, column vectors: p' = M @ [x, y, z, 1])
+# ------------------------------------------------------------
+def as_affine(matrix) -> np.ndarray:
+    """Promote a 3x3 linear matrix to 4x4; 4x4 is returned as float copy."""
+    m = np.asarray(matrix, dtype=np.float64)
+    if m.shape == (4, 4):
+        return m.copy()
+    if m.shape == (3, 3):
+        out = np.eye(4)
+        out[:3, :3] = m
+        return out
+    raise ValueError(f"Expected a 3x3 or 4x4 matrix, got {m.shape}")
+
+
+def translation_matrix(dx: float = 0.0, dy: float = 0.0, dz: float = 0.0) -> np.ndarray:
+    m = np.eye(4)
+    m[:3, 3] = (dx, dy, dz)
+    return m
+
+
+def scaling_matrix(sx: float, sy: Optional[float] = None, sz: Optional[float] = None,
+                   origin: Tuple[float, float, float] = (0.0, 0.0, 0.0)) -> np.ndarray:
+    sy = sx if sy is None else sy
+    sz = sx if sz is None else sz
+    ox, oy, oz = origin
+    return compose(translation_matrix(-ox, -oy, -oz),
+                   as_affine(np.diag((sx, sy, sz))),
+                   translation_matrix(ox, oy, oz))
+
+
+def rotation_matrix(angle_deg: float, cx: float = 0.0, cy: float = 0.0) -> np.ndarray:
+    """Counter-clockwise rotation in plan about the vertical axis through (cx, cy)."""
+    t = math.radians(angle_deg)
+    # round off cos/sin noise so quarter turns stay exact
+    c, s = round(math.cos(t), 15), round(math.sin(t), 15)
+    rot = as_affine([[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]])
+    return compose(translation_matrix(-cx, -cy), rot, translation_matrix(cx, cy))
+
+
+def mirror_matrix(x1: float, y1: float, x2: float, y2: float) -> np.ndarray:
+    """Reflection in plan across the line (x1, y1) → (x2, y2); z is kept."""
+    dx = x2 - x1
+    dy = y2 - y1
+    L = math.hypot(dx, dy)
+    if L < 1e-12:
+        raise ValueError("Mirror line cannot be a single point.")
+
+    ux = dx / L
+    uy = dy / L
+    ref = as_affine([
+        [ux * ux - uy * uy, 2 * ux * uy,       0.0],
+        [2 * ux * uy,       uy * uy - ux * ux, 0.0],
+        [0.0,               0.0,               1.0],
+    ])
+    return compose(translation_matrix(-x1, -y1), ref, translation_matrix(x1, y1))
+
+
+def compose(*matrices) -> np.ndarray:
+    """Single matrix applying `matrices` in the order given (first one first)."""
+    out = np.eye(4)
+    for m in matrices:
+        out = as_affine(m) @ out
+    return out
+
+
+def transform_points(matrix, xyz: np.ndarray) -> np.ndarray:
+    m = as_affine(matrix)
+    xyz = np.asarray(xyz, dtype=np.float64).reshape(-1, 3)
+    return xyz @ m[:3, :3].T + m[:3, 3]
+
+
+def point_transformer(matrix) -> Callable[[float, float, float], Tuple[float, float, float]]:
+    """Scalar (x, y, z) → (x', y', z') for one matrix."""
+    m = as_affine(matrix).tolist()
+    (a, b, c, d), (e, f, g, h), (i, j, k, l) = m[0], m[1], m[2]
+
+    def apply(x: float, y: float, z: float) -> Tuple[float, float, float]:
+        return (a * x + b * y + c * z + d,
+                e * x + f * y + g * z + h,
+                i * x + j * y + k * z + l)
+
+    return apply
+
+
+def grid_offsets(nx: int = 0, ny: int = 0, nz: int = 0,
+                 dx: float = 0.0, dy: float = 0.0, dz: float = 0.0) -> np.ndarray:
+    """
+    (K, 3) replicate offsets (ix*dx, iy*dy, iz*dz) in loop order
+    ix → iy → iz, without the original position (0, 0, 0).
+    """
+    return np.stack(np.meshgrid(
+        np.arange(nx + 1) * dx,
+        np.arange(ny + 1) * dy,
+        np.arange(nz + 1) * dz,
+        indexing="ij",
+    ), axis=-1).reshape(-1, 3)[1:]